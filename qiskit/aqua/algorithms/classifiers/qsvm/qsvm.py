@@ -16,6 +16,7 @@ from typing import Dict, Optional, Union
 import warnings
 import logging
 import sys
+from collections import ChainMap
 
 import numpy as np
 from qiskit import ClassicalRegister, QuantumCircuit, QuantumRegister
@@ -151,6 +152,9 @@ class QSVM(QuantumAlgorithm):
 
         self.instance = qsvm_instance
 
+        # statevectors of the training data points, see construct_kernel_matrix
+        self._statevector_cache = {}  # type: Dict[bytes, np.ndarray]
+
     @staticmethod
     def _construct_circuit(x, feature_map, measurement, is_statevector_sim=False):
         """If `is_statevector_sim` is True, we only build the circuits for Psi(x1)|0> rather than
@@ -199,6 +203,64 @@ class QSVM(QuantumAlgorithm):
             kernel_value = result.get(measurement_basis, 0) / sum(result.values())
         return kernel_value
 
+    @staticmethod
+    def _compute_statevectors(quantum_instance, feature_map, data, use_parameterized_circuits,
+                              statevector_cache=None):
+        """Simulates Psi(x)|0> for each row x of data and returns the statevectors as the rows
+        of a matrix. Statevectors found in statevector_cache, keyed by the bytes of x, are not
+        simulated again, and the new ones are added to it.
+        """
+        if statevector_cache is None:
+            statevector_cache = {}
+        keys = [x.tobytes() for x in data]
+        to_be_computed_data = []
+        to_be_computed_keys = set()
+        for key, x in zip(keys, data):
+            if key not in statevector_cache and key not in to_be_computed_keys:
+                to_be_computed_keys.add(key)
+                to_be_computed_data.append(x)
+
+        if to_be_computed_data:
+            if use_parameterized_circuits:
+                # build parameterized circuits, it could be slower for building circuit
+                # but overall it should be faster since it only transpile one circuit
+                feature_map_params = ParameterVector('x', feature_map.feature_dimension)
+                parameterized_circuit = QSVM._construct_circuit(
+                    (feature_map_params, feature_map_params), feature_map, False,
+                    is_statevector_sim=True)
+                parameterized_circuit = quantum_instance.transpile(parameterized_circuit)[0]
+                circuits = [parameterized_circuit.assign_parameters({feature_map_params: x})
+                            for x in to_be_computed_data]
+            else:
+                #  the second x is redundant
+                to_be_computed_data_pair = [(x, x) for x in to_be_computed_data]
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Building circuits:")
+                    TextProgressBar(sys.stderr)
+                circuits = parallel_map(QSVM._construct_circuit,
+                                        to_be_computed_data_pair,
+                                        task_args=(feature_map, False, True),
+                                        num_processes=aqua_globals.num_processes)
+
+            results = quantum_instance.execute(circuits,
+                                               had_transpiled=use_parameterized_circuits)
+            for i, x in enumerate(to_be_computed_data):
+                statevector_cache[x.tobytes()] = np.asarray(results.get_statevector(i))
+
+        return np.asarray([statevector_cache[key] for key in keys])
+
+    @staticmethod
+    def _compute_gram_matrix(states_x1, states_x2):
+        """Returns |<Psi(x2)|Psi(x1)>|^2 for all rows of states_x1 and states_x2, computed as
+        matrix products over blocks of BATCH_SIZE rows of states_x1 to bound the memory.
+        """
+        mat = np.empty((states_x1.shape[0], states_x2.shape[0]))
+        states_x2_dag = states_x2.conj().T
+        for idx in range(0, states_x1.shape[0], QSVM.BATCH_SIZE):
+            overlaps = states_x1[idx:idx + QSVM.BATCH_SIZE] @ states_x2_dag
+            mat[idx:idx + QSVM.BATCH_SIZE] = overlaps.real ** 2 + overlaps.imag ** 2
+        return mat
+
     def construct_circuit(self, x1, x2, measurement=False):
         """
         Generate inner product of x1 and x2 with the given feature map.
@@ -215,7 +277,8 @@ class QSVM(QuantumAlgorithm):
         return QSVM._construct_circuit((x1, x2), self.feature_map, measurement)
 
     @staticmethod
-    def get_kernel_matrix(quantum_instance, feature_map, x1_vec, x2_vec=None, enforce_psd=True):
+    def get_kernel_matrix(quantum_instance, feature_map, x1_vec, x2_vec=None, enforce_psd=True,
+                          statevector_cache=None):
         """
         Construct kernel matrix, if x2_vec is None, self-innerproduct is conducted.
 
@@ -225,7 +288,8 @@ class QSVM(QuantumAlgorithm):
             Psi(x2)^dagger Psi(x1)|0>, and then we perform the inner product classically.
             That is, for `statevector_simulator`,
             the total number of circuits will be O(N) rather than
-            O(N^2) for `qasm_simulator`.
+            O(N^2) for `qasm_simulator`. The statevectors are stacked into matrices and
+            the kernel matrix is computed from their matrix product.
 
         Args:
             quantum_instance (QuantumInstance): quantum backend with all settings
@@ -237,6 +301,9 @@ class QSVM(QuantumAlgorithm):
             enforce_psd (bool): enforces that the kernel matrix is positive semi-definite by setting
                                 negative eigenvalues to zero. This is only applied in the symmetric
                                 case, i.e., if `x2_vec == None`.
+            statevector_cache (dict): for `statevector_simulator`, statevectors keyed by the
+                                      bytes of their data point, which are reused rather than
+                                      simulated again. Newly simulated statevectors are added.
         Returns:
             numpy.ndarray: 2-D matrix, N1xN2
         """
@@ -258,59 +325,31 @@ class QSVM(QuantumAlgorithm):
         measurement_basis = '0' * feature_map.num_qubits
         mat = np.ones((x1_vec.shape[0], x2_vec.shape[0]))
 
-        # get all indices
-        if is_symmetric:
-            mus, nus = np.triu_indices(x1_vec.shape[0], k=1)  # remove diagonal term
-        else:
-            mus, nus = np.indices((x1_vec.shape[0], x2_vec.shape[0]))
-            mus = np.asarray(mus.flat)
-            nus = np.asarray(nus.flat)
-
         if is_statevector_sim:
+            states_x1 = QSVM._compute_statevectors(quantum_instance, feature_map, x1_vec,
+                                                   use_parameterized_circuits, statevector_cache)
             if is_symmetric:
-                to_be_computed_data = x1_vec
+                states_x2 = states_x1
             else:
-                to_be_computed_data = np.concatenate((x1_vec, x2_vec))
-
-            if use_parameterized_circuits:
-                # build parameterized circuits, it could be slower for building circuit
-                # but overall it should be faster since it only transpile one circuit
-                feature_map_params = ParameterVector('x', feature_map.feature_dimension)
-                parameterized_circuit = QSVM._construct_circuit(
-                    (feature_map_params, feature_map_params), feature_map, measurement,
-                    is_statevector_sim=is_statevector_sim)
-                parameterized_circuit = quantum_instance.transpile(parameterized_circuit)[0]
-                circuits = [parameterized_circuit.assign_parameters({feature_map_params: x})
-                            for x in to_be_computed_data]
-            else:
-                #  the second x is redundant
-                to_be_computed_data_pair = [(x, x) for x in to_be_computed_data]
-                if logger.isEnabledFor(logging.DEBUG):
-                    logger.debug("Building circuits:")
-                    TextProgressBar(sys.stderr)
-                circuits = parallel_map(QSVM._construct_circuit,
-                                        to_be_computed_data_pair,
-                                        task_args=(feature_map, measurement, is_statevector_sim),
-                                        num_processes=aqua_globals.num_processes)
-
-            results = quantum_instance.execute(circuits,
-                                               had_transpiled=use_parameterized_circuits)
+                states_x2 = QSVM._compute_statevectors(quantum_instance, feature_map, x2_vec,
+                                                       use_parameterized_circuits,
+                                                       statevector_cache)
 
             if logger.isEnabledFor(logging.DEBUG):
                 logger.debug("Calculating overlap:")
-                TextProgressBar(sys.stderr)
-
-            offset = 0 if is_symmetric else len(x1_vec)
-            matrix_elements = parallel_map(QSVM._compute_overlap, list(zip(mus, nus + offset)),
-                                           task_args=(results,
-                                                      is_statevector_sim, measurement_basis),
-                                           num_processes=aqua_globals.num_processes)
-
-            for i, j, value in zip(mus, nus, matrix_elements):
-                mat[i, j] = value
-                if is_symmetric:
-                    mat[j, i] = mat[i, j]
+
+            mat = QSVM._compute_gram_matrix(states_x1, states_x2)
+            if is_symmetric:
+                np.fill_diagonal(mat, 1.0)
         else:
+            # get all indices
+            if is_symmetric:
+                mus, nus = np.triu_indices(x1_vec.shape[0], k=1)  # remove diagonal term
+            else:
+                mus, nus = np.indices((x1_vec.shape[0], x2_vec.shape[0]))
+                mus = np.asarray(mus.flat)
+                nus = np.asarray(nus.flat)
+
             for idx in range(0, len(mus), QSVM.BATCH_SIZE):
                 to_be_computed_data_pair = []
                 to_be_computed_index = []
@@ -400,7 +439,13 @@ class QSVM(QuantumAlgorithm):
         if self._quantum_instance is None:
             raise AquaError("Either setup quantum instance or provide it in the parameter.")
 
-        return QSVM.get_kernel_matrix(self._quantum_instance, self.feature_map, x1_vec, x2_vec)
+        # the statevectors of the training data, i.e. of the symmetric kernel matrices, are kept
+        # for the kernels with new data, whose statevectors are only reused within the call so
+        # predicting on streaming data does not grow the cache
+        statevector_cache = self._statevector_cache if x2_vec is None \
+            else ChainMap({}, self._statevector_cache)
+        return QSVM.get_kernel_matrix(self._quantum_instance, self.feature_map, x1_vec, x2_vec,
+                                      statevector_cache=statevector_cache)
 
     def train(self, data, labels, quantum_instance=None):
         """
@@ -419,6 +464,7 @@ class QSVM(QuantumAlgorithm):
             if quantum_instance is None else quantum_instance
         if self._quantum_instance is None:
             raise AquaError("Either setup quantum instance or provide it in the parameter.")
+        self._statevector_cache = {}
         self.instance.train(data, labels)
 
     def test(self, data, labels, quantum_instance=None):
@@ -31,6 +31,7 @@ from qiskit.aqua.algorithms import VQAlgorithm
 from qiskit.aqua.components.optimizers import Optimizer
 from qiskit.aqua.components.feature_maps import FeatureMap, RawFeatureVector
 from qiskit.aqua.components.variational_forms import VariationalForm
+from qiskit.aqua.operators import GradientBase, CircuitStateFn
 
 logger = logging.getLogger(__name__)
 
@@ -66,7 +67,8 @@ class VQC(VQAlgorithm):
             minibatch_size: int = -1,
             callback: Optional[Callable[[int, np.ndarray, float, int], None]] = None,
             quantum_instance: Optional[
-                Union[QuantumInstance, BaseBackend, Backend]] = None) -> None:
+                Union[QuantumInstance, BaseBackend, Backend]] = None,
+            gradient: Optional[GradientBase] = None) -> None:
         """
         Args:
             optimizer: The classical optimizer to use.
@@ -83,6 +85,10 @@ class VQC(VQAlgorithm):
                 These are: the evaluation count, parameters of the variational form,
                 the evaluated value, the index of data batch.
             quantum_instance: Quantum Instance or Backend
+            gradient: An optional Gradient converter, such as
+                :class:`~qiskit.aqua.operators.gradients.ParameterShift`. If given, the gradient
+                of the cross entropy loss is computed analytically from the gradients of the
+                sampling probabilities instead of with finite differences.
 
         Note:
             We use `label` to denotes numeric results and `class` the class names (str).
@@ -115,6 +121,8 @@ class VQC(VQAlgorithm):
         self._optimizer.set_max_evals_grouped(max_evals_grouped)
 
         self._callback = callback
+        self._gradient = gradient
+        self._analytic_gradient = None
 
         if feature_map is None:
             raise AquaError('Missing feature map.')
@@ -189,6 +197,30 @@ class VQC(VQAlgorithm):
             qc.measure(qr, cr)
         return qc
 
+    def _construct_gradient_circuit(self):
+        """Construct the parameterized circuit, without measurements, of which the gradients of
+        the sampling probabilities are computed.
+
+        Returns:
+            QuantumCircuit: the circuit
+
+        Raises:
+            AquaError: If the feature map or the variational form do not support parameterized
+                circuits.
+        """
+        qr = QuantumRegister(self._num_qubits, name='q')
+        qc = QuantumCircuit(qr)
+        for circuit, params in ((self._feature_map, self._feature_map_params),
+                                (self._var_form, self._var_form_params)):
+            if isinstance(circuit, QuantumCircuit):
+                qc = qc.compose(circuit)
+            elif circuit.support_parameterized_circuit:
+                qc += circuit.construct_circuit(params, qr)
+            else:
+                raise AquaError('Analytic gradients require the feature map and the variational '
+                                'form to support parameterized circuits.')
+        return qc
+
     def _get_prediction(self, data, theta):
         """Make prediction on data based on each theta.
 
@@ -313,8 +345,15 @@ class VQC(VQAlgorithm):
         self._eval_count = 0
 
         grad_fn = None
-        if minibatch_size > 0 and self.is_gradient_really_supported():  # we need some wrapper
+        if (minibatch_size > 0 or self._gradient is not None) \
+                and self.is_gradient_really_supported():  # we need some wrapper
             grad_fn = self._gradient_function_wrapper
+            if self._gradient is not None:
+                self._analytic_gradient = self._gradient.gradient_wrapper(
+                    CircuitStateFn(self._construct_gradient_circuit()),
+                    bind_params=list(self._feature_map_params) + list(self._var_form_params),
+                    grad_params=list(self._var_form_params),
+                    backend=self._quantum_instance)
 
         result = self.find_minimum(initial_point=self.initial_point,
                                    var_form=self.var_form,
@@ -353,6 +392,11 @@ class VQC(VQAlgorithm):
         Returns:
             numpy.ndarray: 1-d array with the same shape as theta. The  gradient computed
         """
+        if self._analytic_gradient is not None:
+            grad = self._cross_entropy_gradient(np.asarray(theta))
+            self._batch_index += 1  # increment the batch after gradient callback
+            return grad
+
         epsilon = 1e-8
         f_orig = self._cost_function_wrapper(theta)
         grad = np.zeros((len(theta),), float)
@@ -365,6 +409,38 @@ class VQC(VQAlgorithm):
             self._batch_index += 1  # increment the batch after gradient callback
         return grad
 
+    def _cross_entropy_gradient(self, theta):
+        """Compute the gradient of the cross entropy loss of the current batch from the
+        gradients of the sampling probabilities, which are all sampled together.
+
+        Args:
+            theta (numpy.ndarray): 1-d array
+
+        Returns:
+            numpy.ndarray: 1-d array with the same shape as theta. The  gradient computed
+        """
+        batch_index = self._batch_index % len(self._batches)
+        data = self._batches[batch_index]
+        labels = np.asarray(self._label_batches[batch_index], dtype=int)
+        num_data = len(data)
+
+        values = np.hstack([data, np.tile(theta, (num_data, 1))])
+        # N x P x 2^n derivatives of the sampling probabilities
+        prob_grads = np.reshape(self._analytic_gradient(values), (num_data, len(theta), -1))
+
+        # map the measured basis states to the classes
+        num_states = prob_grads.shape[-1]
+        class_map = np.zeros((num_states, self._num_classes))
+        for i in range(num_states):
+            class_map[i, assign_label(format(i, '0{}b'.format(self._num_qubits)),
+                                      self._num_classes)] = 1
+        class_grads = prob_grads @ class_map
+
+        probs, _ = self._get_prediction(data, theta)
+        indices = np.arange(num_data)
+        label_probs = np.clip(probs[indices, labels], 1e-12, 1. - 1e-12)
+        return -np.mean(class_grads[indices, :, labels] / label_probs[:, None], axis=0)
+
     def _cost_function_wrapper(self, theta):
         batch_index = self._batch_index % len(self._batches)
         predicted_probs, _ = self._get_prediction(self._batches[batch_index], theta)
@@ -30,6 +30,7 @@ from qiskit.aqua.components.neural_networks.generative_network import Generative
 from qiskit.aqua.components.neural_networks.quantum_generator import QuantumGenerator
 from qiskit.aqua.components.neural_networks.numpy_discriminator import NumPyDiscriminator
 from qiskit.aqua.components.optimizers import Optimizer
+from qiskit.aqua.operators import GradientBase
 from qiskit.aqua.components.uncertainty_models import UnivariateVariationalDistribution
 from qiskit.aqua.components.uncertainty_models import MultivariateVariationalDistribution
 from qiskit.aqua.utils.dataset_helper import discretize_and_truncate
@@ -197,7 +198,8 @@ class QGAN(QuantumAlgorithm):
                                                               MultivariateVariationalDistribution]
                                                         ] = None,
                       generator_init_params: Optional[np.ndarray] = None,
-                      generator_optimizer: Optional[Optimizer] = None):
+                      generator_optimizer: Optional[Optimizer] = None,
+                      generator_gradient: Optional[GradientBase] = None):
         """Initialize generator.
 
         Args:
@@ -205,10 +207,12 @@ class QGAN(QuantumAlgorithm):
                 the structure of the quantum generator
             generator_init_params: initial parameters for the generator circuit
             generator_optimizer: optimizer to be used for the training of the generator
+            generator_gradient: an optional Gradient converter used to compute the analytic
+                gradient of the generator loss
         """
         self._generator = QuantumGenerator(self._bounds, self._num_qubits,
                                            generator_circuit, generator_init_params,
-                                           self._snapshot_dir)
+                                           self._snapshot_dir, generator_gradient)
 
     @property
     def discriminator(self):
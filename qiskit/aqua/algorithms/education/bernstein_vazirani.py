@@ -23,7 +23,7 @@ from qiskit.providers import BaseBackend
 from qiskit.providers import Backend
 from qiskit.aqua import QuantumInstance
 from qiskit.aqua.algorithms import QuantumAlgorithm
-from qiskit.aqua.utils import get_subsystem_density_matrix
+from qiskit.aqua.utils import get_subsystem_probabilities
 from qiskit.aqua.components.oracles import Oracle
 
 logger = logging.getLogger(__name__)
@@ -106,11 +106,10 @@ class BernsteinVazirani(QuantumAlgorithm):
             qc = self.construct_circuit(measurement=False)
             result = self._quantum_instance.execute(qc)
             complete_state_vec = result.get_statevector(qc)
-            variable_register_density_matrix = get_subsystem_density_matrix(
+            variable_register_density_matrix_diag = get_subsystem_probabilities(
                 complete_state_vec,
                 range(len(self._oracle.variable_register), qc.width())
             )
-            variable_register_density_matrix_diag = np.diag(variable_register_density_matrix)
             max_amplitude = max(
                 variable_register_density_matrix_diag.min(),
                 variable_register_density_matrix_diag.max(),
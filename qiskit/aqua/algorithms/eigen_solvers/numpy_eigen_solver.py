@@ -18,10 +18,12 @@ import pprint
 import warnings
 import numpy as np
 from scipy import sparse as scisparse
+from scipy.sparse.linalg import LinearOperator
 
 from qiskit.aqua import AquaError
 from qiskit.aqua.algorithms import ClassicalAlgorithm
-from qiskit.aqua.operators import OperatorBase, LegacyBaseOperator, I, StateFn, ListOp
+from qiskit.aqua.operators import (OperatorBase, LegacyBaseOperator, I, StateFn, ListOp,
+                                   PauliSumOp)
 from qiskit.aqua.utils.validation import validate_min
 from .eigen_solver import Eigensolver, EigensolverResult
 
@@ -42,6 +44,7 @@ class NumPyEigensolver(ClassicalAlgorithm, Eigensolver):
         Operators are automatically converted to :class:`~qiskit.aqua.operators.MatrixOperator`
         as needed and this conversion can be costly in terms of memory and performance as the
         operator size, mostly in terms of number of qubits it represents, gets larger.
+        Sums of Paulis can instead be solved matrix-free, see ``matrix_free``.
     """
 
     def __init__(self,
@@ -50,7 +53,8 @@ class NumPyEigensolver(ClassicalAlgorithm, Eigensolver):
                  aux_operators: Optional[List[Optional[Union[OperatorBase,
                                                              LegacyBaseOperator]]]] = None,
                  filter_criterion: Callable[[Union[List, np.ndarray], float, Optional[List[float]]],
-                                            bool] = None
+                                            bool] = None,
+                 matrix_free: bool = False
                  ) -> None:
         """
         Args:
@@ -66,6 +70,10 @@ class NumPyEigensolver(ClassicalAlgorithm, Eigensolver):
                 whether to keep this value in the final returned result or not. If the number of
                 elements that satisfies the criterion is smaller than `k` then the returned list has
                 fewer elements and can even be empty.
+            matrix_free: If True, the operator and aux_operators which are sums of Paulis are
+                applied to vectors term by term as a SciPy ``LinearOperator`` rather than
+                converted to sparse matrices, which takes far less memory for many qubits.
+                Other operators are still converted to sparse matrices.
         """
         validate_min('k', k, 1)
         super().__init__()
@@ -79,6 +87,7 @@ class NumPyEigensolver(ClassicalAlgorithm, Eigensolver):
         self.aux_operators = aux_operators
 
         self._filter_criterion = filter_criterion
+        self._matrix_free = matrix_free
 
         self._ret = {}  # type: Dict[str, Any]
 
@@ -143,6 +152,16 @@ class NumPyEigensolver(ClassicalAlgorithm, Eigensolver):
         """ set the filter criterion """
         self._filter_criterion = filter_criterion
 
+    @property
+    def matrix_free(self) -> bool:
+        """ returns whether sums of Paulis are solved matrix-free """
+        return self._matrix_free
+
+    @matrix_free.setter
+    def matrix_free(self, matrix_free: bool) -> None:
+        """ set whether sums of Paulis are solved matrix-free """
+        self._matrix_free = matrix_free
+
     @classmethod
     def supports_aux_operators(cls) -> bool:
         return True
@@ -156,24 +175,57 @@ class NumPyEigensolver(ClassicalAlgorithm, Eigensolver):
             else:
                 self._k = self._in_k
 
+    def _to_matrix(self, operator: OperatorBase
+                   ) -> Tuple[Union[scisparse.spmatrix, LinearOperator], bool]:
+        """ Returns the matrix-free or sparse matrix form of the operator and whether it is
+        Hermitian. """
+        if self._matrix_free:
+            if isinstance(operator, PauliSumOp):
+                pauli_sum = operator
+            else:
+                try:
+                    pauli_sum = PauliSumOp.from_pauli_ops(operator)
+                except TypeError:
+                    pauli_sum = None
+                    logger.debug('Operator is not a sum of Paulis, using a sparse matrix.')
+            if pauli_sum is not None:
+                pauli_sum = pauli_sum.reduce()
+                hermitian = np.allclose(np.imag(pauli_sum.coeffs), 0.0)
+                return pauli_sum.to_linear_operator(), hermitian
+
+        sp_mat = operator.to_spmatrix()
+        if isinstance(sp_mat, scisparse.spmatrix):
+            hermitian = abs(sp_mat - sp_mat.getH()).max() < 1e-10
+        else:
+            hermitian = np.allclose(sp_mat, np.conj(sp_mat).T)
+        return sp_mat, hermitian
+
     def _solve(self) -> None:
+        mat, hermitian = self._to_matrix(self._operator)
+        if isinstance(mat, LinearOperator):
+            is_diagonal = mat.is_diagonal
+        else:
+            is_diagonal = scisparse.csr_matrix(mat.diagonal()).nnz == mat.nnz
 
-        sp_mat = self._operator.to_spmatrix()
         # If matrix is diagonal, the elements on the diagonal are the eigenvalues. Solve by sorting.
-        if scisparse.csr_matrix(sp_mat.diagonal()).nnz == sp_mat.nnz:
-            diag = sp_mat.diagonal()
+        if is_diagonal:
+            diag = mat.diagonal()
             eigval = np.sort(diag)[:self._k]
             temp = np.argsort(diag)[:self._k]
-            eigvec = np.zeros((sp_mat.shape[0], self._k))
+            eigvec = np.zeros((mat.shape[0], self._k))
             for i, idx in enumerate(temp):
                 eigvec[idx, i] = 1.0
         else:
             if self._k >= 2**(self._operator.num_qubits) - 1:
                 logger.debug("SciPy doesn't support to get all eigenvalues, using NumPy instead.")
-                eigval, eigvec = np.linalg.eig(self._operator.to_matrix())
+                if hermitian:
+                    eigval, eigvec = np.linalg.eigh(self._operator.to_matrix())
+                else:
+                    eigval, eigvec = np.linalg.eig(self._operator.to_matrix())
+            elif hermitian:
+                eigval, eigvec = scisparse.linalg.eigsh(mat, k=self._k, which='SA')
             else:
-                eigval, eigvec = scisparse.linalg.eigs(self._operator.to_spmatrix(),
-                                                       k=self._k, which='SR')
+                eigval, eigvec = scisparse.linalg.eigs(mat, k=self._k, which='SR')
         if self._k > 1:
             idx = eigval.argsort()
             eigval = eigval[idx]
@@ -200,24 +252,34 @@ class NumPyEigensolver(ClassicalAlgorithm, Eigensolver):
             energies[i] = self._ret['eigvals'][i].real
         self._ret['energies'] = energies
         if self._aux_operators:
+            aux_matrices = [None if operator is None or operator.coeff == 0
+                            else self._to_matrix(operator)[0]
+                            for operator in self._aux_operators]
             aux_op_vals = []
             for i in range(self._k):
-                aux_op_vals.append(self._eval_aux_operators(self._ret['eigvecs'][i]))
+                aux_op_vals.append(self._eval_aux_operators(self._ret['eigvecs'][i],
+                                                            aux_matrices=aux_matrices))
             self._ret['aux_ops'] = aux_op_vals
 
-    def _eval_aux_operators(self, wavefn, threshold: float = 1e-12) -> np.ndarray:
+    def _eval_aux_operators(self, wavefn, threshold: float = 1e-12,
+                            aux_matrices: Optional[List] = None) -> np.ndarray:
+        if aux_matrices is None:
+            aux_matrices = [None if operator is None or operator.coeff == 0
+                            else self._to_matrix(operator)[0]
+                            for operator in self._aux_operators]
         values = []  # type: List[Tuple[float, int]]
-        for operator in self._aux_operators:
+        for operator, mat in zip(self._aux_operators, aux_matrices):
             if operator is None:
                 values.append(None)
                 continue
             value = 0.0
             if operator.coeff != 0:
-                mat = operator.to_spmatrix()
                 # Terra doesn't support sparse yet, so do the matmul directly if so
                 # This is necessary for the particle_hole and other chemistry tests because the
                 # pauli conversions are 2^12th large and will OOM error if not sparse.
-                if isinstance(mat, scisparse.spmatrix):
+                if isinstance(mat, LinearOperator):
+                    value = np.vdot(wavefn, mat.matvec(wavefn))
+                elif isinstance(mat, scisparse.spmatrix):
                     value = mat.dot(wavefn).dot(np.conj(wavefn))
                 else:
                     value = StateFn(operator, is_measurement=True).eval(wavefn)
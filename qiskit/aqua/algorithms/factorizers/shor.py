@@ -26,7 +26,7 @@ from qiskit.providers import BaseBackend
 from qiskit.providers import Backend
 from qiskit.aqua import QuantumInstance
 from qiskit.aqua.algorithms import AlgorithmResult, QuantumAlgorithm
-from qiskit.aqua.utils import get_subsystem_density_matrix, summarize_circuits
+from qiskit.aqua.utils import get_subsystem_probabilities, summarize_circuits
 from qiskit.aqua.utils.arithmetic import is_power
 from qiskit.aqua.utils.validation import validate_min
 
@@ -383,15 +383,13 @@ class Shor(QuantumAlgorithm):
                                'subsequent computation using too much memory.')
                 result = self._quantum_instance.execute(circuit)
                 complete_state_vec = result.get_statevector(circuit)
-                # TODO: this uses too much memory
-                up_qreg_density_mat = get_subsystem_density_matrix(
+                up_qreg_probabilities = get_subsystem_probabilities(
                     complete_state_vec,
                     range(2 * self._n, 4 * self._n + 2)
                 )
-                up_qreg_density_mat_diag = np.diag(up_qreg_density_mat)
 
                 counts = dict()
-                for i, v in enumerate(up_qreg_density_mat_diag):
+                for i, v in enumerate(up_qreg_probabilities):
                     if not v == 0:
                         counts[bin(int(i))[2:].zfill(2 * self._n)] = v ** 2
             else:
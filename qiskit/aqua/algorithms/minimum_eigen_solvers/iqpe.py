@@ -27,7 +27,7 @@ from qiskit.aqua import QuantumInstance
 from qiskit.aqua.operators import (WeightedPauliOperator, suzuki_expansion_slice_pauli_list,
                                    evolution_instruction)
 from qiskit.aqua.operators.legacy import op_converter
-from qiskit.aqua.utils import get_subsystem_density_matrix
+from qiskit.aqua.utils import get_subsystem_probabilities
 from qiskit.aqua.algorithms import QuantumAlgorithm
 from qiskit.aqua.operators import LegacyBaseOperator, OperatorBase
 from qiskit.aqua.components.initial_states import InitialState
@@ -243,11 +243,10 @@ class IQPE(QuantumAlgorithm, MinimumEigensolver):
                 qc = self.construct_circuit(k, -2 * np.pi * omega_coef, measurement=False)
                 result = self._quantum_instance.execute(qc)
                 complete_state_vec = result.get_statevector(qc)
-                ancilla_density_mat = get_subsystem_density_matrix(
+                ancilla_density_mat_diag = get_subsystem_probabilities(
                     complete_state_vec,
                     range(self._operator.num_qubits)
                 )
-                ancilla_density_mat_diag = np.diag(ancilla_density_mat)
                 max_amplitude = max(ancilla_density_mat_diag.min(),
                                     ancilla_density_mat_diag.max(), key=abs)
                 x = np.where(ancilla_density_mat_diag == max_amplitude)[0][0]
@@ -36,7 +36,8 @@ class NumPyMinimumEigensolver(ClassicalAlgorithm, MinimumEigensolver):
                  aux_operators: Optional[List[Optional[Union[OperatorBase,
                                                              LegacyBaseOperator]]]] = None,
                  filter_criterion: Callable[[Union[List, np.ndarray], float, Optional[List[float]]],
-                                            bool] = None
+                                            bool] = None,
+                 matrix_free: bool = False
                  ) -> None:
         """
         Args:
@@ -48,9 +49,12 @@ class NumPyMinimumEigensolver(ClassicalAlgorithm, MinimumEigensolver):
                 `filter(eigenstate, eigenvalue, aux_values)` and must return a boolean to indicate
                 whether to consider this value or not. If there is no
                 feasible element, the result can even be empty.
+            matrix_free: If True, the operator and aux_operators which are sums of Paulis are
+                applied to vectors term by term as a SciPy ``LinearOperator`` rather than
+                converted to sparse matrices, which takes far less memory for many qubits.
         """
         self._ces = NumPyEigensolver(operator=operator, k=1, aux_operators=aux_operators,
-                                     filter_criterion=filter_criterion)
+                                     filter_criterion=filter_criterion, matrix_free=matrix_free)
         # TODO remove
         self._ret = {}  # type: Dict[str, Any]
 
@@ -84,6 +88,16 @@ class NumPyMinimumEigensolver(ClassicalAlgorithm, MinimumEigensolver):
         """ set the filter criterion """
         self._ces.filter_criterion = filter_criterion
 
+    @property
+    def matrix_free(self) -> bool:
+        """ returns whether sums of Paulis are solved matrix-free """
+        return self._ces.matrix_free
+
+    @matrix_free.setter
+    def matrix_free(self, matrix_free: bool) -> None:
+        """ set whether sums of Paulis are solved matrix-free """
+        self._ces.matrix_free = matrix_free
+
     @classmethod
     def supports_aux_operators(cls) -> bool:
         return NumPyEigensolver.supports_aux_operators()
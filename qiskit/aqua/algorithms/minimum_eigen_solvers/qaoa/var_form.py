@@ -12,12 +12,15 @@
 
 """Global X phases and parameterized problem hamiltonian."""
 
-from typing import Optional
+from typing import Optional, List, Tuple
 
 import numpy as np
 
+from qiskit import QuantumCircuit
+from qiskit.circuit import ParameterVector, ParameterExpression
 from qiskit.aqua.operators import (OperatorBase, X, I, H, Zero, CircuitStateFn,
-                                   EvolutionFactory, LegacyBaseOperator)
+                                   EvolutionFactory, LegacyBaseOperator, PauliOp, PauliSumOp,
+                                   SummedOp)
 from qiskit.aqua.components.variational_forms import VariationalForm
 from qiskit.aqua.components.initial_states import InitialState
 
@@ -59,6 +62,7 @@ class QAOAVarForm(VariationalForm):
         self._preferred_init_points = [0] * p * 2
 
         # prepare the mixer operator
+        self._default_mixer = mixer_operator is None
         if mixer_operator is None:
             # Mixer is just a sum of single qubit X's on each qubit. Evolving by this operator
             # will simply produce rx's on each qubit.
@@ -71,6 +75,11 @@ class QAOAVarForm(VariationalForm):
         else:
             self._mixer_operator = mixer_operator
 
+        # the parameterized circuit is built once, on the first call of construct_circuit,
+        # and then only bound to the given angles
+        self._template = None
+        self._template_params = None
+
         self.support_parameterized_circuit = True
 
     def construct_circuit(self, parameters, q=None):
@@ -80,6 +89,51 @@ class QAOAVarForm(VariationalForm):
                 self.num_parameters, len(parameters)
             ))
 
+        if self._template is None:
+            self._template_params = ParameterVector('t', self.num_parameters)
+            cost_terms = _diagonal_terms(self._cost_operator)
+            if cost_terms is not None:
+                self._template = self._construct_diagonal_circuit(self._template_params,
+                                                                  cost_terms)
+            else:
+                self._template = self._construct_evolved_circuit(self._template_params)
+
+        return self._template.assign_parameters(dict(zip(self._template_params, parameters)))
+
+    def _construct_diagonal_circuit(self, parameters, cost_terms):
+        """ Synthesize the evolution of a cost operator of Z terms directly as RZ, RZZ and
+        CX-ladder rotations, ordered in layers of terms acting on disjoint qubits. """
+        circuit = QuantumCircuit(self._num_qubits)
+        if self._initial_state is not None:
+            circuit.compose(self._initial_state.construct_circuit('circuit'), inplace=True)
+        circuit.h(range(self._num_qubits))
+
+        cost_terms = _order_terms(cost_terms)
+        for idx in range(self._p):
+            for qubits, coeff in cost_terms:
+                angle = 2 * coeff * parameters[idx]
+                if len(qubits) == 1:
+                    circuit.rz(angle, qubits[0])
+                elif len(qubits) == 2:
+                    circuit.rzz(angle, qubits[0], qubits[1])
+                else:
+                    for control, target in zip(qubits[:-1], qubits[1:]):
+                        circuit.cx(control, target)
+                    circuit.rz(angle, qubits[-1])
+                    for control, target in reversed(list(zip(qubits[:-1], qubits[1:]))):
+                        circuit.cx(control, target)
+
+            if self._default_mixer:
+                circuit.rx(2 * parameters[idx + self._p], range(self._num_qubits))
+            else:
+                mixer = (self._mixer_operator * parameters[idx + self._p]).exp_i()
+                mixer = EvolutionFactory.build(self._mixer_operator).convert(mixer)
+                circuit.compose(mixer.to_circuit(), inplace=True)
+
+        return circuit
+
+    def _construct_evolved_circuit(self, parameters):
+        """ Construct the circuit by evolving the cost and mixer operators. """
         circuit = (H ^ self._num_qubits)
         # initialize circuit, possibly based on given register/initial state
         if self._initial_state is not None:
@@ -102,7 +156,50 @@ class QAOAVarForm(VariationalForm):
         ret = "Variational Form: {}\n".format(self.__class__.__name__)
         params = ""
         for key, value in self.__dict__.items():
-            if key[0] == "_":
+            if key[0] == "_" and not key.startswith('_template'):
                 params += "-- {}: {}\n".format(key[1:], value)
         ret += "{}".format(params)
         return ret
+
+
+def _diagonal_terms(operator: OperatorBase) -> Optional[List[Tuple[Tuple[int, ...], float]]]:
+    """ Returns the qubits and real coefficients of the terms of a sum of Z Paulis, without the
+    identity terms which only contribute a global phase, or None for any other operator. """
+    if isinstance(operator.coeff, ParameterExpression):
+        return None
+    if isinstance(operator, PauliSumOp):
+        table = operator.primitive.table
+        xs, zs, coeffs = table.X, table.Z, operator.coeffs
+    elif isinstance(operator, PauliOp):
+        xs, zs = [operator.primitive.x], [operator.primitive.z]
+        coeffs = [operator.coeff]
+    elif isinstance(operator, SummedOp):
+        if not all(isinstance(op, PauliOp) and not isinstance(op.coeff, ParameterExpression)
+                   for op in operator.oplist):
+            return None
+        xs = [op.primitive.x for op in operator.oplist]
+        zs = [op.primitive.z for op in operator.oplist]
+        coeffs = [operator.coeff * op.coeff for op in operator.oplist]
+    else:
+        return None
+
+    if np.any(xs) or not np.allclose(np.imag(coeffs), 0):
+        return None
+    return [(tuple(np.flatnonzero(z).tolist()), float(np.real(coeff)))
+            for z, coeff in zip(zs, coeffs) if np.any(z)]
+
+
+def _order_terms(terms: List[Tuple[Tuple[int, ...], float]]
+                 ) -> List[Tuple[Tuple[int, ...], float]]:
+    """ Orders commuting terms greedily into layers of terms acting on disjoint qubits, so that
+    the terms of a layer are executed in parallel. """
+    layers = []  # type: List[Tuple[set, List[Tuple[Tuple[int, ...], float]]]]
+    for qubits, coeff in sorted(terms, key=lambda term: len(term[0])):
+        for used, layer in layers:
+            if used.isdisjoint(qubits):
+                used.update(qubits)
+                layer.append((qubits, coeff))
+                break
+        else:
+            layers.append((set(qubits), [(qubits, coeff)]))
+    return [term for _, layer in layers for term in layer]
@@ -23,7 +23,7 @@ from qiskit.providers import BaseBackend
 from qiskit.providers import Backend
 from qiskit.aqua import QuantumInstance
 from qiskit.aqua.operators import op_converter, OperatorBase
-from qiskit.aqua.utils import get_subsystem_density_matrix
+from qiskit.aqua.utils import get_subsystem_probabilities
 from qiskit.aqua.algorithms import QuantumAlgorithm
 from qiskit.aqua.circuits import PhaseEstimationCircuit
 from qiskit.aqua.operators import WeightedPauliOperator
@@ -194,11 +194,10 @@ class QPE(QuantumAlgorithm, MinimumEigensolver):
             qc = self.construct_circuit(measurement=False)
             result = self._quantum_instance.execute(qc)
             complete_state_vec = result.get_statevector(qc)
-            ancilla_density_mat = get_subsystem_density_matrix(
+            ancilla_density_mat_diag = get_subsystem_probabilities(
                 complete_state_vec,
                 range(self._num_ancillae, self._num_ancillae + self._operator.num_qubits)
             )
-            ancilla_density_mat_diag = np.diag(ancilla_density_mat)
             max_amplitude = \
                 max(ancilla_density_mat_diag.min(), ancilla_density_mat_diag.max(), key=abs)
             max_amplitude_idx = np.where(ancilla_density_mat_diag == max_amplitude)[0][0]
@@ -29,7 +29,8 @@ from qiskit.providers import Backend
 from qiskit.aqua import QuantumInstance, AquaError
 from qiskit.aqua.algorithms import QuantumAlgorithm
 from qiskit.aqua.operators import (OperatorBase, ExpectationBase, ExpectationFactory, StateFn,
-                                   CircuitStateFn, LegacyBaseOperator, ListOp, I, CircuitSampler)
+                                   CircuitStateFn, LegacyBaseOperator, ListOp, I, CircuitSampler,
+                                   GradientBase)
 from qiskit.aqua.components.optimizers import Optimizer, SLSQP
 from qiskit.aqua.components.variational_forms import VariationalForm
 from qiskit.aqua.utils.validation import validate_min
@@ -98,7 +99,8 @@ class VQE(VQAlgorithm, MinimumEigensolver):
                                                              LegacyBaseOperator]]]] = None,
                  callback: Optional[Callable[[int, np.ndarray, float, float], None]] = None,
                  quantum_instance: Optional[
-                     Union[QuantumInstance, BaseBackend, Backend]] = None) -> None:
+                     Union[QuantumInstance, BaseBackend, Backend]] = None,
+                 gradient: Optional[Union[GradientBase, Callable]] = None) -> None:
         """
 
         Args:
@@ -136,6 +138,11 @@ class VQE(VQAlgorithm, MinimumEigensolver):
                 These are: the evaluation count, the optimizer parameters for the
                 variational form, the evaluated mean and the evaluated standard deviation.`
             quantum_instance: Quantum Instance or Backend
+            gradient: An optional gradient for the optimizer, either a Gradient converter, such as
+                :class:`~qiskit.aqua.operators.gradients.ParameterShift`, which is used to compute
+                the analytic gradient of the energy with the circuits sampled on the
+                ``quantum_instance``, or a callable taking the parameter values and returning the
+                gradient. If ``None`` the optimizer uses its own, e.g. finite difference, gradient.
         """
         validate_min('max_evals_grouped', max_evals_grouped, 1)
         if var_form is None:
@@ -165,6 +172,7 @@ class VQE(VQAlgorithm, MinimumEigensolver):
         self._eval_time = None
         self._optimizer.set_max_evals_grouped(max_evals_grouped)
         self._callback = callback
+        self._gradient = gradient
 
         if operator is not None:
             self.operator = operator
@@ -226,6 +234,16 @@ class VQE(VQAlgorithm, MinimumEigensolver):
         self._set_expectation(exp)
         self._user_valid_expectation = self._expectation is not None
 
+    @property
+    def gradient(self) -> Optional[Union[GradientBase, Callable]]:
+        """ Returns the gradient used by the optimizer """
+        return self._gradient
+
+    @gradient.setter
+    def gradient(self, gradient: Optional[Union[GradientBase, Callable]]) -> None:
+        """ Sets the gradient used by the optimizer """
+        self._gradient = gradient
+
     @property
     def aux_operators(self) -> Optional[List[Optional[OperatorBase]]]:
         """ Returns aux operators """
@@ -412,9 +430,17 @@ class VQE(VQAlgorithm, MinimumEigensolver):
         self._quantum_instance.circuit_summary = True
 
         self._eval_count = 0
+        gradient_fn = self._gradient
+        if isinstance(self._gradient, GradientBase):
+            gradient_fn = self._gradient.gradient_wrapper(
+                self.construct_expectation(self._var_form_params),
+                bind_params=self._var_form_params,
+                backend=self._quantum_instance)
+
         vqresult = self.find_minimum(initial_point=self.initial_point,
                                      var_form=self.var_form,
                                      cost_fn=self._energy_evaluation,
+                                     gradient_fn=gradient_fn,
                                      optimizer=self.optimizer)
 
         # TODO remove all former dictionary logic
@@ -24,6 +24,7 @@ from qiskit.aqua.components.optimizers import ADAM
 from qiskit.aqua.components.uncertainty_models import UnivariateVariationalDistribution, \
     MultivariateVariationalDistribution
 from qiskit.aqua.components.neural_networks.generative_network import GenerativeNetwork
+from qiskit.aqua.operators import GradientBase, CircuitStateFn
 
 # pylint: disable=invalid-name
 
@@ -47,7 +48,8 @@ class QuantumGenerator(GenerativeNetwork):
                                                    MultivariateVariationalDistribution,
                                                    QuantumCircuit]] = None,
                  init_params: Optional[Union[List[float], np.ndarray]] = None,
-                 snapshot_dir: Optional[str] = None) -> None:
+                 snapshot_dir: Optional[str] = None,
+                 gradient: Optional[GradientBase] = None) -> None:
         """
         Args:
             bounds: k min/max data values [[min_1,max_1],...,[min_k,max_k]],
@@ -61,6 +63,10 @@ class QuantumGenerator(GenerativeNetwork):
                 the generator's parameters.
             snapshot_dir: str or None, if not None save the optimizer's parameter after every
                 update step to the given directory
+            gradient: An optional Gradient converter, such as
+                :class:`~qiskit.aqua.operators.gradients.ParameterShift`. If given, the gradient
+                of the generator loss is computed analytically from the gradients of the sampling
+                probabilities, otherwise the optimizer uses finite differences.
 
         Raises:
             AquaError: Set multivariate variational distribution to represent multivariate data
@@ -137,6 +143,11 @@ class QuantumGenerator(GenerativeNetwork):
         self._discriminator = None
         self._ret = {}  # type: Dict[str, Any]
 
+        self._gradient = gradient
+        # the gradient function and the quantum instance it samples with
+        self._gradient_fn = None
+        self._gradient_instance = None
+
     def set_seed(self, seed):
         """
         Set seed.
@@ -218,7 +229,6 @@ class QuantumGenerator(GenerativeNetwork):
 
         result = quantum_instance.execute(qc)
 
-        generated_samples = []
         if quantum_instance.is_statevector:
             result = result.get_statevector(qc)
             values = np.multiply(result, np.conj(result))
@@ -232,27 +242,41 @@ class QuantumGenerator(GenerativeNetwork):
             values = list(result.values())
             values = [float(v) / np.sum(values) for v in values]
         generated_samples_weights = values
-        for i, _ in enumerate(keys):
+        generated_samples = self._keys_to_samples(keys)
+
+        # self.generator_circuit._probabilities = generated_samples_weights
+        if shots is not None:
+            # Restore the initial quantum_instance configuration
+            quantum_instance.set_config(shots=instance_shots)
+        return generated_samples, generated_samples_weights
+
+    def _keys_to_samples(self, keys):
+        """
+        Map measured basis states to the corresponding points of the data grid.
+
+        Args:
+            keys (list[str]): measured basis states
+
+        Returns:
+            list: data samples
+        """
+        samples = []
+        for key in keys:
             index = 0
             temp = []
             for k, p in enumerate(self._num_qubits):
                 bin_rep = 0
                 j = 0
                 while j < p:
-                    bin_rep += int(keys[i][index]) * 2 ** (int(p) - j - 1)
+                    bin_rep += int(key[index]) * 2 ** (int(p) - j - 1)
                     j += 1
                     index += 1
                 if len(self._num_qubits) > 1:
                     temp.append(self._data_grid[k][int(bin_rep)])
                 else:
                     temp.append(self._data_grid[int(bin_rep)])
-            generated_samples.append(temp)
-
-        # self.generator_circuit._probabilities = generated_samples_weights
-        if shots is not None:
-            # Restore the initial quantum_instance configuration
-            quantum_instance.set_config(shots=instance_shots)
-        return generated_samples, generated_samples_weights
+            samples.append(temp)
+        return samples
 
     def loss(self, x, weights):  # pylint: disable=arguments-differ
         """
@@ -301,6 +325,48 @@ class QuantumGenerator(GenerativeNetwork):
 
         return objective_function
 
+    def _get_gradient_function(self, quantum_instance, discriminator):
+        """
+        Get the analytic gradient function of the objective function
+
+        Args:
+            quantum_instance (QuantumInstance): used to run the quantum circuits.
+            discriminator (torch.nn.Module): discriminator network to compute the sample labels.
+
+        Returns:
+            gradient_function: gradient of the objective function, or None if no gradient is set
+        """
+        if self._gradient is None:
+            return None
+
+        if self._gradient_fn is None or self._gradient_instance is not quantum_instance:
+            # the circuits of the gradient are only built once
+            self._gradient_fn = self._gradient.gradient_wrapper(
+                CircuitStateFn(self.generator_circuit),
+                bind_params=self._free_parameters,
+                backend=quantum_instance)
+            self._gradient_instance = quantum_instance
+        num_qubits = int(sum(self._num_qubits))
+        keys = [np.binary_repr(j, num_qubits) for j in range(2 ** num_qubits)]
+        samples = self._keys_to_samples(keys)
+
+        def gradient_function(params):
+            """
+            Gradient function
+
+            Args:
+                params (numpy.ndarray): generator parameters
+
+            Returns:
+                numpy.ndarray: gradient of the loss function
+            """
+            # P x 2^n derivatives of the sampling probabilities
+            prob_grads = np.reshape(self._gradient_fn(params), (len(params), -1))
+            labels = np.asarray(discriminator.get_label(samples, detach=True)).ravel()
+            return -prob_grads @ np.log(labels)
+
+        return gradient_function
+
     def train(self, quantum_instance=None, shots=None):
         """
         Perform one training step w.r.t to the generator's parameters
@@ -318,9 +384,11 @@ class QuantumGenerator(GenerativeNetwork):
         self._optimizer._maxiter = 1
         self._optimizer._t = 0
         objective = self._get_objective_function(quantum_instance, self._discriminator)
+        gradient = self._get_gradient_function(quantum_instance, self._discriminator)
         self._bound_parameters, loss, _ = self._optimizer.optimize(
             num_vars=len(self._bound_parameters),
             objective_function=objective,
+            gradient_function=gradient,
             initial_point=self._bound_parameters
             )
 
@@ -89,24 +89,22 @@ class GaussianConditionalIndependenceModel(MultivariateDistribution):
         # create normal distribution
         self._normal = NormalDistribution(n_normal, 0, 1, -normal_max_value, normal_max_value)
 
-        # create linear rotations for conditional defaults
-        self._slopes = np.zeros(self.K)
-        self._offsets = np.zeros(self.K)
-        for k in range(self.K):
-
-            psi = F_inv(p_zeros[k]) / np.sqrt(1 - rhos[k])
-
-            # compute slope / offset
-            slope = -np.sqrt(rhos[k]) / np.sqrt(1 - rhos[k])
-            slope *= f(psi) / np.sqrt(1 - F(psi)) / np.sqrt(F(psi))
-            offset = 2 * np.arcsin(np.sqrt(F(psi)))
-
-            # adjust for integer to normal range mapping
-            offset += slope * (-normal_max_value)
-            slope *= 2 * normal_max_value / (2 ** n_normal - 1)
-
-            self._offsets[k] = offset
-            self._slopes[k] = slope
+        # create linear rotations for conditional defaults, for all the assets at once
+        p_zeros = np.asarray(p_zeros, dtype=float)
+        rhos = np.asarray(rhos, dtype=float)
+        psi = F_inv(p_zeros) / np.sqrt(1 - rhos)
+
+        # compute slope / offset
+        slopes = -np.sqrt(rhos) / np.sqrt(1 - rhos)
+        slopes *= f(psi) / np.sqrt(1 - F(psi)) / np.sqrt(F(psi))
+        offsets = 2 * np.arcsin(np.sqrt(F(psi)))
+
+        # adjust for integer to normal range mapping
+        offsets += slopes * (-normal_max_value)
+        slopes *= 2 * normal_max_value / (2 ** n_normal - 1)
+
+        self._offsets = offsets
+        self._slopes = slopes
 
     def build(self, qc, q, q_ancillas=None, params=None):
         self._normal.build(qc, q, q_ancillas)
@@ -14,10 +14,12 @@
 The Univariate Log-Normal Distribution.
 """
 
+from functools import lru_cache
 from scipy.stats.distributions import lognorm
 import numpy as np
 from qiskit.aqua.utils.validation import validate_min
 from .univariate_distribution import UnivariateDistribution
+from .uncertainty_model import _CACHE_SIZE
 
 
 class LogNormalDistribution(UnivariateDistribution):
@@ -45,8 +47,16 @@ class LogNormalDistribution(UnivariateDistribution):
                 (assuming an equidistant grid)
         """
         validate_min('num_target_qubits', num_target_qubits, 1)
-        probabilities, _ = UnivariateDistribution.\
-            pdf_to_probabilities(
-                lambda x: lognorm.pdf(x, s=sigma, scale=np.exp(mu)),
-                low, high, 2 ** num_target_qubits)
+        probabilities = _probabilities(2 ** num_target_qubits, float(mu), float(sigma),
+                                       float(low), float(high))
         super().__init__(num_target_qubits, probabilities, low, high)
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _probabilities(num_values, mu, sigma, low, high):
+    """ The discretized probabilities, cached since the models are often re-created with the
+    same parameters. """
+    probabilities, _ = UnivariateDistribution.\
+        pdf_to_probabilities(lambda x: lognorm.pdf(x, s=sigma, scale=np.exp(mu)),
+                             low, high, num_values)
+    return probabilities
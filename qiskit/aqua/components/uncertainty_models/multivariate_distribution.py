@@ -20,6 +20,7 @@ import numpy as np
 
 from qiskit.aqua.components.initial_states import Custom
 from .uncertainty_model import UncertaintyModel
+from .univariate_distribution import _evaluate_pdf
 
 
 class MultivariateDistribution(UncertaintyModel, ABC):
@@ -132,11 +133,26 @@ class MultivariateDistribution(UncertaintyModel, ABC):
     @staticmethod
     def pdf_to_probabilities(pdf, low, high, num_values):
         """ pdf to probabilities """
-        probabilities = np.zeros(num_values)
         values = np.linspace(low, high, num_values)
-        total = 0
-        for i, _ in enumerate(values):
-            probabilities[i] = pdf(values[i])
-            total += probabilities[i]
-        probabilities /= total
+        probabilities = _evaluate_pdf(pdf, values)
+        probabilities /= np.sum(probabilities)
         return probabilities, values
+
+
+def _grid(num_qubits, low, high):
+    """ Returns the points of the equidistant grid, one per row, in the order of the
+    probabilities, i.e. with the values of the first dimension varying the slowest. """
+    axes = [np.linspace(low[i], high[i], 2 ** num_qubits[i]) for i in range(len(num_qubits))]
+    return np.stack(np.meshgrid(*axes, indexing='ij'), axis=-1).reshape(-1, len(axes))
+
+
+def _to_key(array):
+    """ Converts an array-like to a hashable cache key. """
+    array = np.asarray(array, dtype=float)
+    return array.shape, tuple(array.ravel().tolist())
+
+
+def _from_key(key):
+    """ Converts a cache key back to the array. """
+    shape, values = key
+    return np.reshape(values, shape)
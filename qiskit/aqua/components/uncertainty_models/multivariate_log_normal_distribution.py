@@ -15,9 +15,11 @@ The Multivariate Log-Normal Distribution.
 """
 
 from typing import Optional, List, Union
+from functools import lru_cache
 import numpy as np
 from scipy.stats import multivariate_normal
-from .multivariate_distribution import MultivariateDistribution
+from .multivariate_distribution import MultivariateDistribution, _grid, _to_key, _from_key
+from .uncertainty_model import _CACHE_SIZE
 
 
 class MultivariateLogNormalDistribution(MultivariateDistribution):
@@ -53,29 +55,25 @@ class MultivariateLogNormalDistribution(MultivariateDistribution):
 
         self.mu = mu
         self.cov = cov
-        probs, values = self._compute_probabilities([], [], num_qubits, low, high)
-        probs = np.asarray(probs) / np.sum(probs)
+        probs, points = _probabilities(tuple(num_qubits), _to_key(low), _to_key(high),
+                                       _to_key(mu), _to_key(cov))
         super().__init__(num_qubits, probs, low, high)
-        self._values = values
+        self._values = list(points.copy()) if dimension > 1 else list(points[:, 0])
 
-    def _compute_probabilities(self, probs, values, num_qubits, low, high, x=None):
 
-        for y in np.linspace(low[0], high[0], 2 ** num_qubits[0]):
-            x__ = y if x is None else np.append(x, y)
-            if len(num_qubits) == 1:
-                # map probabilities from normal to log-normal
-                # reference:
-                # https://stats.stackexchange.com/questions/214997/multivariate-log-normal-probabiltiy-density-function-pdf
-                if np.min(x__) > 0.0:
-                    phi_x_ = np.log(x__)
-                    det_j_phi = 1 / np.prod(x__)
-                    prob = multivariate_normal.pdf(phi_x_, mean=self.mu, cov=self.cov) * det_j_phi
-                    probs.append(prob)
-                else:
-                    probs.append(0.0)
-                values.append(x__)
-            else:
-                probs, values = self._compute_probabilities(probs,
-                                                            values,
-                                                            num_qubits[1:], low[1:], high[1:], x__)
-        return probs, values
+@lru_cache(maxsize=_CACHE_SIZE)
+def _probabilities(num_qubits, low, high, mu, cov):
+    """ Evaluates the pdf on the whole grid at once, cached since the models are often
+    re-created with the same parameters. """
+    points = _grid(num_qubits, _from_key(low), _from_key(high))
+    probs = np.zeros(len(points))
+    # map probabilities from normal to log-normal
+    # reference:
+    # https://stats.stackexchange.com/questions/214997/multivariate-log-normal-probabiltiy-density-function-pdf
+    positive = np.min(points, axis=1) > 0.0
+    if np.any(positive):
+        phi_x = np.log(points[positive])
+        det_j_phi = 1 / np.prod(points[positive], axis=1)
+        probs[positive] = np.reshape(
+            multivariate_normal.pdf(phi_x, mean=_from_key(mu), cov=_from_key(cov)), -1) * det_j_phi
+    return probs / np.sum(probs), points
@@ -15,9 +15,11 @@ The Multivariate Normal Distribution.
 """
 
 from typing import Optional, List, Union
+from functools import lru_cache
 import numpy as np
 from scipy.stats import multivariate_normal
-from .multivariate_distribution import MultivariateDistribution
+from .multivariate_distribution import MultivariateDistribution, _grid, _to_key, _from_key
+from .uncertainty_model import _CACHE_SIZE
 
 # pylint: disable=invalid-name
 
@@ -45,9 +47,6 @@ class MultivariateNormalDistribution(MultivariateDistribution):
             mu: Expected values
             sigma: Co-variance matrix
         """
-        if not isinstance(sigma, np.ndarray):
-            sigma = np.asarray(sigma)
-
         dimension = len(num_qubits)
 
         if mu is None:
@@ -60,17 +59,16 @@ class MultivariateNormalDistribution(MultivariateDistribution):
             high = np.ones(dimension)
 
         self.mu = mu
-        self.sigma = sigma
-        probs = self._compute_probabilities([], num_qubits, low, high)
-        probs = np.asarray(probs) / np.sum(probs)
+        self.sigma = np.asarray(sigma)
+        probs = _probabilities(tuple(num_qubits), _to_key(low), _to_key(high),
+                               _to_key(mu), _to_key(sigma))
         super().__init__(num_qubits, probs, low, high)
 
-    def _compute_probabilities(self, probs, num_qubits, low, high, x=None):
 
-        for y in np.linspace(low[0], high[0], 2**num_qubits[0]):
-            x_ = y if x is None else np.append(x, y)
-            if len(num_qubits) == 1:
-                probs.append(multivariate_normal.pdf(x_, self.mu, self.sigma))
-            else:
-                probs = self._compute_probabilities(probs, num_qubits[1:], low[1:], high[1:], x_)
-        return probs
+@lru_cache(maxsize=_CACHE_SIZE)
+def _probabilities(num_qubits, low, high, mu, sigma):
+    """ Evaluates the pdf on the whole grid at once, cached since the models are often
+    re-created with the same parameters. """
+    points = _grid(num_qubits, _from_key(low), _from_key(high))
+    probs = np.reshape(multivariate_normal.pdf(points, _from_key(mu), _from_key(sigma)), -1)
+    return probs / np.sum(probs)
@@ -14,9 +14,11 @@
 The Univariate Normal Distribution.
 """
 
+from functools import lru_cache
 from scipy.stats.distributions import norm
 from qiskit.aqua.utils.validation import validate_min
 from .univariate_distribution import UnivariateDistribution
+from .uncertainty_model import _CACHE_SIZE
 
 
 class NormalDistribution(UnivariateDistribution):
@@ -44,7 +46,15 @@ class NormalDistribution(UnivariateDistribution):
                 (assuming an equidistant grid)
         """
         validate_min('num_target_qubits', num_target_qubits, 1)
-        probabilities, _ = UnivariateDistribution.\
-            pdf_to_probabilities(
-                lambda x: norm.pdf(x, mu, sigma), low, high, 2 ** num_target_qubits)
+        probabilities = _probabilities(2 ** num_target_qubits, float(mu), float(sigma),
+                                       float(low), float(high))
         super().__init__(num_target_qubits, probabilities, low, high)
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _probabilities(num_values, mu, sigma, low, high):
+    """ The discretized probabilities, cached since the models are often re-created with the
+    same parameters. """
+    probabilities, _ = UnivariateDistribution.\
+        pdf_to_probabilities(lambda x: norm.pdf(x, mu, sigma), low, high, num_values)
+    return probabilities
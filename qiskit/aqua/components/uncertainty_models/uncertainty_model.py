@@ -19,6 +19,12 @@ from abc import ABC, abstractmethod
 from qiskit.aqua.utils.validation import validate_min
 from qiskit.aqua.utils import CircuitFactory
 
+# Number of parameter sets for which the normal and log-normal distributions cache their
+# discretized probabilities. The cap counts entries, not bytes: an entry holds the
+# 2 ** num_target_qubits probabilities of one model (and its grid points, for the multivariate
+# log-normal distribution), so 256 entries of a 20-qubit model take about 2 GB.
+_CACHE_SIZE = 256
+
 
 class UncertaintyModel(CircuitFactory, ABC):
     """
@@ -103,11 +103,18 @@ class UnivariateDistribution(UncertaintyModel, ABC):
         Returns:
             list: array of probabilities
         """
-        probabilities = np.zeros(num_values)
         values = np.linspace(low, high, num_values)
-        total = 0
-        for i, _ in enumerate(values):
-            probabilities[i] = pdf(values[i])
-            total += probabilities[i]
-        probabilities /= total
+        probabilities = _evaluate_pdf(pdf, values)
+        probabilities /= np.sum(probabilities)
         return probabilities, values
+
+
+def _evaluate_pdf(pdf, values):
+    """ Evaluates the pdf on all the values at once if it supports arrays, else one by one. """
+    try:
+        probabilities = np.asarray(pdf(values), dtype=float)
+    except (TypeError, ValueError):
+        probabilities = None
+    if probabilities is None or probabilities.shape != values.shape[:1]:
+        probabilities = np.asarray([pdf(value) for value in values], dtype=float)
+    return probabilities
@@ -124,21 +124,24 @@ only diagonal Paulis.
    converters
    evolutions
    expectations
+   gradients
 
 """
 
 from .legacy import (evolution_instruction,
                      suzuki_expansion_slice_pauli_list,
                      pauli_measurement,
-                     measure_pauli_z, covariance, row_echelon_F2,
-                     kernel_F2, commutator, check_commutativity)
+                     measure_pauli_z, covariance, measure_paulis_z,
+                     covariance_matrix, pauli_signs, row_echelon_F2,
+                     kernel_F2, commutator, check_commutativity,
+                     qubitwise_noncommuting_pairs)
 from .legacy import (LegacyBaseOperator, WeightedPauliOperator, Z2Symmetries,
                      TPBGroupedWeightedPauliOperator, MatrixOperator,
                      PauliGraph, op_converter)
 
 # New Operators
 from .operator_base import OperatorBase
-from .primitive_ops import PrimitiveOp, PauliOp, MatrixOp, CircuitOp
+from .primitive_ops import PrimitiveOp, PauliOp, MatrixOp, CircuitOp, PauliSumOp
 from .state_fns import (StateFn, DictStateFn, VectorStateFn,
                         CircuitStateFn, OperatorStateFn)
 from .list_ops import ListOp, SummedOp, ComposedOp, TensoredOp
@@ -149,6 +152,7 @@ from .expectations import (ExpectationBase, ExpectationFactory, PauliExpectation
 from .evolutions import (EvolutionBase, EvolutionFactory, EvolvedOp, PauliTrotterEvolution,
                          MatrixEvolution, TrotterizationBase, TrotterizationFactory, Trotter,
                          Suzuki, QDrift)
+from .gradients import GradientBase, ParameterShift
 
 # Convenience immutable instances
 from .operator_globals import (EVAL_SIG_DIGITS,
@@ -160,14 +164,16 @@ __all__ = [
     # Common
     'evolution_instruction', 'suzuki_expansion_slice_pauli_list',
     'pauli_measurement', 'measure_pauli_z',
-    'covariance', 'row_echelon_F2', 'kernel_F2', 'commutator', 'check_commutativity',
+    'covariance', 'measure_paulis_z', 'covariance_matrix', 'pauli_signs',
+    'row_echelon_F2', 'kernel_F2', 'commutator', 'check_commutativity',
+    'qubitwise_noncommuting_pairs',
     # Legacy
     'PauliGraph', 'LegacyBaseOperator', 'WeightedPauliOperator',
     'Z2Symmetries', 'TPBGroupedWeightedPauliOperator',
     'MatrixOperator',
     # Operators
     'OperatorBase',
-    'PrimitiveOp', 'PauliOp', 'MatrixOp', 'CircuitOp',
+    'PrimitiveOp', 'PauliOp', 'MatrixOp', 'CircuitOp', 'PauliSumOp',
     'StateFn', 'DictStateFn', 'VectorStateFn', 'CircuitStateFn', 'OperatorStateFn',
     'ListOp', 'SummedOp', 'ComposedOp', 'TensoredOp',
     # Converters
@@ -176,6 +182,7 @@ __all__ = [
     'AerPauliExpectation',
     'EvolutionBase', 'EvolvedOp', 'EvolutionFactory', 'PauliTrotterEvolution', 'MatrixEvolution',
     'TrotterizationBase', 'TrotterizationFactory', 'Trotter', 'Suzuki', 'QDrift',
+    'GradientBase', 'ParameterShift',
     # Convenience immutable instances
     'X', 'Y', 'Z', 'I', 'CX', 'S', 'H', 'T', 'Swap', 'CZ', 'Zero', 'One', 'Plus', 'Minus'
 ]
@@ -13,12 +13,13 @@
 """AbelianGrouper Class"""
 
 import warnings
-from typing import List, Tuple, Dict, cast, Optional
+from typing import List, Tuple, Dict, Optional
 
 import numpy as np
 import retworkx as rx
 
 from qiskit.aqua import AquaError
+from ..legacy.common import qubitwise_noncommuting_pairs
 from .converter_base import ConverterBase
 from ..list_ops.list_op import ListOp
 from ..list_ops.summed_op import SummedOp
@@ -39,13 +40,15 @@ class AbelianGrouper(ConverterBase):
     diagonalized together.
     """
 
-    def __init__(self, traverse: bool = True) -> None:
+    def __init__(self, traverse: bool = True, num_processes: int = 1) -> None:
         """
         Args:
             traverse: Whether to convert only the Operator passed to ``convert``, or traverse
                 down that Operator.
+            num_processes: The number of processes used to build the commutation graph.
         """
         self._traverse = traverse
+        self._num_processes = num_processes
 
     def convert(self, operator: OperatorBase) -> OperatorBase:
         """Check if operator is a SummedOp, in which case covert it into a sum of mutually
@@ -65,7 +68,7 @@ class AbelianGrouper(ConverterBase):
             if isinstance(operator, SummedOp) and all(isinstance(op, PauliOp)
                                                       for op in operator.oplist):
                 # For now, we only support graphs over Paulis.
-                return self.group_subops(operator)
+                return self.group_subops(operator, num_processes=self._num_processes)
             elif self._traverse:
                 return operator.traverse(self.convert)
             else:
@@ -81,13 +84,14 @@ class AbelianGrouper(ConverterBase):
 
     @classmethod
     def group_subops(cls, list_op: ListOp, fast: Optional[bool] = None,
-                     use_nx: Optional[bool] = None) -> ListOp:
+                     use_nx: Optional[bool] = None, num_processes: int = 1) -> ListOp:
         """Given a ListOp, attempt to group into Abelian ListOps of the same type.
 
         Args:
             list_op: The Operator to group into Abelian groups
             fast: Ignored - parameter will be removed in future release
             use_nx: Ignored - parameter will be removed in future release
+            num_processes: The number of processes used to build the commutation graph.
 
         Returns:
             The grouped Operator.
@@ -106,7 +110,7 @@ class AbelianGrouper(ConverterBase):
                     'Cannot determine Abelian groups if any Operator in list_op is not '
                     '`PauliOp`. E.g., {} ({})'.format(op, type(op)))
 
-        edges = cls._commutation_graph(list_op)
+        edges = cls._commutation_graph(list_op, num_processes)
         nodes = range(len(list_op))
 
         graph = rx.PyGraph()
@@ -126,7 +130,7 @@ class AbelianGrouper(ConverterBase):
         return list_op.__class__(group_ops, coeff=list_op.coeff)  # type: ignore
 
     @staticmethod
-    def _commutation_graph(list_op: ListOp) -> List[Tuple[int, int]]:
+    def _commutation_graph(list_op: ListOp, num_processes: int = 1) -> List[Tuple[int, int]]:
         """Create edges (i, j) if i and j are not commutable.
 
         Note:
@@ -134,14 +138,13 @@ class AbelianGrouper(ConverterBase):
 
         Args:
             list_op: list_op
+            num_processes: The number of processes used to find the edges.
 
         Returns:
             A list of pairs of indices of the operators that are not commutable
         """
-        # convert a Pauli operator into int vector where {I: 0, X: 2, Y: 3, Z: 1}
-        mat1 = np.array([op.primitive.z + 2 * op.primitive.x for op in list_op], dtype=np.int8)
-        mat2 = mat1[:, None]
-        # mat3[i, j] is True if i and j are commutable with TPB
-        mat3 = (((mat1 * mat2) * (mat1 - mat2)) == 0).all(axis=2)
-        # return [(i, j) if mat3[i, j] is False and i < j]
-        return cast(List[Tuple[int, int]], list(zip(*np.where(np.triu(np.logical_not(mat3), k=1)))))
+        paulis_x = np.array([op.primitive.x for op in list_op], dtype=bool)
+        paulis_z = np.array([op.primitive.z for op in list_op], dtype=bool)
+        rows, cols = qubitwise_noncommuting_pairs(paulis_x, paulis_z,
+                                                  num_processes=num_processes)
+        return list(zip(rows.tolist(), cols.tolist()))
@@ -67,7 +67,10 @@ class AerPauliExpectation(ExpectationBase):
         # circuit to replace with a DictStateFn
 
         # Change to Pauli representation if necessary
-        if not {'Pauli'} == operator.primitive_strings():
+        if {'SparsePauliOp'} == operator.primitive_strings():
+            # Expanding a PauliSumOp into PauliOps does not need any matrix decomposition.
+            operator = operator.to_pauli_op(massive=False)
+        elif not {'Pauli'} == operator.primitive_strings():
             logger.warning('Measured Observable is not composed of only Paulis, converting to '
                            'Pauli representation, which can be expensive.')
             # Setting massive=False because this conversion is implicit. User can perform this
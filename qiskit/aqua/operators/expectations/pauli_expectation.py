@@ -61,7 +61,11 @@ class PauliExpectation(ExpectationBase):
 
         if isinstance(operator, OperatorStateFn) and operator.is_measurement:
             # Change to Pauli representation if necessary
-            if not {'Pauli'} == operator.primitive_strings():
+            if {'SparsePauliOp'} == operator.primitive_strings():
+                # Expanding a PauliSumOp into PauliOps does not need any matrix decomposition.
+                pauli_obsv = operator.primitive.to_pauli_op(massive=False)
+                operator = StateFn(pauli_obsv, is_measurement=True, coeff=operator.coeff)
+            elif not {'Pauli'} == operator.primitive_strings():
                 logger.warning('Measured Observable is not composed of only Paulis, converting to '
                                'Pauli representation, which can be expensive.')
                 # Setting massive=False because this conversion is implicit. User can perform this
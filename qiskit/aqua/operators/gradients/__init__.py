@@ -0,0 +1,53 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Gradients (:mod:`qiskit.aqua.operators.gradients`)
+==================================================
+
+.. currentmodule:: qiskit.aqua.operators.gradients
+
+Gradients are converters which take an Operator depending on circuit parameters, such as the
+expectation value ``~StateFn(o) @ CircuitStateFn(ansatz)`` of a variational algorithm, and return
+an Operator evaluating to its derivatives with respect to these parameters. The returned Operator
+only contains circuits, so that all the circuits needed for the gradient can be sampled together
+with a :class:`~qiskit.aqua.operators.converters.CircuitSampler`, e.g.
+``my_sampler.convert(ParameterShift().convert(my_expect_op, params), param_bindings).eval()``.
+
+Gradient Base Class
+===================
+The GradientBase class gives an interface for algorithms to ask for gradients as execution
+settings. For example :class:`~qiskit.aqua.algorithms.VQE` accepts a gradient which it turns into
+the ``gradient_function`` passed to its optimizer.
+
+.. autosummary::
+   :toctree: ../stubs/
+   :nosignatures:
+
+   GradientBase
+
+Gradients
+=========
+
+.. autosummary::
+   :toctree: ../stubs/
+   :nosignatures:
+
+   ParameterShift
+
+"""
+
+from .gradient_base import GradientBase
+from .parameter_shift import ParameterShift
+
+__all__ = ['GradientBase',
+           'ParameterShift']
@@ -0,0 +1,114 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+""" GradientBase Class """
+
+import logging
+from typing import Callable, List, Optional, Union
+from abc import abstractmethod
+import numpy as np
+
+from qiskit.circuit import ParameterExpression
+from qiskit.providers import BaseBackend, Backend
+from qiskit.aqua import QuantumInstance
+
+from ..operator_base import OperatorBase
+from ..converters import ConverterBase, CircuitSampler
+from ..state_fns import CircuitStateFn
+
+logger = logging.getLogger(__name__)
+
+
+class GradientBase(ConverterBase):
+    r"""
+    A base for Gradient converters. Gradients are converters which take an Operator depending on
+    circuit parameters and return an Operator evaluating to its derivatives with respect to these
+    parameters. The Operator to differentiate is either an expectation value, i.e. a composition
+    of a measurement with parameterized circuits, such as
+    ``~StateFn(o) @ CircuitStateFn(ansatz)``, or a parameterized ``CircuitStateFn``, in which case
+    the derivatives of its sampling probabilities are computed.
+
+    """
+
+    @abstractmethod
+    # ``params`` extends ``ConverterBase.convert`` by an optional argument, so callers of the
+    # base signature are unaffected
+    def convert(self,  # pylint: disable=arguments-differ
+                operator: OperatorBase,
+                params: Optional[List[ParameterExpression]] = None) -> OperatorBase:
+        r"""
+        Accept an Operator and return a ``ListOp`` holding, for each parameter in ``params``, an
+        Operator computing the derivative of ``operator`` with respect to this parameter.
+
+        Args:
+            operator: The Operator to differentiate.
+            params: The parameters to differentiate with respect to. If ``None`` all parameters
+                of ``operator``, sorted by name, are used.
+
+        Returns:
+            The Operator of the gradient.
+
+        """
+        raise NotImplementedError
+
+    def gradient_wrapper(self,
+                         operator: OperatorBase,
+                         bind_params: List[ParameterExpression],
+                         grad_params: Optional[List[ParameterExpression]] = None,
+                         backend: Optional[Union[BaseBackend, Backend, QuantumInstance]] = None
+                         ) -> Callable[[np.ndarray], np.ndarray]:
+        r"""
+        Get a callable evaluating the gradient of ``operator`` for given parameter values, as
+        expected by the ``gradient_function`` argument of the optimizers.
+
+        The gradient Operator is built once. Each call binds the values and samples all of
+        its circuits together with a single ``CircuitSampler.convert`` call.
+
+        Args:
+            operator: The Operator to differentiate.
+            bind_params: The parameters which are bound to the values passed to the callable.
+            grad_params: The parameters to differentiate with respect to. If ``None``,
+                ``bind_params`` is used.
+            backend: The backend or QuantumInstance used to sample the circuits. If ``None``,
+                the gradient Operator is evaluated exactly.
+
+        Returns:
+            A callable taking the values of ``bind_params``, or a 2-D array with one set of
+            values per row, and returning the gradient for each set of values. For expectation
+            values this is one value per parameter in ``grad_params``, for a ``CircuitStateFn``
+            the derivatives of the sampling probabilities, one row per parameter.
+        """
+        grad_params = bind_params if grad_params is None else grad_params
+        grad_op = self.convert(operator, grad_params)
+        sampler = CircuitSampler(backend) if backend is not None else None
+        is_state = isinstance(operator, CircuitStateFn) and not operator.is_measurement
+
+        def gradient_fn(values: np.ndarray) -> np.ndarray:
+            values = np.reshape(values, (-1, len(bind_params)))
+            param_bindings = [dict(zip(bind_params, value_set)) for value_set in values.tolist()]
+            if sampler is not None:
+                sampled_ops = sampler.convert(
+                    grad_op, params=dict(zip(bind_params, values.T.tolist()))).oplist
+            else:
+                sampled_ops = [grad_op] * len(param_bindings)
+
+            grads = []
+            for sampled_op, param_binding in zip(sampled_ops, param_bindings):
+                # bind the chain rule coefficients and, if not sampled, the circuits
+                if sampled_op.parameters:
+                    sampled_op = sampled_op.bind_parameters(param_binding)
+                grad = sampled_op.to_matrix() if is_state else sampled_op.eval()
+                # scipy's L-BFGS-B requires a contiguous float array, np.real returns a strided view
+                grads.append(np.ascontiguousarray(np.real(grad), dtype=float))
+            return grads[0] if len(grads) == 1 else np.asarray(grads)
+
+        return gradient_fn
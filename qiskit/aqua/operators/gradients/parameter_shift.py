@@ -0,0 +1,269 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+""" ParameterShift Class """
+
+import logging
+from typing import Dict, List, Optional, Tuple, Union
+from functools import partial
+import numpy as np
+
+from qiskit.circuit import QuantumCircuit, ParameterExpression
+from qiskit.circuit.library.standard_gates import (RXGate, RYGate, RZGate, PhaseGate, U1Gate,
+                                                   U2Gate, U3Gate, UGate, RXXGate, RYYGate,
+                                                   RZZGate, RZXGate, CPhaseGate, CU1Gate)
+from qiskit.converters import circuit_to_dag, dag_to_circuit
+from qiskit.aqua import AquaError
+
+from .gradient_base import GradientBase
+from ..operator_base import OperatorBase
+from ..list_ops.list_op import ListOp
+from ..list_ops.summed_op import SummedOp
+from ..list_ops.composed_op import ComposedOp
+from ..primitive_ops.circuit_op import CircuitOp
+from ..state_fns.circuit_state_fn import CircuitStateFn
+
+logger = logging.getLogger(__name__)
+
+# Gates of the form exp(-i theta/2 G) with G having eigenvalues +-1, up to a global phase, with
+# respect to each of their parameters. For these the parameter shift rule is exact.
+_SHIFTABLE_GATES = (RXGate, RYGate, RZGate, PhaseGate, U1Gate, U2Gate, U3Gate, UGate,
+                    RXXGate, RYYGate, RZZGate, RZXGate, CPhaseGate, CU1Gate)
+
+
+class ParameterShift(GradientBase):
+    r"""
+    The parameter shift rule gradient.
+
+    For a gate :math:`\exp(-i \theta G / 2)` where :math:`G` has the eigenvalues :math:`\pm 1`,
+    such as the Pauli rotations, the derivative of an expectation value :math:`f(\theta)` is
+    exactly :math:`(f(\theta + \pi/2) - f(\theta - \pi/2)) / 2`, see
+    https://arxiv.org/abs/1811.11184. The same holds for the sampling probabilities of a circuit,
+    which are the expectation values of projectors.
+
+    Each parameter of the Operator is mapped to the sum of these differences over all the gates
+    it appears in, weighted by the derivative of the gate parameter expression (the chain rule).
+    Gates for which the rule is not exact, e.g. controlled rotations, or composite instructions,
+    are replaced by their definitions until the parameters only appear in gates for which it is,
+    so their derivative is also a linear combination of shifted circuits.
+
+    The converted Operator only contains circuits, which are all sampled together by a
+    :class:`~qiskit.aqua.operators.converters.CircuitSampler`.
+    """
+
+    # ``params`` extends ``ConverterBase.convert`` by an optional argument, so callers of the
+    # base signature are unaffected
+    def convert(self,  # pylint: disable=arguments-differ
+                operator: OperatorBase,
+                params: Optional[List[ParameterExpression]] = None) -> OperatorBase:
+        r"""
+        Accept an Operator and return a ``ListOp`` holding, for each parameter in ``params``, an
+        Operator computing the derivative of ``operator`` with respect to this parameter.
+
+        ``operator`` must be an expectation value, i.e. a ``ComposedOp`` of a measurement with
+        parameterized ``CircuitStateFn`` or ``CircuitOp``, or a ``SummedOp`` or ``ListOp`` with a
+        linear ``combo_fn`` of these, or a parameterized ``CircuitStateFn``. In the latter case
+        the derivative of its sampling probabilities is computed by ``to_matrix``.
+
+        Args:
+            operator: The Operator to differentiate.
+            params: The parameters to differentiate with respect to. If ``None`` all parameters
+                of ``operator``, sorted by name, are used.
+
+        Returns:
+            The Operator of the gradient.
+        """
+        if params is None:
+            params = sorted(operator.parameters, key=lambda p: p.name)
+
+        # the unrolled circuits are shared by all the parameters
+        unrolled = {}  # type: Dict[int, QuantumCircuit]
+        return ListOp([self._differentiate(operator, param, set(params), unrolled)
+                       for param in params])
+
+    def _differentiate(self,
+                       operator: OperatorBase,
+                       param: ParameterExpression,
+                       params: set,
+                       unrolled: Dict[int, QuantumCircuit]) -> OperatorBase:
+        if isinstance(operator.coeff, ParameterExpression) and \
+                param in operator.coeff.parameters:
+            raise AquaError('Gradients of Operators with parameterized coefficients are not '
+                            'supported, got {}.'.format(operator.coeff))
+
+        if isinstance(operator, ComposedOp):
+            return self._shift_expectation(operator, param, params, unrolled)
+
+        if isinstance(operator, SummedOp):
+            return SummedOp([self._differentiate(op, param, params, unrolled)
+                             for op in operator.oplist if param in op.parameters],
+                            coeff=operator.coeff)
+
+        if operator.__class__ == ListOp:
+            # the derivative of a ListOp is only correct if its combo_fn is linear
+            return ListOp([self._differentiate(op, param, params, unrolled)
+                           if param in op.parameters else 0.0 * op
+                           for op in operator.oplist],
+                          combo_fn=operator.combo_fn, coeff=operator.coeff)
+
+        if isinstance(operator, CircuitStateFn) and not operator.is_measurement:
+            return self._shift_probabilities(operator, param, params, unrolled)
+
+        raise AquaError('The parameter shift rule only applies to expectation values and '
+                        'sampling probabilities of circuits, not to {}.'.format(operator))
+
+    def _shift_expectation(self,
+                           operator: ComposedOp,
+                           param: ParameterExpression,
+                           params: set,
+                           unrolled: Dict[int, QuantumCircuit]) -> OperatorBase:
+        terms = []
+        for i, op in enumerate(operator.oplist):
+            if param not in op.parameters:
+                continue
+            if not (isinstance(op, CircuitOp) or
+                    (isinstance(op, CircuitStateFn) and not op.is_measurement)):
+                raise AquaError('The parameter shift rule only applies to parameters of the '
+                                'circuits of the state, not of {}.'.format(op))
+            if isinstance(op.coeff, ParameterExpression) and param in op.coeff.parameters:
+                raise AquaError('Gradients of Operators with parameterized coefficients are not '
+                                'supported, got {}.'.format(op.coeff))
+            circuit = _unroll(op.primitive, params, unrolled)
+            for coeff, circuit_plus, circuit_minus in _shift_terms(circuit, param):
+                for sign, shifted_circuit in ((1, circuit_plus), (-1, circuit_minus)):
+                    oplist = list(operator.oplist)
+                    oplist[i] = op.__class__(shifted_circuit, coeff=op.coeff) \
+                        if isinstance(op, CircuitOp) \
+                        else CircuitStateFn(shifted_circuit, coeff=op.coeff)
+                    terms.append(ComposedOp(oplist, coeff=operator.coeff * sign * coeff))
+
+        if not terms:
+            # the parameter only changes the global phase
+            return 0.0 * operator
+        return SummedOp(terms)
+
+    def _shift_probabilities(self,
+                             operator: CircuitStateFn,
+                             param: ParameterExpression,
+                             params: set,
+                             unrolled: Dict[int, QuantumCircuit]) -> OperatorBase:
+        circuit = _unroll(operator.primitive, params, unrolled)
+        coeffs = []
+        states = []
+        for coeff, circuit_plus, circuit_minus in _shift_terms(circuit, param):
+            if isinstance(coeff, ParameterExpression):
+                raise AquaError('Gradients of sampling probabilities are only supported for '
+                                'gate parameters linear in {}, got {}.'.format(param, coeff))
+            coeffs += [coeff, -coeff]
+            states += [CircuitStateFn(circuit_plus), CircuitStateFn(circuit_minus)]
+
+        if not states:
+            # the parameter only changes the global phase
+            states = [CircuitStateFn(circuit)]
+            coeffs = [0.0]
+        weights = np.abs(operator.coeff) ** 2 * np.asarray(coeffs)
+        return ListOp(states, combo_fn=partial(_probability_difference, weights=weights))
+
+
+def _probability_difference(amplitudes: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """ Returns the weighted sum of the probabilities of the given amplitude vectors. """
+    return weights @ (np.abs(np.asarray(amplitudes, dtype=complex)) ** 2)
+
+
+def _depends_on(instruction, params: set) -> bool:
+    return any(isinstance(expr, ParameterExpression) and expr.parameters & params
+               for expr in instruction.params)
+
+
+def _unroll(circuit: QuantumCircuit,
+            params: set,
+            unrolled: Dict[int, QuantumCircuit]) -> QuantumCircuit:
+    """ Replaces the instructions depending on params by their definitions, until all of them
+    are gates to which the parameter shift rule applies. """
+    if id(circuit) in unrolled:
+        return unrolled[id(circuit)]
+
+    dag = circuit_to_dag(circuit)
+    while True:
+        nodes = [node for node in dag.op_nodes()
+                 if _depends_on(node.op, params) and not isinstance(node.op, _SHIFTABLE_GATES)]
+        if not nodes:
+            break
+        for node in nodes:
+            if node.op.definition is None:
+                raise AquaError('The parameter shift rule does not apply to the instruction '
+                                '{} which has no definition.'.format(node.op.name))
+            dag.substitute_node_with_dag(node, circuit_to_dag(node.op.definition))
+
+    result = dag_to_circuit(dag)
+    unrolled[id(circuit)] = result
+    return result
+
+
+def _shift_terms(circuit: QuantumCircuit, param: ParameterExpression
+                 ) -> List[Tuple[Union[float, ParameterExpression], QuantumCircuit,
+                                 QuantumCircuit]]:
+    """ Returns the coefficient and the circuits shifted by +pi/2 and -pi/2 for each occurrence
+    of param in the gates of the circuit. """
+    terms = []
+    for index, (instruction, _, _) in enumerate(circuit.data):
+        for slot, expr in enumerate(instruction.params):
+            if isinstance(expr, ParameterExpression) and param in expr.parameters:
+                coeff = _to_coeff(_gradient(expr, param)) / 2
+                terms.append((coeff,
+                              _shift(circuit, index, slot, np.pi / 2),
+                              _shift(circuit, index, slot, -np.pi / 2)))
+    return terms
+
+
+def _shift(circuit: QuantumCircuit, index: int, slot: int, shift: float) -> QuantumCircuit:
+    """ Returns a copy of the circuit with the parameter in the given slot of the instruction at
+    the given index shifted. """
+    instruction, qargs, cargs = circuit.data[index]
+    shifted_instruction = instruction.copy()
+    shifted_params = list(instruction.params)
+    shifted_params[slot] = shifted_params[slot] + shift
+    shifted_instruction.params = shifted_params
+
+    shifted_circuit = circuit.copy()
+    data = list(shifted_circuit.data)
+    data[index] = (shifted_instruction, qargs, cargs)
+    # assigning the data rebuilds the parameter table of the circuit
+    shifted_circuit.data = data
+    return shifted_circuit
+
+
+def _gradient(expr: ParameterExpression, param: ParameterExpression
+              ) -> Union[complex, float, ParameterExpression]:
+    """ Returns the derivative of the parameter expression with respect to the parameter. """
+    if hasattr(expr, 'gradient'):
+        return expr.gradient(param)
+
+    # ParameterExpression.gradient is only available from qiskit-terra 0.17, so differentiate
+    # the underlying sympy expression
+    import sympy as sy
+    # pylint: disable=protected-access
+    expr_grad = sy.Derivative(expr._symbol_expr, expr._parameter_symbols[param]).doit()
+    parameter_symbols = {parameter: symbol for parameter, symbol in expr._parameter_symbols.items()
+                         if symbol in expr_grad.free_symbols}
+    if not parameter_symbols:
+        return complex(expr_grad)
+    return ParameterExpression(parameter_symbols, expr=expr_grad)
+
+
+def _to_coeff(value: Union[complex, float, ParameterExpression]
+              ) -> Union[float, ParameterExpression]:
+    if isinstance(value, ParameterExpression):
+        if value.parameters:
+            return value
+        value = complex(value)
+    return float(np.real(value))
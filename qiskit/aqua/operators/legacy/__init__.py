@@ -46,16 +46,22 @@ Legacy Operator support
     pauli_measurement
     measure_pauli_z
     covariance
+    measure_paulis_z
+    covariance_matrix
+    pauli_signs
     row_echelon_F2
     kernel_F2
     commutator
     check_commutativity
+    qubitwise_noncommuting_pairs
     PauliGraph
     Z2Symmetries
 """
 from .common import (evolution_instruction, suzuki_expansion_slice_pauli_list, pauli_measurement,
-                     measure_pauli_z, covariance, row_echelon_F2,
-                     kernel_F2, commutator, check_commutativity)
+                     measure_pauli_z, covariance, measure_paulis_z,
+                     covariance_matrix, pauli_signs, row_echelon_F2,
+                     kernel_F2, commutator, check_commutativity,
+                     qubitwise_noncommuting_pairs)
 
 from .base_operator import LegacyBaseOperator
 from .weighted_pauli_operator import WeightedPauliOperator, Z2Symmetries
@@ -69,10 +75,14 @@ __all__ = [
     'pauli_measurement',
     'measure_pauli_z',
     'covariance',
+    'measure_paulis_z',
+    'covariance_matrix',
+    'pauli_signs',
     'row_echelon_F2',
     'kernel_F2',
     'commutator',
     'check_commutativity',
+    'qubitwise_noncommuting_pairs',
     'PauliGraph',
     'LegacyBaseOperator',
     'WeightedPauliOperator',
@@ -20,6 +20,7 @@ from qiskit.quantum_info import Pauli  # pylint: disable=unused-import
 from qiskit import QuantumCircuit, QuantumRegister
 from qiskit.qasm import pi
 from qiskit.circuit import Parameter, ParameterExpression
+from qiskit.tools import parallel_map
 
 from qiskit.aqua import AquaError
 
@@ -57,6 +58,195 @@ def pauli_measurement(circuit, pauli, qr, cr, barrier=False):
     return circuit
 
 
+def _pack_bits(bits):
+    """
+    Packs the rows of a boolean matrix into uint64 words, bit ``i`` of a row is stored at
+    bit ``i % 64`` of word ``i // 64``.
+
+    Args:
+        bits (numpy.ndarray): boolean matrix of shape (rows, num_bits)
+
+    Returns:
+        numpy.ndarray: uint64 matrix of shape (rows, ceil(num_bits / 64))
+    """
+    num_rows, num_bits = bits.shape
+    num_words = max(1, -(-num_bits // 64))
+    padded = np.zeros((num_rows, num_words * 64), dtype=bool)
+    padded[:, :num_bits] = bits
+    packed = np.packbits(padded, axis=1, bitorder='little')
+    return np.ascontiguousarray(packed).view('<u8').astype(np.uint64, copy=False)
+
+
+def _parity(words):
+    """ Parity of the number of set bits of each uint64 word. """
+    words = words.copy()
+    for shift in (32, 16, 8, 4, 2, 1):
+        words ^= words >> np.uint64(shift)
+    return (words & np.uint64(1)).astype(bool)
+
+
+def _pauli_bits_product(z_1, x_1, z_2, x_2):
+    """
+    Multiplies Paulis given by their z and x bits, with broadcasting over the leading axes.
+
+    Args:
+        z_1 (numpy.ndarray): the z bits of the left Paulis, the qubits along the last axis
+        x_1 (numpy.ndarray): the x bits of the left Paulis
+        z_2 (numpy.ndarray): the z bits of the right Paulis
+        x_2 (numpy.ndarray): the x bits of the right Paulis
+
+    Returns:
+        tuple(numpy.ndarray, numpy.ndarray, numpy.ndarray): the z bits and x bits of the
+        products, and the exponents ``k`` of their phases ``1j ** k``, as ``Pauli.sgn_prod``
+        computes them
+    """
+    z = z_1 ^ z_2
+    x = x_1 ^ x_2
+    # a Pauli with bits z, x is i^(x.z) X^x Z^z, and Z^z_1 X^x_2 = (-1)^(z_1.x_2) X^x_2 Z^z_1
+    phase = np.count_nonzero(z_1 & x_1, axis=-1) + np.count_nonzero(z_2 & x_2, axis=-1) \
+        + 2 * np.count_nonzero(z_1 & x_2, axis=-1) - np.count_nonzero(z & x, axis=-1)
+    return z, x, phase % 4
+
+
+def _merge_pauli_bits(z, x, coeffs, groups=None, return_inverse=False):
+    """
+    Sums the coefficients of identical Paulis given by their z and x bits. The leading axes of
+    the arguments are flattened.
+
+    Args:
+        z (numpy.ndarray): the z bits of the Paulis, the qubits along the last axis
+        x (numpy.ndarray): the x bits of the Paulis
+        coeffs (numpy.ndarray): the coefficients of the Paulis
+        groups (numpy.ndarray): if given, only identical Paulis of the same group are merged
+        return_inverse (bool): whether to also return the index of the distinct Pauli of each
+            of the given ones
+
+    Returns:
+        tuple(numpy.ndarray, numpy.ndarray, numpy.ndarray): the z bits, x bits and summed
+        coefficients of the distinct Paulis, in the order of their first appearance, followed
+        by the indices if ``return_inverse``
+    """
+    num_qubits = z.shape[-1]
+    z = z.reshape(-1, num_qubits)
+    x = x.reshape(-1, num_qubits)
+    coeffs = coeffs.ravel()
+    if len(coeffs) == 0:
+        if return_inverse:
+            return z, x, coeffs.astype(complex), np.zeros(0, dtype=int)
+        return z, x, coeffs.astype(complex)
+
+    keys = np.packbits(np.concatenate([z, x], axis=1), axis=1)
+    if groups is not None:
+        keys = np.concatenate([keys, groups.astype(np.int64)[:, None].view(np.uint8)], axis=1)
+    # pylint: disable=unsubscriptable-object
+    keys = np.ascontiguousarray(keys).view(np.dtype((np.void, keys.shape[1]))).ravel()
+    _, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+    # renumber the distinct Paulis by first appearance
+    order = np.argsort(first)
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+    rank = rank[inverse.ravel()]
+    merged = np.zeros(len(order), dtype=complex)
+    np.add.at(merged, rank, coeffs)
+    distinct = first[order]
+    if return_inverse:
+        return z[distinct], x[distinct], merged, rank
+    return z[distinct], x[distinct], merged
+
+
+def _counts_to_packed_outcomes(data):
+    """
+    Converts a counts dictionary into a packed outcome matrix, qubit ``i`` being the ``i``-th
+    character from the right of a key.
+
+    Args:
+        data (dict): a dictionary of the form data = {'00000': 10} ({str: int})
+
+    Returns:
+        tuple(numpy.ndarray, numpy.ndarray): the uint64 outcome matrix, one row per key, and the
+            counts of each key
+    """
+    keys = [key.replace(' ', '') for key in data.keys()]
+    counts = np.fromiter(data.values(), dtype=float, count=len(keys))
+    num_bits = len(keys[0]) if keys else 0
+    chars = np.frombuffer(''.join(keys).encode('ascii'), dtype=np.uint8)
+    bits = (chars.reshape(len(keys), num_bits) == ord('1'))[:, ::-1]
+    return _pack_bits(bits), counts
+
+
+def pauli_signs(data, paulis, chunk_size=4096):
+    """
+    Computes the eigenvalue, +1 or -1, of every Pauli on every measured outcome.
+    Appropriate post-rotations on the state are assumed.
+
+    The outcomes are packed into uint64 words once, and the parities of all Paulis are
+    computed with bitwise operations on blocks of ``chunk_size`` outcomes.
+
+    Args:
+        data (dict): a dictionary of the form data = {'00000': 10} ({str: int})
+        paulis (list[Pauli]): the Paulis
+        chunk_size (int): number of outcomes processed at once
+
+    Returns:
+        tuple(numpy.ndarray, numpy.ndarray): the signs, of shape (len(data), len(paulis)),
+            and the counts of each outcome
+    """
+    outcomes, counts = _counts_to_packed_outcomes(data)
+    if not paulis:
+        return np.ones((len(counts), 0)), counts
+    masks = _pack_bits(np.asarray([np.logical_or(pauli.z, pauli.x) for pauli in paulis]))
+    num_words = min(outcomes.shape[1], masks.shape[1])
+    outcomes = outcomes[:, :num_words]
+    masks = masks[:, :num_words]
+    signs = np.empty((outcomes.shape[0], masks.shape[0]))
+    for start in range(0, outcomes.shape[0], chunk_size):
+        block = outcomes[start:start + chunk_size]
+        # xor-ing the words keeps the parity of their popcount
+        # pylint: disable=no-member
+        folded = np.bitwise_xor.reduce(block[:, None, :] & masks[None, :, :], axis=2)
+        signs[start:start + chunk_size] = np.where(_parity(folded), -1.0, 1.0)
+    return signs, counts
+
+
+def measure_paulis_z(data, paulis):
+    """
+    Computes the expectation values of several Paulis from the same measurement outcome.
+    Appropriate post-rotations on the state are assumed.
+
+    Args:
+        data (dict): a dictionary of the form data = {'00000': 10} ({str: int})
+        paulis (list[Pauli]): the Paulis
+
+    Returns:
+        numpy.ndarray: Expected values of paulis given data
+    """
+    signs, counts = pauli_signs(data, paulis)
+    return counts @ signs / np.sum(counts)
+
+
+def covariance_matrix(data, paulis, avgs=None):
+    """
+    Computes the covariance matrix of several Paulis, given the measurement outcome.
+    Appropriate post-rotations on the state are assumed.
+
+    Args:
+        data (dict): a dictionary of the form data = {'00000': 10} ({str:int})
+        paulis (list[Pauli]): the Paulis
+        avgs (numpy.ndarray): expectation values of paulis on `data`, computed if None
+
+    Returns:
+        numpy.ndarray: the covariance matrix of shape (len(paulis), len(paulis))
+    """
+    signs, counts = pauli_signs(data, paulis)
+    num_shots = np.sum(counts)
+    if num_shots == 1:
+        return np.zeros((len(paulis), len(paulis)))
+    if avgs is None:
+        avgs = counts @ signs / num_shots
+    centered = signs - np.asarray(avgs)
+    return (centered.T * counts) @ centered / (num_shots - 1)
+
+
 def measure_pauli_z(data, pauli):
     """
     Appropriate post-rotations on the state are assumed.
@@ -68,16 +258,7 @@ def measure_pauli_z(data, pauli):
     Returns:
         float: Expected value of paulis given data
     """
-    observable = 0.0
-    num_shots = sum(data.values())
-    p_z_or_x = np.logical_or(pauli.z, pauli.x)
-    for key, value in data.items():
-        bitstr = np.asarray(list(key))[::-1].astype(np.int).astype(np.bool)
-        # pylint: disable=no-member
-        sign = -1.0 if np.logical_xor.reduce(np.logical_and(bitstr, p_z_or_x)) else 1.0
-        observable += sign * value
-    observable /= num_shots
-    return observable
+    return float(measure_paulis_z(data, [pauli])[0])
 
 
 def covariance(data, pauli_1, pauli_2, avg_1, avg_2):
@@ -96,22 +277,14 @@ def covariance(data, pauli_1, pauli_2, avg_1, avg_2):
     Returns:
         float: the element of the covariance matrix between two Paulis
     """
-    cov = 0.0
     num_shots = sum(data.values())
 
     if num_shots == 1:
-        return cov
+        return 0.0
 
-    p1_z_or_x = np.logical_or(pauli_1.z, pauli_1.x)
-    p2_z_or_x = np.logical_or(pauli_2.z, pauli_2.x)
-    for key, value in data.items():
-        bitstr = np.asarray(list(key))[::-1].astype(np.int).astype(np.bool)
-        # pylint: disable=no-member
-        sign_1 = -1.0 if np.logical_xor.reduce(np.logical_and(bitstr, p1_z_or_x)) else 1.0
-        sign_2 = -1.0 if np.logical_xor.reduce(np.logical_and(bitstr, p2_z_or_x)) else 1.0
-        cov += (sign_1 - avg_1) * (sign_2 - avg_2) * value
-    cov /= (num_shots - 1)
-    return cov
+    signs, counts = pauli_signs(data, [pauli_1, pauli_2])
+    cov = np.sum((signs[:, 0] - avg_1) * (signs[:, 1] - avg_2) * counts)
+    return float(cov / (num_shots - 1))
 
 
 def row_echelon_F2(matrix_in):  # pylint: disable=invalid-name
@@ -227,6 +400,56 @@ def check_commutativity(op_1, op_2, anti=False):
     return bool(com.is_empty())
 
 
+def qubitwise_noncommuting_pairs(paulis_x, paulis_z, num_processes=1, block_size=None):
+    """
+    Finds all pairs of Paulis that do not commute qubit-wise, i.e. the edges of the graph whose
+    coloring gives the tensor product basis (TPB) groups.
+
+    The Paulis are packed into uint64 words of their x and z bits, and the pairs are found
+    block by block of rows, so the memory needed is bounded by the block size rather than
+    growing with the square of the number of Paulis.
+
+    Args:
+        paulis_x (numpy.ndarray): boolean matrix of shape (num_paulis, num_qubits) of x bits
+        paulis_z (numpy.ndarray): boolean matrix of shape (num_paulis, num_qubits) of z bits
+        num_processes (int): number of processes the blocks are distributed over
+        block_size (int): number of rows per block, by default chosen to keep each
+            intermediate array at about 2**22 words
+
+    Returns:
+        tuple(numpy.ndarray, numpy.ndarray): the indices (i, j), with i < j, of the pairs
+    """
+    x_words = _pack_bits(np.asarray(paulis_x, dtype=bool))
+    z_words = _pack_bits(np.asarray(paulis_z, dtype=bool))
+    num_paulis, num_words = x_words.shape
+    if num_paulis < 2:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    if block_size is None:
+        block_size = max(1, (1 << 22) // (num_paulis * num_words))
+    bounds = [(start, min(start + block_size, num_paulis))
+              for start in range(0, num_paulis - 1, block_size)]
+    results = parallel_map(_qubitwise_noncommuting_block, bounds,
+                           task_args=(x_words, z_words), num_processes=num_processes)
+    rows = np.concatenate([res[0] for res in results])
+    cols = np.concatenate([res[1] for res in results])
+    return rows, cols
+
+
+def _qubitwise_noncommuting_block(bounds, x_words, z_words):
+    start, stop = bounds
+    x_block, z_block = x_words[start:stop, None, :], z_words[start:stop, None, :]
+    # only the columns j > i of the block are needed
+    x_rest, z_rest = x_words[None, start + 1:, :], z_words[None, start + 1:, :]
+    # a qubit breaks the commutation if both Paulis act on it with different single-qubit Paulis
+    conflict = (x_block | z_block) & (x_rest | z_rest) & ((x_block ^ x_rest) | (z_block ^ z_rest))
+    # pylint: disable=no-member
+    noncommuting = np.bitwise_or.reduce(conflict, axis=2) != 0
+    rows, cols = np.nonzero(noncommuting)
+    cols += start + 1
+    keep = cols > rows + start
+    return rows[keep] + start, cols[keep]
+
+
 def evolution_instruction(pauli_list, evo_time, num_time_slices,
                           controlled=False, power=1,
                           use_basis_gates=True, shallow_slicing=False,
@@ -18,14 +18,16 @@ import copy
 
 import numpy as np
 
+from .common import qubitwise_noncommuting_pairs
+
 
 class PauliGraph:
     """Pauli Graph."""
 
-    def __init__(self, paulis, mode="largest-degree"):
+    def __init__(self, paulis, mode="largest-degree", num_processes=1):
         self.nodes, self.weights = self._create_nodes(paulis)  # must be pauli list
         self._nqbits = self._get_nqbits()
-        self.edges = self._create_edges()
+        self.edges = self._create_edges(num_processes)
         self._grouped_paulis = self._coloring(mode)
 
     def _create_nodes(self, paulis):
@@ -48,27 +50,28 @@ class PauliGraph:
             assert nqbits == self.nodes[i].num_qubits, "different number of qubits"
         return nqbits
 
-    def _create_edges(self):
+    def _create_edges(self, num_processes=1):
         """
         Create edges (i,j) if i and j is not commutable under Paulis.
 
+        Args:
+            num_processes (int): number of processes used to find the edges
+
         Returns:
             dict: dictionary of graph connectivity with node index as key and
                     list of neighbor as values
         """
-        # pylint: disable=invalid-name
-        conv = {
-            'I': 0,
-            'X': 1,
-            'Y': 2,
-            'Z': 3
-        }
-        a = np.array([[conv[e] for e in reversed(n.to_label())] for n in self.nodes], dtype=np.int8)
-        b = a[:, None]
-        # i and j are commutable with TPB if c[i, j] is True
-        c = (((a * b) * (a - b)) == 0).all(axis=2)
-        # pylint: disable=singleton-comparison
-        edges = {i: np.where(c[i] == False)[0] for i in range(len(self.nodes))}  # noqa
+        num_nodes = len(self.nodes)
+        rows, cols = qubitwise_noncommuting_pairs([n.x for n in self.nodes],
+                                                  [n.z for n in self.nodes],
+                                                  num_processes=num_processes)
+        # both directions, grouped by source node
+        sources = np.concatenate([rows, cols])
+        targets = np.concatenate([cols, rows])
+        order = np.lexsort((targets, sources))
+        sources, targets = sources[order], targets[order]
+        splits = np.searchsorted(sources, np.arange(num_nodes + 1))
+        edges = {i: targets[splits[i]:splits[i + 1]] for i in range(num_nodes)}
         return edges
 
     def _coloring(self, mode="largest-degree"):
@@ -28,9 +28,10 @@ from qiskit.tools.events import TextProgressBar
 
 from qiskit.aqua import AquaError, aqua_globals, MissingOptionalLibraryError
 from .base_operator import LegacyBaseOperator
-from .common import (measure_pauli_z, covariance, pauli_measurement,
+from .common import (pauli_signs, pauli_measurement,
                      kernel_F2, suzuki_expansion_slice_pauli_list,
-                     check_commutativity, evolution_instruction)
+                     check_commutativity, evolution_instruction,
+                     _merge_pauli_bits, _pauli_bits_product)
 
 logger = logging.getLogger(__name__)
 
@@ -369,20 +370,19 @@ class WeightedPauliOperator(LegacyBaseOperator):
         # pauli and tpb grouped pauli
         # should have a better way to rebuild the basis here.
         new_basis = []
+        new_basis_table = {}
         for basis, indices in op.basis:
-            new_indices = []
-            found = False
-            if new_basis:
-                for b, ind in new_basis:
-                    if b == basis:
-                        new_indices = ind
-                        found = True
-                        break
+            basis_label = basis.to_label()
+            new_indices = new_basis_table.get(basis_label, None)
+            found = new_indices is not None
+            if not found:
+                new_indices = []
             for idx in indices:
                 new_idx = old_to_new_indices[idx]
                 if new_idx is not None and new_idx not in new_indices:
                     new_indices.append(new_idx)
             if new_indices and not found:
+                new_basis_table[basis_label] = new_indices
                 new_basis.append((basis, new_indices))
         op._basis = new_basis
         op.chop(0.0)
@@ -809,20 +809,17 @@ class WeightedPauliOperator(LegacyBaseOperator):
     @staticmethod
     def _routine_compute_mean_and_var(args):
         paulis, measured_results = args
-        avg_paulis = []
-        avg = 0.0
+        weights = np.asarray([weight for weight, _ in paulis])
+        signs, counts = pauli_signs(measured_results, [pauli for _, pauli in paulis])
+        num_shots = np.sum(counts)
+        avg_paulis = counts @ signs / num_shots
+        avg = weights @ avg_paulis
+
+        # sum_ij w_i w_j cov_ij, without forming the covariance matrix
         variance = 0.0
-        for weight, pauli in paulis:
-            observable = measure_pauli_z(measured_results, pauli)
-            avg += weight * observable
-            avg_paulis.append(observable)
-
-        for idx_1, weighted_pauli_1 in enumerate(paulis):
-            weight_1, pauli_1 = weighted_pauli_1
-            for idx_2, weighted_pauli_2 in enumerate(paulis):
-                weight_2, pauli_2 = weighted_pauli_2
-                variance += weight_1 * weight_2 * covariance(measured_results, pauli_1, pauli_2,
-                                                             avg_paulis[idx_1], avg_paulis[idx_2])
+        if num_shots != 1:
+            centered = (signs - avg_paulis) @ weights
+            variance = np.sum(counts * centered * centered) / (num_shots - 1)
 
         return avg, variance
 
@@ -1172,6 +1169,9 @@ class Z2Symmetries:
         Taper an operator based on the z2_symmetries info and sector defined by `tapering_values`.
         The `tapering_values` will be stored into the resulted operator for a record.
 
+        The Clifford conjugation and the tapering are computed on the z and x bits of all the
+        Paulis at once, and the operators of all the sectors are tapered together.
+
         Args:
             operator (WeightedPauliOperator): the to-be-tapered operator.
             tapering_values (list[int], optional): if None, returns operators at each sector;
@@ -1193,36 +1193,57 @@ class Z2Symmetries:
             logger.warning("The operator is empty, return the empty operator directly.")
             return operator
 
-        for clifford in self.cliffords:
-            operator = clifford * operator * clifford
-
         tapering_values = tapering_values if tapering_values is not None else self._tapering_values
-
-        def _taper(op, curr_tapering_values):
-            z2_symmetries = self.copy()
-            z2_symmetries.tapering_values = curr_tapering_values
-            operator_out = WeightedPauliOperator(paulis=[], z2_symmetries=z2_symmetries,
-                                                 name=operator.name)
-            for pauli_term in op.paulis:
-                coeff_out = pauli_term[0]
-                for idx, qubit_idx in enumerate(self._sq_list):
-                    if not (not pauli_term[1].z[qubit_idx] and not pauli_term[1].x[qubit_idx]):
-                        coeff_out = curr_tapering_values[idx] * coeff_out
-                z_temp = np.delete(pauli_term[1].z.copy(), np.asarray(self._sq_list))
-                x_temp = np.delete(pauli_term[1].x.copy(), np.asarray(self._sq_list))
-                pauli_term_out = WeightedPauliOperator(paulis=[[coeff_out, Pauli(z_temp, x_temp)]])
-                operator_out += pauli_term_out
-            operator_out.chop(0.0)
-            return operator_out
-
         if tapering_values is None:
-            tapered_ops = []
-            for coeff in itertools.product([1, -1], repeat=len(self._sq_list)):
-                tapered_ops.append(_taper(operator, list(coeff)))
+            sectors = list(itertools.product([1, -1], repeat=len(self._sq_list)))
         else:
-            tapered_ops = _taper(operator, tapering_values)
-
-        return tapered_ops
+            sectors = [tapering_values]
+
+        z = np.asarray([pauli.z for _, pauli in operator.paulis], dtype=bool)
+        x = np.asarray([pauli.x for _, pauli in operator.paulis], dtype=bool)
+        coeffs = np.asarray([weight for weight, _ in operator.paulis], dtype=complex)
+
+        # conjugate with each Clifford (S + X) / sqrt(2) on the bits of all the Paulis at once,
+        # the products are ordered as the terms of clifford * operator * clifford
+        for symmetry, sq_pauli in zip(self._symmetries, self._sq_paulis):
+            c_z = np.asarray([symmetry.z, sq_pauli.z], dtype=bool)
+            c_x = np.asarray([symmetry.x, sq_pauli.x], dtype=bool)
+            z, x, phases = _pauli_bits_product(c_z[:, None], c_x[:, None], z[None], x[None])
+            z, x, coeffs = _merge_pauli_bits(z, x, coeffs[None] * 1j ** phases / np.sqrt(2))
+            z, x, phases = _pauli_bits_product(z[:, None], x[:, None], c_z[None], c_x[None])
+            z, x, coeffs = _merge_pauli_bits(z, x, coeffs[:, None] * 1j ** phases / np.sqrt(2))
+            keep = coeffs != 0
+            z, x, coeffs = z[keep], x[keep], coeffs[keep]
+
+        # each term is multiplied by the tapering values of the tapered qubits on which it is not
+        # the identity, the sign of every term is computed for all the sectors together
+        sq_list = np.asarray(self._sq_list)
+        non_identity = z[:, sq_list] | x[:, sq_list]
+        sector_values = np.asarray(sectors)
+        signs = np.prod(np.where(non_identity[None], sector_values[:, None, :], 1), axis=2)
+        z, x, _, rank = _merge_pauli_bits(np.delete(z, sq_list, axis=1),
+                                          np.delete(x, sq_list, axis=1), coeffs,
+                                          return_inverse=True)
+        num_paulis = len(z)
+        indices = (np.arange(len(sectors))[:, None] * num_paulis + rank[None]).ravel()
+        sector_coeffs = (signs * coeffs[None]).ravel()
+        sector_coeffs = np.bincount(indices, weights=sector_coeffs.real,
+                                    minlength=len(sectors) * num_paulis) \
+            + 1j * np.bincount(indices, weights=sector_coeffs.imag,
+                               minlength=len(sectors) * num_paulis)
+        sector_coeffs = sector_coeffs.reshape(len(sectors), num_paulis)
+
+        tapered_ops = []
+        for sector, coeffs in zip(sectors, sector_coeffs):
+            z2_symmetries = self.copy()
+            z2_symmetries.tapering_values = list(sector)
+            keep = coeffs != 0
+            tapered_ops.append(WeightedPauliOperator(
+                paulis=[[coeff, Pauli(z_i, x_i)]
+                        for coeff, z_i, x_i in zip(coeffs[keep].tolist(), z[keep], x[keep])],
+                z2_symmetries=z2_symmetries, name=operator.name))
+
+        return tapered_ops[0] if tapering_values is not None else tapered_ops
 
     @staticmethod
     def two_qubit_reduction(operator, num_particles):
@@ -12,13 +12,14 @@
 
 """ SummedOp Class """
 
-from typing import List, Union, cast
+from typing import List, Union, Optional, Dict, Tuple, cast
 import warnings
 
 import numpy as np
 
 from qiskit import QuantumCircuit
 from qiskit.circuit import ParameterExpression
+from qiskit.quantum_info import Pauli
 from .list_op import ListOp
 from ..legacy.base_operator import LegacyBaseOperator
 from ..legacy.weighted_pauli_operator import WeightedPauliOperator
@@ -85,31 +86,104 @@ class SummedOp(ListOp):
 
         E.g., ``SummedOp([2 * X ^ Y, X ^ Y]).collapse_summands() -> SummedOp([3 * X ^ Y])``.
 
+        ``PauliOp`` summands are matched through a dictionary keyed on the bytes of their x and
+        z bits, so collapsing a sum of Paulis takes linear time. Other summands are compared
+        pairwise by equality.
+
         Returns:
             A simplified ``SummedOp`` equivalent to self.
         """
-        from qiskit.aqua.operators import PrimitiveOp
+        from qiskit.aqua.operators import PrimitiveOp, PauliOp
         oplist = []  # type: List[OperatorBase]
         coeffs = []  # type: List[Union[int, float, complex, ParameterExpression]]
+        pauli_indices = {}  # type: Dict[Tuple[bytes, bytes], int]
+        other_indices = []  # type: List[int]
+
+        def find_other(new_op):
+            for index in other_indices:
+                if oplist[index] == new_op:
+                    return index
+            return None
+
         for op in self.oplist:
-            if isinstance(op, PrimitiveOp):
+            if isinstance(op, PauliOp):
+                key = (op.primitive.x.tobytes(), op.primitive.z.tobytes())
+                index = pauli_indices.get(key)
+                if index is None:
+                    pauli_indices[key] = len(oplist)
+                    oplist.append(PauliOp(op.primitive))
+                    coeffs.append(op.coeff * self.coeff)
+                else:
+                    coeffs[index] += op.coeff * self.coeff
+            elif isinstance(op, PrimitiveOp):
                 new_op = PrimitiveOp(op.primitive)
                 new_coeff = op.coeff * self.coeff
-                if new_op in oplist:
-                    index = oplist.index(new_op)
+                index = find_other(new_op)
+                if index is not None:
                     coeffs[index] += new_coeff
                 else:
+                    other_indices.append(len(oplist))
                     oplist.append(new_op)
                     coeffs.append(new_coeff)
             else:
-                if op in oplist:
-                    index = oplist.index(op)
+                index = find_other(op)
+                if index is not None:
                     coeffs[index] += self.coeff
                 else:
+                    other_indices.append(len(oplist))
                     oplist.append(op)
                     coeffs.append(self.coeff)
         return SummedOp([op * coeff for op, coeff in zip(oplist, coeffs)])  # type: ignore
 
+    @classmethod
+    def from_pauli_arrays(cls,
+                          z: np.ndarray,
+                          x: np.ndarray,
+                          coeffs: Union[List[Union[int, float, complex]], np.ndarray]
+                          ) -> OperatorBase:
+        """Build the reduced sum of Paulis given as arrays of their z and x bits, in one pass.
+
+        Duplicate Paulis are merged by adding their coefficients, in the order of their first
+        appearance, which gives the same result as summing the corresponding ``PauliOp``s and
+        calling :meth:`reduce`, without creating the intermediate operators.
+
+        Args:
+            z: Boolean matrix of shape (num_terms, num_qubits) of the z bits of the Paulis.
+            x: Boolean matrix of shape (num_terms, num_qubits) of the x bits of the Paulis.
+            coeffs: The coefficient of each Pauli.
+
+        Returns:
+            A ``SummedOp`` of ``PauliOp``s, or a single ``PauliOp`` if all Paulis are equal.
+
+        Raises:
+            ValueError: the shapes of the arguments do not match or there are no terms.
+        """
+        from qiskit.aqua.operators import PauliOp
+        z = np.asarray(z, dtype=bool)
+        x = np.asarray(x, dtype=bool)
+        coeffs = np.asarray(coeffs)
+        if z.ndim != 2 or z.shape != x.shape or coeffs.shape != (z.shape[0],):
+            raise ValueError('z and x must be matrices of the same shape with one coefficient '
+                             'per row, not {}, {} and {}.'.format(z.shape, x.shape, coeffs.shape))
+        if z.shape[0] == 0:
+            raise ValueError('At least one Pauli is needed.')
+
+        packed = np.ascontiguousarray(np.packbits(np.hstack([z, x]), axis=1))
+        rows = packed.view(np.dtype((np.void, packed.shape[1]))).ravel()
+        _, first, inverse = np.unique(rows, return_index=True, return_inverse=True)
+        # renumber the unique Paulis by first appearance
+        order = np.argsort(first)
+        rank = np.empty_like(order)
+        rank[order] = np.arange(len(order))
+        sums = np.zeros(len(order), dtype=coeffs.dtype)
+        np.add.at(sums, rank[inverse.ravel()], coeffs)
+
+        oplist = [PauliOp(Pauli(z=z[i], x=x[i]), coeff=coeff)
+                  for i, coeff in zip(first[order], sums.tolist())]
+        if len(oplist) == 1:
+            return oplist[0]
+        return cls(oplist)  # type: ignore
+
     # TODO be smarter about the fact that any two ops in oplist could be evaluated for sum.
     def reduce(self) -> OperatorBase:
         """Try collapsing list or trees of sums.
@@ -121,7 +195,13 @@ class SummedOp(ListOp):
             A collapsed version of self, if possible.
         """
         # reduce constituents
-        reduced_ops = sum(op.reduce() for op in self.oplist) * self.coeff
+        reduced_list = [op.reduce() for op in self.oplist]
+        paulis = self._flatten_paulis(reduced_list)
+        if paulis:
+            # same as summing them up, without creating a SummedOp per addition
+            reduced_ops = SummedOp(paulis) * self.coeff  # type: OperatorBase
+        else:
+            reduced_ops = sum(reduced_list) * self.coeff
 
         # group duplicate operators
         if isinstance(reduced_ops, SummedOp):
@@ -132,6 +212,25 @@ class SummedOp(ListOp):
         else:
             return cast(OperatorBase, reduced_ops)
 
+    @staticmethod
+    def _flatten_paulis(oplist: List[OperatorBase]) -> Optional[List[OperatorBase]]:
+        """Flatten the ``PauliOp``s and ``SummedOp``s of ``PauliOp``s in oplist into a list of
+        ``PauliOp``s, or return None if oplist contains any other operator."""
+        from qiskit.aqua.operators import PauliOp
+        paulis = []  # type: List[OperatorBase]
+        for op in oplist:
+            if isinstance(op, PauliOp):
+                paulis.append(op)
+            elif isinstance(op, SummedOp) and all(isinstance(sub_op, PauliOp)
+                                                  for sub_op in op.oplist):
+                paulis.extend(op.oplist if op.coeff == 1
+                              else [sub_op.mul(op.coeff) for sub_op in op.oplist])
+            else:
+                return None
+        if len({op.num_qubits for op in paulis}) > 1:
+            return None
+        return paulis
+
     def to_circuit(self) -> QuantumCircuit:
         """Returns the quantum circuit, representing the SummedOp. In the first step,
         the SummedOp is converted to MatrixOp. This is straightforward for most operators,
@@ -42,6 +42,7 @@ Primitive Operators
    CircuitOp
    MatrixOp
    PauliOp
+   PauliSumOp
 
 """
 
@@ -49,8 +50,10 @@ from .primitive_op import PrimitiveOp
 from .pauli_op import PauliOp
 from .matrix_op import MatrixOp
 from .circuit_op import CircuitOp
+from .pauli_sum_op import PauliSumOp
 
 __all__ = ['PrimitiveOp',
            'PauliOp',
            'MatrixOp',
-           'CircuitOp']
+           'CircuitOp',
+           'PauliSumOp']
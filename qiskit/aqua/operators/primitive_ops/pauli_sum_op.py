@@ -0,0 +1,516 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+""" PauliSumOp Class """
+
+from typing import Union, Set, Dict, List, Optional, Tuple, cast
+import logging
+import numpy as np
+from scipy.sparse import spmatrix
+from scipy.sparse.linalg import LinearOperator
+
+from qiskit.circuit import ParameterExpression, Instruction
+from qiskit.quantum_info import Pauli, SparsePauliOp, PauliTable
+
+from ..operator_base import OperatorBase
+from .primitive_op import PrimitiveOp
+from .pauli_op import PauliOp
+from ..list_ops.summed_op import SummedOp
+from ..list_ops.tensored_op import TensoredOp
+from ..legacy.weighted_pauli_operator import WeightedPauliOperator
+from ... import AquaError
+
+logger = logging.getLogger(__name__)
+
+
+class PauliSumOp(PrimitiveOp):
+    """ Class for Operators which are sums of Paulis, backed by Terra's ``SparsePauliOp`` module.
+
+    The whole sum is stored as boolean x and z matrices with one row per Pauli term plus a
+    vector of coefficients, rather than one ``PauliOp`` object per term as in a ``SummedOp``,
+    so that addition, composition, tensoring and simplification are vectorized over the terms.
+
+    """
+
+    def __init__(self,
+                 primitive: SparsePauliOp = None,
+                 coeff: Union[int, float, complex, ParameterExpression] = 1.0) -> None:
+        """
+            Args:
+                primitive: The SparsePauliOp which defines the behavior of the underlying function.
+                coeff: A coefficient multiplying the primitive.
+
+            Raises:
+                TypeError: invalid parameters.
+        """
+        if not isinstance(primitive, SparsePauliOp):
+            raise TypeError(
+                'PauliSumOp can only be instantiated with SparsePauliOp, not {}'.format(
+                    type(primitive)))
+        super().__init__(primitive, coeff=coeff)
+
+    def primitive_strings(self) -> Set[str]:
+        return {'SparsePauliOp'}
+
+    @property
+    def num_qubits(self) -> int:
+        return self.primitive.num_qubits  # type: ignore
+
+    @property
+    def coeffs(self) -> np.ndarray:
+        """ Return the coefficients of the Pauli terms, including the coefficient of the operator.
+
+        Returns:
+            The coefficients.
+        """
+        return self.coeff * self.primitive.coeffs  # type: ignore
+
+    def __len__(self) -> int:
+        """ Return the number of Pauli terms.
+
+        Returns:
+            The number of terms.
+        """
+        return self.primitive.size  # type: ignore
+
+    def add(self, other: OperatorBase) -> OperatorBase:
+        if not self.num_qubits == other.num_qubits:
+            raise ValueError(
+                'Sum over operators with different numbers of qubits, {} and {}, is not well '
+                'defined'.format(self.num_qubits, other.num_qubits))
+
+        if isinstance(other, PauliOp):
+            other = PauliSumOp.from_pauli_ops(other)
+
+        if isinstance(other, PauliSumOp):
+            if self.coeff == other.coeff:
+                return PauliSumOp(self.primitive + other.primitive,  # type: ignore
+                                  coeff=self.coeff)
+            if not isinstance(self.coeff, ParameterExpression) and \
+                    not isinstance(other.coeff, ParameterExpression):
+                return PauliSumOp(self.coeff * self.primitive +  # type: ignore
+                                  other.coeff * other.primitive)
+
+        return SummedOp([self, other])
+
+    def adjoint(self) -> OperatorBase:
+        return PauliSumOp(self.primitive.adjoint(), coeff=np.conj(self.coeff))  # type: ignore
+
+    def equals(self, other: OperatorBase) -> bool:
+        if isinstance(other, (PauliOp, SummedOp)):
+            try:
+                other = PauliSumOp.from_pauli_ops(other)
+            except TypeError:
+                return False
+        if not isinstance(other, PauliSumOp) or self.num_qubits != other.num_qubits:
+            return False
+
+        if isinstance(self.coeff, ParameterExpression) or \
+                isinstance(other.coeff, ParameterExpression):
+            if self.coeff != other.coeff:
+                return False
+            self_op, other_op = self.primitive, other.primitive
+        else:
+            self_op = self.coeff * self.primitive  # type: ignore
+            other_op = other.coeff * other.primitive  # type: ignore
+
+        # simplify merges duplicates and drops zero terms, sorting makes the order irrelevant
+        self_op = self_op.simplify()
+        other_op = other_op.simplify()
+        if self_op.size != other_op.size:
+            return False
+        self_order = self_op.table.argsort()
+        other_order = other_op.table.argsort()
+        return self_op.table[self_order] == other_op.table[other_order] and \
+            np.allclose(self_op.coeffs[self_order], other_op.coeffs[other_order])
+
+    def _expand_dim(self, num_qubits: int) -> 'PauliSumOp':
+        # the operator stays on the high qubits, as for PauliOp and MatrixOp
+        return PauliSumOp(
+            self.primitive.tensor(SparsePauliOp(Pauli(label='I' * num_qubits))),  # type: ignore
+            coeff=self.coeff)
+
+    def tensor(self, other: OperatorBase) -> OperatorBase:
+        if isinstance(other, PauliOp):
+            other = PauliSumOp.from_pauli_ops(other)
+
+        if isinstance(other, PauliSumOp):
+            return PauliSumOp(self.primitive.tensor(other.primitive),  # type: ignore
+                              coeff=self.coeff * other.coeff)
+
+        return TensoredOp([self, other])
+
+    def permute(self, permutation: List[int]) -> 'PauliSumOp':
+        """Permutes the sequence of Pauli matrices of every term.
+
+        Args:
+            permutation: A list defining where each Pauli should be permuted. The Pauli at index
+                j of the primitive should be permuted to position permutation[j].
+
+        Returns:
+              A new PauliSumOp representing the permuted operator.
+
+        Raises:
+            AquaError: if indices do not define a new index for each qubit.
+        """
+        if len(permutation) != self.num_qubits:
+            raise AquaError("List of indices to permute must have the same size as Pauli Operator")
+        length = max(permutation) + 1  # size of list must be +1 larger then its max index
+        table = self.primitive.table  # type: ignore
+        x = np.zeros((table.size, length), dtype=bool)
+        z = np.zeros((table.size, length), dtype=bool)
+        x[:, permutation] = table.X
+        z[:, permutation] = table.Z
+        return PauliSumOp(SparsePauliOp(PauliTable(np.hstack([x, z])),
+                                        coeffs=self.primitive.coeffs),  # type: ignore
+                          coeff=self.coeff)
+
+    def compose(self, other: OperatorBase,
+                permutation: Optional[List[int]] = None, front: bool = False) -> OperatorBase:
+
+        new_self, other = self._expand_shorter_operator_and_permute(other, permutation)
+        new_self = cast(PauliSumOp, new_self)
+
+        if front:
+            return other.compose(new_self)
+
+        table = new_self.primitive.table  # type: ignore
+        # If self is a multiple of the identity, just return other.
+        if not np.any(table.X) and not np.any(table.Z):
+            return other * (new_self.coeff * np.sum(new_self.primitive.coeffs))  # type: ignore
+
+        if isinstance(other, PauliOp):
+            other = PauliSumOp.from_pauli_ops(other)
+
+        # Both Pauli sums, note that dot is the matrix product self * other
+        if isinstance(other, PauliSumOp):
+            return PauliSumOp(new_self.primitive.dot(other.primitive),  # type: ignore
+                              coeff=new_self.coeff * other.coeff)
+
+        # pylint: disable=cyclic-import,import-outside-toplevel
+        from .circuit_op import CircuitOp
+        from ..state_fns.circuit_state_fn import CircuitStateFn
+        if isinstance(other, (CircuitOp, CircuitStateFn)):
+            return new_self.to_pauli_op().to_circuit_op().compose(other)  # type: ignore
+
+        return super(PauliSumOp, new_self).compose(other)
+
+    def to_matrix(self, massive: bool = False) -> np.ndarray:
+        OperatorBase._check_massive('to_matrix', True, self.num_qubits, massive)
+        # summing the sparse Pauli matrices is much cheaper than summing dense ones
+        return self.to_spmatrix().toarray()
+
+    def to_spmatrix(self) -> spmatrix:
+        """ Returns SciPy sparse matrix representation of the Operator.
+
+        Returns:
+            CSR sparse matrix representation of the Operator.
+        """
+        return self.primitive.to_matrix(sparse=True) * self.coeff  # type: ignore
+
+    def to_linear_operator(self) -> LinearOperator:
+        """ Returns a matrix-free SciPy ``LinearOperator`` representation of the Operator.
+
+        The Pauli terms are applied to vectors directly, as a bit flip of the amplitude indices
+        and a sign or phase, so that no matrix is built. This allows iterative solvers such as
+        ``scipy.sparse.linalg.eigsh`` to handle more qubits than with ``to_spmatrix``.
+
+        Returns:
+            The LinearOperator of dimension 2^num_qubits.
+
+        Raises:
+            TypeError: the coefficient is an unbound parameter.
+        """
+        if isinstance(self.coeff, ParameterExpression):
+            raise TypeError('Cannot convert Operator with unbound parameter {} to a '
+                            'LinearOperator'.format(self.coeff))
+        table = self.primitive.table  # type: ignore
+        return _PauliLinearOperator(table.Z, table.X,
+                                    self.coeff * self.primitive.coeffs)  # type: ignore
+
+    def __str__(self) -> str:
+        prim_str = ' + '.join('{} * {}'.format(_to_native(coeff), label)
+                              for label, coeff in self.primitive.to_list())  # type: ignore
+        if self.coeff == 1.0:
+            return prim_str
+        else:
+            return "{} * ({})".format(self.coeff, prim_str)
+
+    def eval(self,
+             front: Optional[Union[str, Dict[str, complex], np.ndarray, OperatorBase]] = None
+             ) -> Union[OperatorBase, float, complex]:
+        if front is None:
+            return self.to_matrix_op()
+
+        # pylint: disable=import-outside-toplevel,cyclic-import
+        from ..state_fns.state_fn import StateFn
+        from ..state_fns.dict_state_fn import DictStateFn
+        from ..state_fns.circuit_state_fn import CircuitStateFn
+        from ..list_ops.list_op import ListOp
+        from .circuit_op import CircuitOp
+
+        new_front = None
+
+        # For now, always do this. If it's not performant, we can be more granular.
+        if not isinstance(front, OperatorBase):
+            front = StateFn(front, is_measurement=False)
+
+        if isinstance(front, ListOp) and front.distributive:
+            new_front = front.combo_fn([self.eval(front.coeff * front_elem)  # type: ignore
+                                        for front_elem in front.oplist])
+
+        else:
+
+            if self.num_qubits != front.num_qubits:
+                raise ValueError(
+                    'eval does not support operands with differing numbers of qubits, '
+                    '{} and {}, respectively.'.format(
+                        self.num_qubits, front.num_qubits))
+
+            if isinstance(front, DictStateFn):
+
+                new_dict = {}  # type: Dict
+                table = self.primitive.table  # type: ignore
+                corrected_x_bits = table.X[:, ::-1]
+                corrected_z_bits = table.Z[:, ::-1]
+                # the phase of each term, Y = iXZ
+                y_factors = (1j ** np.sum(corrected_x_bits & corrected_z_bits, axis=1)) * \
+                    self.primitive.coeffs  # type: ignore
+
+                for bstr, v in front.primitive.items():
+                    bitstr = np.fromiter(bstr, dtype=int).astype(bool)
+                    new_b_strs = np.logical_xor(bitstr, corrected_x_bits).astype(int)
+                    z_factors = 1 - 2 * (np.sum(bitstr & corrected_z_bits, axis=1) % 2)
+                    amplitudes = v * z_factors * y_factors
+                    for new_b_str, amplitude in zip(new_b_strs, amplitudes):
+                        new_str = ''.join(map(str, new_b_str))
+                        new_dict[new_str] = amplitude + new_dict.get(new_str, 0)
+                new_front = StateFn(new_dict, coeff=self.coeff * front.coeff)
+
+            elif isinstance(front, StateFn) and front.is_measurement:
+                raise ValueError('Operator composed with a measurement is undefined.')
+
+            # Composable types with PauliSumOp
+            elif isinstance(front, (PauliSumOp, PauliOp, CircuitOp, CircuitStateFn)):
+                new_front = self.compose(front)
+
+            # Covers VectorStateFn and OperatorStateFn
+            elif isinstance(front, OperatorBase):
+                new_front = self.to_matrix_op().eval(front.to_matrix_op())  # type: ignore
+
+        return new_front
+
+    def exp_i(self) -> OperatorBase:
+        """ Return an ``OperatorBase`` equivalent to e^-iH for this operator H, evolving the
+        terms as a sum of ``PauliOp`` s. """
+        return self.to_pauli_op().exp_i()
+
+    def to_instruction(self) -> Instruction:
+        return self.to_matrix_op().to_circuit().to_instruction()  # type: ignore
+
+    def to_pauli_op(self, massive: bool = False) -> OperatorBase:
+        paulis = self.to_paulis()
+        if len(paulis) == 1:
+            return PauliOp(paulis[0][1], coeff=paulis[0][0] * self.coeff)
+        return SummedOp([PauliOp(pauli, coeff=coeff) for coeff, pauli in paulis],
+                        coeff=self.coeff)
+
+    def to_paulis(self) -> List[Tuple[Union[float, complex], Pauli]]:
+        """ Returns the terms of the sum, excluding the coefficient of the operator.
+
+        Returns:
+            A list of (coefficient, Pauli) pairs, with real coefficients converted to floats.
+        """
+        table = self.primitive.table  # type: ignore
+        coeffs = np.real_if_close(self.primitive.coeffs)  # type: ignore
+        return [(_to_native(coeff), Pauli(z=z, x=x))
+                for coeff, z, x in zip(coeffs, table.Z, table.X)]
+
+    def to_legacy_op(self, massive: bool = False) -> WeightedPauliOperator:
+        if isinstance(self.coeff, ParameterExpression):
+            try:
+                coeff = float(self.coeff)
+            except TypeError as ex:
+                raise TypeError('Cannot convert Operator with unbound parameter {} to Legacy '
+                                'Operator'.format(self.coeff)) from ex
+        else:
+            coeff = cast(float, self.coeff)
+        return WeightedPauliOperator(paulis=[[coeff * weight, pauli]
+                                             for weight, pauli in self.to_paulis()])
+
+    def reduce(self) -> OperatorBase:
+        """ Merges duplicate Pauli terms and removes terms with zero coefficients.
+
+        Returns:
+            The simplified PauliSumOp.
+        """
+        if isinstance(self.coeff, ParameterExpression):
+            return PauliSumOp(self.primitive.simplify(), coeff=self.coeff)  # type: ignore
+        return PauliSumOp((self.coeff * self.primitive).simplify())  # type: ignore
+
+    @classmethod
+    def from_list(cls,
+                  pauli_list: List[Tuple[str, Union[int, float, complex]]],
+                  coeff: Union[int, float, complex, ParameterExpression] = 1.0) -> 'PauliSumOp':
+        """ Construct from a list of Pauli labels and coefficients.
+
+        Args:
+            pauli_list: A list of (label, coefficient) pairs, e.g. ``[('XZ', 0.5), ('YI', 1)]``.
+            coeff: A coefficient multiplying the primitive.
+
+        Returns:
+            The PauliSumOp constructed from the pauli_list.
+        """
+        return cls(SparsePauliOp.from_list(pauli_list), coeff=coeff)
+
+    @classmethod
+    def from_pauli_ops(cls, operator: Union[PauliOp, SummedOp]) -> 'PauliSumOp':
+        """ Construct from a ``PauliOp`` or a ``SummedOp`` of ``PauliOp`` s.
+
+        Args:
+            operator: The operator to convert.
+
+        Returns:
+            The PauliSumOp with the same terms as operator.
+
+        Raises:
+            TypeError: operator is not a sum of PauliOps with numeric coefficients.
+        """
+        if isinstance(operator, PauliOp):
+            oplist, coeff = [operator], 1.0
+        elif isinstance(operator, SummedOp) and \
+                all(isinstance(op, PauliOp) for op in operator.oplist):
+            oplist, coeff = operator.oplist, operator.coeff
+        else:
+            raise TypeError('Can only convert a PauliOp or a SummedOp of PauliOps into a '
+                            'PauliSumOp, not {}'.format(operator))
+        if not oplist:
+            raise TypeError('Cannot convert an empty SummedOp into a PauliSumOp.')
+        if any(isinstance(op.coeff, ParameterExpression) for op in oplist):
+            raise TypeError('Cannot convert PauliOps with parameterized coefficients into a '
+                            'PauliSumOp.')
+        x = np.array([op.primitive.x for op in oplist], dtype=bool)
+        z = np.array([op.primitive.z for op in oplist], dtype=bool)
+        coeffs = np.array([op.coeff for op in oplist], dtype=complex)
+        return cls(SparsePauliOp(PauliTable(np.hstack([x, z])), coeffs=coeffs), coeff=coeff)
+
+    @classmethod
+    def from_legacy_op(cls, operator: WeightedPauliOperator) -> 'PauliSumOp':
+        """ Construct from a ``WeightedPauliOperator``.
+
+        Args:
+            operator: The legacy operator to convert.
+
+        Returns:
+            The PauliSumOp with the same terms as operator.
+
+        Raises:
+            TypeError: operator has no Pauli terms.
+        """
+        if operator.is_empty():
+            raise TypeError('Cannot convert an empty WeightedPauliOperator into a PauliSumOp.')
+        x = np.array([pauli.x for _, pauli in operator.paulis], dtype=bool)
+        z = np.array([pauli.z for _, pauli in operator.paulis], dtype=bool)
+        coeffs = np.array([weight for weight, _ in operator.paulis], dtype=complex)
+        return cls(SparsePauliOp(PauliTable(np.hstack([x, z])), coeffs=coeffs))
+
+
+class _PauliLinearOperator(LinearOperator):
+    """ Matrix-free sum of Paulis.
+
+    A Pauli with bits x, z maps amplitude k to k ^ x, multiplied by i^(x.z) (-1)^(k.z). Terms
+    with the same x bits are applied together: their signed coefficients are summed into one
+    diagonal, which is computed with a matrix product of the signs over the low and over the
+    high halves of the index bits, and the bit flip is a reversal of the tensor axes of x.
+    """
+
+    # total number of amplitudes of the diagonals which are kept rather than recomputed
+    _MAX_CACHED = 1 << 24
+
+    def __init__(self, paulis_z: np.ndarray, paulis_x: np.ndarray, coeffs: np.ndarray) -> None:
+        num_qubits = paulis_z.shape[1]
+        dim = 2 ** num_qubits
+        super().__init__(dtype=np.complex128, shape=(dim, dim))
+        self._paulis_z = paulis_z
+        self._paulis_x = paulis_x
+        self._coeffs = coeffs
+        self._num_qubits = num_qubits
+        self._low_bits = num_qubits // 2
+        powers = 2 ** np.arange(num_qubits, dtype=np.int64)
+        x_masks = paulis_x.astype(np.int64) @ powers
+        z_masks = paulis_z.astype(np.int64) @ powers
+        coeffs = np.asarray(coeffs, dtype=complex) * \
+            1j ** (np.count_nonzero(paulis_x & paulis_z, axis=1) % 4)
+
+        self._groups = []  # type: List[Tuple[Tuple[int, ...], np.ndarray, np.ndarray]]
+        unique_x, inverse = np.unique(x_masks, return_inverse=True)
+        for i, x_mask in enumerate(unique_x):
+            members = inverse == i
+            # qubit q is the axis num_qubits - 1 - q of the amplitude tensor
+            flip_axes = tuple(num_qubits - 1 - q for q in range(num_qubits)
+                              if (int(x_mask) >> q) & 1)
+            self._groups.append((flip_axes, z_masks[members], coeffs[members]))
+
+        self._diagonals = None  # type: Optional[List[np.ndarray]]
+        if len(self._groups) * dim <= self._MAX_CACHED:
+            self._diagonals = [self._diagonal(z, c) for _, z, c in self._groups]
+
+    def _diagonal(self, z_masks: np.ndarray, coeffs: np.ndarray) -> np.ndarray:
+        low_bits = self._low_bits
+        sign_low = _parity_signs(np.arange(2 ** low_bits, dtype=np.int64),
+                                 z_masks & (2 ** low_bits - 1))
+        sign_high = _parity_signs(np.arange(2 ** (self._num_qubits - low_bits), dtype=np.int64),
+                                  z_masks >> low_bits)
+        return ((sign_high.T * coeffs) @ sign_low).ravel()
+
+    def diagonal(self) -> np.ndarray:
+        """ Returns the diagonal of the operator. """
+        diag = np.zeros(self.shape[0], dtype=self.dtype)
+        for flip_axes, z_masks, coeffs in self._groups:
+            if not flip_axes:
+                diag += self._diagonal(z_masks, coeffs)
+        return diag
+
+    @property
+    def is_diagonal(self) -> bool:
+        """ Returns whether the operator is diagonal. """
+        return all(not flip_axes for flip_axes, _, _ in self._groups)
+
+    def _matvec(self, x: np.ndarray) -> np.ndarray:
+        vec = np.asarray(x, dtype=self.dtype).ravel()
+        out = np.zeros(self.shape[0], dtype=self.dtype)
+        tensor_shape = (2,) * self._num_qubits
+        out_tensor = out.reshape(tensor_shape)
+        for i, (flip_axes, z_masks, coeffs) in enumerate(self._groups):
+            diag = self._diagonals[i] if self._diagonals is not None \
+                else self._diagonal(z_masks, coeffs)
+            if flip_axes:
+                out_tensor += np.flip((diag * vec).reshape(tensor_shape), axis=flip_axes)
+            else:
+                out += diag * vec
+        return out
+
+    def _adjoint(self) -> LinearOperator:
+        # the Paulis are Hermitian, so only the coefficients are conjugated
+        return _PauliLinearOperator(self._paulis_z, self._paulis_x, np.conj(self._coeffs))
+
+
+def _parity_signs(indices: np.ndarray, masks: np.ndarray) -> np.ndarray:
+    """ Returns (-1)^popcount(index & mask), with one row per mask and one column per index. """
+    bits = indices[None, :] & masks[:, None]
+    for shift in (32, 16, 8, 4, 2, 1):
+        bits ^= bits >> shift
+    return 1 - 2 * (bits & 1)
+
+
+def _to_native(coeff: Union[np.number, complex]) -> Union[float, complex]:
+    return np.real_if_close(coeff).item()
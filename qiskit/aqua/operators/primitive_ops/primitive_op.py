@@ -49,7 +49,8 @@ class PrimitiveOp(OperatorBase):
     # pylint: disable=unused-argument
     def __new__(cls,
                 primitive: Union[Instruction, QuantumCircuit, List,
-                                 np.ndarray, spmatrix, MatrixOperator, Pauli] = None,
+                                 np.ndarray, spmatrix, MatrixOperator, Pauli,
+                                 SparsePauliOp] = None,
                 coeff: Union[int, float, complex, ParameterExpression] = 1.0) -> 'PrimitiveOp':
         """ A factory method to produce the correct type of PrimitiveOp subclass
         based on the primitive passed in. Primitive and coeff arguments are passed into
@@ -81,12 +82,17 @@ class PrimitiveOp(OperatorBase):
             from .pauli_op import PauliOp
             return PauliOp.__new__(PauliOp)
 
+        if isinstance(primitive, SparsePauliOp):
+            from .pauli_sum_op import PauliSumOp
+            return PauliSumOp.__new__(PauliSumOp)
+
         raise TypeError('Unsupported primitive type {} passed into PrimitiveOp '
                         'factory constructor'.format(type(primitive)))
 
     def __init__(self,
                  primitive: Union[Instruction, QuantumCircuit, List,
-                                  np.ndarray, spmatrix, MatrixOperator, Pauli] = None,
+                                  np.ndarray, spmatrix, MatrixOperator, Pauli,
+                                  SparsePauliOp] = None,
                  coeff: Optional[Union[int, float, complex, ParameterExpression]] = 1.0) -> None:
         """
             Args:
@@ -16,6 +16,8 @@ import copy
 import logging
 import time
 
+import numpy as np
+
 from qiskit.assembler.run_config import RunConfig
 from qiskit import compiler
 
@@ -62,7 +64,8 @@ class QuantumInstance:
                  skip_qobj_validation=True,
                  measurement_error_mitigation_cls=None, cals_matrix_refresh_period=30,
                  measurement_error_mitigation_shots=None,
-                 job_callback=None):
+                 job_callback=None,
+                 transpile_cache=None):
         """
         Quantum Instance holds a Qiskit Terra backend as well as configuration for circuit
         transpilation and execution. When provided to an Aqua algorithm the algorithm will
@@ -103,6 +106,9 @@ class QuantumInstance:
                 to monitor job progress as jobs are submitted for processing by an Aqua algorithm.
                 The callback is provided the following arguments: `job_id, job_status,
                 queue_position, job`
+            transpile_cache (TranspileCache, optional): Cache of transpiled circuits, keyed by
+                circuit structure and the backend and compile configuration. It can be shared
+                between quantum instances and, with its on-disk tier, between processes.
 
         Raises:
             AquaError: the shots exceeds the maximum number of shots
@@ -176,6 +182,9 @@ class QuantumInstance:
         else:
             self._meas_error_mitigation_cls = measurement_error_mitigation_cls
         self._meas_error_mitigation_fitters = {}
+        # the calibration matrices of each qubit order measured with each fitter, and their
+        # pseudo inverses, kept until the fitter is rebuilt
+        self._meas_error_mitigation_matrices = {}
         # TODO: support different fitting method in error mitigation?
         self._meas_error_mitigation_method = 'least_squares'
         self._cals_matrix_refresh_period = cals_matrix_refresh_period
@@ -200,6 +209,7 @@ class QuantumInstance:
         self._skip_qobj_validation = skip_qobj_validation
         self._circuit_summary = False
         self._job_callback = job_callback
+        self._transpile_cache = transpile_cache
         logger.info(self)
 
     def __str__(self) -> str:
@@ -228,10 +238,12 @@ class QuantumInstance:
             list[QuantumCircuit]: the transpiled circuits, it is always a list even though
                                   the length is one.
         """
-        transpiled_circuits = compiler.transpile(circuits, self._backend, **self._backend_config,
-                                                 **self._compile_config)
-        if not isinstance(transpiled_circuits, list):
-            transpiled_circuits = [transpiled_circuits]
+        if self._transpile_cache is not None and self._compile_config['pass_manager'] is None:
+            transpiled_circuits = self._transpile_cache.transpile(
+                circuits if isinstance(circuits, list) else [circuits],
+                self._transpile_uncached, self._transpile_cache_config())
+        else:
+            transpiled_circuits = self._transpile_uncached(circuits)
 
         if logger.isEnabledFor(logging.DEBUG) and self._circuit_summary:
             logger.debug("==== Before transpiler ====")
@@ -242,6 +254,31 @@ class QuantumInstance:
 
         return transpiled_circuits
 
+    def _transpile_uncached(self, circuits):
+        transpiled_circuits = compiler.transpile(circuits, self._backend, **self._backend_config,
+                                                 **self._compile_config)
+        if not isinstance(transpiled_circuits, list):
+            transpiled_circuits = [transpiled_circuits]
+        return transpiled_circuits
+
+    def _transpile_cache_config(self):
+        """ the settings that determine the outcome of the transpilation """
+        config = self._backend.configuration()
+        properties = self._backend.properties()
+        coupling_map = self._backend_config['coupling_map']
+        if hasattr(coupling_map, 'get_edges'):
+            coupling_map = coupling_map.get_edges()
+        return {
+            'backend_name': self.backend_name,
+            'backend_version': getattr(config, 'backend_version', None),
+            'properties_last_update': getattr(properties, 'last_update_date', None),
+            'basis_gates': self._backend_config['basis_gates'],
+            'coupling_map': coupling_map,
+            'initial_layout': self._compile_config['initial_layout'],
+            'seed_transpiler': self._compile_config['seed_transpiler'],
+            'optimization_level': self._compile_config['optimization_level'],
+        }
+
     def assemble(self, circuits):
         """ assemble circuits """
         return compiler.assemble(circuits, **self._run_config.to_dict())
@@ -264,7 +301,8 @@ class QuantumInstance:
         from .utils.run_circuits import run_qobj
 
         from .utils.measurement_error_mitigation import (get_measured_qubits_from_qobj,
-                                                         build_measurement_error_mitigation_qobj)
+                                                         build_measurement_error_mitigation_qobj,
+                                                         mitigate_counts)
         # maybe compile
         if not had_transpiled:
             circuits = self.transpile(circuits)
@@ -339,8 +377,9 @@ class QuantumInstance:
                                                     state_labels,
                                                     qubit_list=qubit_index,
                                                     circlabel=circuit_labels)
+                timestamp = time.time()
                 self._meas_error_mitigation_fitters[qubit_index_str] = \
-                    (meas_error_mitigation_fitter, time.time())
+                    (meas_error_mitigation_fitter, timestamp)
             else:
                 result = run_qobj(qobj, self._backend, self._qjob_config,
                                   self._backend_options, self._noise_config,
@@ -352,19 +391,18 @@ class QuantumInstance:
                 #  remove the calibration counts from result object to assure the length of
                 #  ExperimentalResult is equal length to input circuits
                 result.results = result.results[skip_num_circuits:]
-                tmp_result = copy.deepcopy(result)
-                for qubit_index_str, c_idx in qubit_mappings.items():
-                    curr_qubit_index = [int(x) for x in qubit_index_str.split("_")]
-                    tmp_result.results = [result.results[i] for i in c_idx]
-                    if curr_qubit_index == qubit_index:
-                        tmp_fitter = meas_error_mitigation_fitter
-                    else:
-                        tmp_fitter = meas_error_mitigation_fitter.subset_fitter(curr_qubit_index)
-                    tmp_result = tmp_fitter.filter.apply(
-                        tmp_result, self._meas_error_mitigation_method
-                    )
-                    for i, n in enumerate(c_idx):
-                        result.results[n] = tmp_result.results[i]
+                # the counts of all the experiments measuring the qubits in the same order are
+                # mitigated together, and written back in place
+                for qubit_mapping_str, c_idx in qubit_mappings.items():
+                    cal_matrix, pinv_cal_matrix, state_labels = \
+                        self._get_meas_error_mitigation_matrices(meas_error_mitigation_fitter,
+                                                                 qubit_index_str, timestamp,
+                                                                 qubit_index, qubit_mapping_str)
+                    mitigated_counts = mitigate_counts(
+                        [result.get_counts(i) for i in c_idx], cal_matrix, state_labels,
+                        pinv_cal_matrix, self._meas_error_mitigation_method)
+                    for i, counts in zip(c_idx, mitigated_counts):
+                        result.results[i].data.counts = counts
 
         else:
             result = run_qobj(qobj, self._backend, self._qjob_config,
@@ -376,6 +414,65 @@ class QuantumInstance:
 
         return result
 
+    def _get_meas_error_mitigation_matrices(self, fitter, qubit_index_str, timestamp,
+                                            qubit_index, qubit_mapping_str):
+        """
+        Returns the calibration matrix of the fitter for the qubits measured in the given order,
+        its pseudo inverse and its state labels, reusing them as long as the fitter is the same.
+        """
+        key = (qubit_index_str, qubit_mapping_str)
+        stored_timestamp, matrices = \
+            self._meas_error_mitigation_matrices.get(key, (None, None))
+        if matrices is None or stored_timestamp != timestamp:
+            curr_qubit_index = [int(x) for x in qubit_mapping_str.split("_")]
+            if curr_qubit_index != qubit_index:
+                fitter = fitter.subset_fitter(curr_qubit_index)
+            cal_matrix = np.asarray(fitter.cal_matrix)
+            matrices = (cal_matrix, np.linalg.pinv(cal_matrix), fitter.filter.state_labels)
+            self._meas_error_mitigation_matrices[key] = (timestamp, matrices)
+        return matrices
+
+    def execute_async(self, circuits, had_transpiled=False):
+        """
+        A non-blocking wrapper to interface with quantum backend.
+
+        The circuits are transpiled, assembled and submitted before this method returns, while
+        waiting for the jobs and collecting their results happens in a background thread. This
+        lets the caller prepare the next batch of circuits while the backend executes the
+        current one.
+
+        Args:
+            circuits (QuantumCircuit or list[QuantumCircuit]): circuits to execute
+            had_transpiled (bool, optional): whether or not circuits had been transpiled
+
+        Returns:
+            concurrent.futures.Future: future resolving to the Result object, the same one
+                :meth:`execute` returns. Use ``asyncio.wrap_future`` to await it in a coroutine.
+        """
+        # pylint: disable=import-outside-toplevel
+        from .utils.run_circuits import run_qobj_async, submit_to_executor
+
+        # maybe compile
+        if not had_transpiled:
+            circuits = self.transpile(circuits)
+
+        if self._meas_error_mitigation_cls is not None:
+            # the calibration circuits depend on the main qobj and the calibration fitters
+            # are shared state, so the whole mitigated execution runs in the background
+            return submit_to_executor(self.execute, circuits, had_transpiled=True)
+
+        # assemble
+        qobj = self.assemble(circuits)
+
+        future = run_qobj_async(qobj, self._backend, self._qjob_config,
+                                self._backend_options, self._noise_config,
+                                self._skip_qobj_validation, self._job_callback)
+
+        if self._circuit_summary:
+            self._circuit_summary = False
+
+        return future
+
     def set_config(self, **kwargs):
         """Set configurations for the quantum instance."""
         for k, v in kwargs.items():
@@ -481,6 +578,16 @@ class QuantumInstance:
         """ sets measurement error mitigation shots """
         self._meas_error_mitigation_shots = new_value
 
+    @property
+    def transpile_cache(self):
+        """ returns the transpile cache """
+        return self._transpile_cache
+
+    @transpile_cache.setter
+    def transpile_cache(self, new_value):
+        """ sets the transpile cache, None disables caching """
+        self._transpile_cache = new_value
+
     @property
     def backend(self):
         """Return BaseBackend backend object."""
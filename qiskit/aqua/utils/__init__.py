@@ -33,6 +33,7 @@ Utilities
    decimal_to_binary
    summarize_circuits
    get_subsystem_density_matrix
+   get_subsystem_probabilities
    get_subsystems_counts
    get_entangler_map
    validate_entangler_map
@@ -43,6 +44,7 @@ Utilities
    reduce_dim_to_via_pca
    optimize_svm
    CircuitFactory
+   TranspileCache
    has_ibmq
    has_aer
    name_args
@@ -55,13 +57,15 @@ from .random_matrix_generator import (random_unitary, random_h2_body,
                                       random_non_hermitian)
 from .decimal_to_binary import decimal_to_binary
 from .circuit_utils import summarize_circuits
-from .subsystem import get_subsystem_density_matrix, get_subsystems_counts
+from .subsystem import (get_subsystem_density_matrix, get_subsystem_probabilities,
+                        get_subsystems_counts)
 from .entangler_map import get_entangler_map, validate_entangler_map
 from .dataset_helper import (get_feature_dimension, get_num_classes,
                              split_dataset_to_data_and_labels,
                              map_label_to_class_name, reduce_dim_to_via_pca)
 from .qp_solver import optimize_svm
 from .circuit_factory import CircuitFactory
+from .transpile_cache import TranspileCache
 from .backend_utils import has_ibmq, has_aer
 from .name_unnamed_args import name_args
 
@@ -75,6 +79,7 @@ __all__ = [
     'decimal_to_binary',
     'summarize_circuits',
     'get_subsystem_density_matrix',
+    'get_subsystem_probabilities',
     'get_subsystems_counts',
     'get_entangler_map',
     'validate_entangler_map',
@@ -85,6 +90,7 @@ __all__ = [
     'reduce_dim_to_via_pca',
     'optimize_svm',
     'CircuitFactory',
+    'TranspileCache',
     'has_ibmq',
     'has_aer',
     'name_args'
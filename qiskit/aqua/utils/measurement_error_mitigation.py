@@ -15,6 +15,8 @@
 import copy
 import logging
 
+import numpy as np
+from scipy.optimize import minimize
 from qiskit import compiler
 from qiskit.ignis.mitigation.measurement import (complete_meas_cal,
                                                  CompleteMeasFitter, TensoredMeasFitter)
@@ -146,3 +148,70 @@ def build_measurement_error_mitigation_qobj(qubit_list, fitter_cls, backend,
     if hasattr(cals_qobj.config, 'parameterizations'):
         del cals_qobj.config.parameterizations
     return cals_qobj, state_labels, circlabel
+
+
+def mitigate_counts(counts_list, cal_matrix, state_labels, pinv_cal_matrix=None,
+                    method='least_squares'):
+    """
+    Applies the calibration matrix to the counts of many experiments measured on the same
+    qubits at once. The results are those of the filter of the measurement fitter, up to the
+    tolerance of its optimizer.
+
+    The counts are gathered into an array with one column per experiment, which is multiplied
+    by the pseudo inverse of the calibration matrix. For the least squares method, this is the
+    constrained optimum whenever it has no negative entry, since the columns of the calibration
+    matrix sum to one. Only the experiments where it has are solved again with the constraints.
+
+    Args:
+        counts_list (list[dict]): the counts of each experiment
+        cal_matrix (numpy.ndarray): the calibration matrix
+        state_labels (list[str]): the state labels of the rows of the calibration matrix
+        pinv_cal_matrix (numpy.ndarray, optional): the pseudo inverse of the calibration matrix,
+            computed if not given
+        method (str): 'least_squares' or 'pseudo_inverse'
+
+    Returns:
+        list[dict]: the mitigated counts of each experiment
+
+    Raises:
+        AquaError: unknown method or counts of states not in the state labels
+    """
+    if method not in ('least_squares', 'pseudo_inverse'):
+        raise AquaError("Unknown measurement error mitigation method {}".format(method))
+    if pinv_cal_matrix is None:
+        pinv_cal_matrix = np.linalg.pinv(cal_matrix)
+
+    label_index = {label: i for i, label in enumerate(state_labels)}
+    raw_counts = np.zeros((len(state_labels), len(counts_list)))
+    for exp_idx, counts in enumerate(counts_list):
+        for label, count in counts.items():
+            if label not in label_index:
+                raise AquaError("Unexpected state label '{}', verify the fitter's state labels "
+                                "correspond to the input data".format(label))
+            raw_counts[label_index[label], exp_idx] = count
+
+    mitigated = pinv_cal_matrix @ raw_counts
+    if method == 'least_squares':
+        for exp_idx in np.flatnonzero(np.any(mitigated < 0, axis=0)):
+            mitigated[:, exp_idx] = _constrained_least_squares(
+                cal_matrix, raw_counts[:, exp_idx], mitigated[:, exp_idx])
+
+    return [{state_labels[i]: mitigated[i, exp_idx] for i in np.flatnonzero(mitigated[:, exp_idx])}
+            for exp_idx in range(len(counts_list))]
+
+
+def _constrained_least_squares(cal_matrix, raw_counts, initial_point):
+    """ Minimizes the distance to the raw counts over the non-negative counts with the same
+    number of shots. """
+    nshots = np.sum(raw_counts)
+    x_0 = np.clip(initial_point, 0, None)
+    x_0 = x_0 * nshots / np.sum(x_0) if np.sum(x_0) > 0 else np.full(len(x_0), nshots / len(x_0))
+
+    def fun(x):
+        residual = raw_counts - cal_matrix @ x
+        return residual @ residual
+
+    cons = ({'type': 'eq', 'fun': lambda x: nshots - np.sum(x)})
+    bnds = tuple((0, nshots) for _ in x_0)
+    res = minimize(fun, x_0, method='SLSQP', constraints=cons, bounds=bnds, tol=1e-6)
+    return res.x
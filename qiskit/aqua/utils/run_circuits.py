@@ -18,6 +18,8 @@ import time
 import copy
 import os
 import uuid
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 from qiskit.providers import BaseBackend, JobStatus, JobError
@@ -195,42 +197,32 @@ def _safe_get_job_status(job, job_id):
     return job_status
 
 
-def run_qobj(qobj, backend, qjob_config=None, backend_options=None,
-             noise_config=None, skip_qobj_validation=False, job_callback=None):
+def submit_qobj(qobj, backend, backend_options=None, noise_config=None,
+                skip_qobj_validation=False):
     """
-    An execution wrapper with Qiskit-Terra, with job auto recover capability.
-
-    The auto-recovery feature is only applied for non-simulator backend.
-    This wrapper will try to get the result no matter how long it takes.
+    Split the qobj if it exceeds the payload of the backend and submit all resulting jobs
+    without waiting for them to finish.
 
     Args:
         qobj (QasmQobj): qobj to execute
         backend (BaseBackend): backend instance
-        qjob_config (dict, optional): configuration for quantum job object
         backend_options (dict, optional): configuration for simulator
         noise_config (dict, optional): configuration for noise model
         skip_qobj_validation (bool, optional): Bypass Qobj validation to decrease submission time,
                                                only works for Aer and BasicAer providers
-        job_callback (Callable, optional): callback used in querying info of the submitted job, and
-                                           providing the following arguments:
-                                            job_id, job_status, queue_position, job
 
     Returns:
-        Result: Result object
+        tuple(list[BaseJob], list[str]): the submitted jobs and their job ids
 
     Raises:
         ValueError: invalid backend
-        AquaError: Any error except for JobError raised by Qiskit Terra
     """
-    qjob_config = qjob_config or {}
     backend_options = backend_options or {}
     noise_config = noise_config or {}
 
     if backend is None or not isinstance(backend, (Backend, BaseBackend)):
         raise ValueError('Backend is missing or not an instance of BaseBackend')
 
-    with_autorecover = not is_simulator_backend(backend)
-
     if MAX_CIRCUITS_PER_JOB is not None:
         max_circuits_per_job = int(MAX_CIRCUITS_PER_JOB)
     else:
@@ -250,25 +242,73 @@ def run_qobj(qobj, backend, qjob_config=None, backend_options=None,
         job_ids.append(job_id)
         jobs.append(job)
 
-    results = []
+    return jobs, job_ids
+
+
+def _safe_get_job_result(job, job_id, backend, qjob_config):
+    while True:
+        result = job.result(**qjob_config)
+        if result.success:
+            return result
+
+        logger.warning("FAILURE: Job id: %s", job_id)
+        logger.warning("Job (%s) is completed anyway, retrieve result "
+                       "from backend again.", job_id)
+        job = backend.retrieve_job(job_id)
+
+
+def collect_qobj_results(jobs, job_ids, backend, qjob_config=None, backend_options=None,
+                         noise_config=None, skip_qobj_validation=False, job_callback=None):
+    """
+    Wait for the jobs returned by :func:`submit_qobj` and combine their results,
+    with job auto recover capability.
+
+    For non-simulator backends all outstanding jobs are polled in the same round, so the
+    wait between two status queries is paid once per round instead of once per job, and a
+    failed job is re-submitted as soon as its final state is observed.
+
+    Args:
+        jobs (list[BaseJob]): the submitted jobs
+        job_ids (list[str]): the ids of the submitted jobs
+        backend (BaseBackend): backend instance
+        qjob_config (dict, optional): configuration for quantum job object
+        backend_options (dict, optional): configuration for simulator
+        noise_config (dict, optional): configuration for noise model
+        skip_qobj_validation (bool, optional): Bypass Qobj validation to decrease submission time,
+                                               only works for Aer and BasicAer providers
+        job_callback (Callable, optional): callback used in querying info of the submitted job, and
+                                           providing the following arguments:
+                                            job_id, job_status, queue_position, job
+
+    Returns:
+        Result: Result object
+
+    Raises:
+        AquaError: Any error except for JobError raised by Qiskit Terra
+    """
+    qjob_config = qjob_config or {}
+    backend_options = backend_options or {}
+    noise_config = noise_config or {}
+
+    jobs = list(jobs)
+    job_ids = list(job_ids)
+    with_autorecover = not is_simulator_backend(backend)
+
     if with_autorecover:
         logger.info("Backend status: %s", backend.status())
         logger.info("There are %s jobs are submitted.", len(jobs))
         logger.info("All job ids:\n%s", job_ids)
-        for idx, _ in enumerate(jobs):
-            job = jobs[idx]
-            job_id = job_ids[idx]
-            while True:
+        results = [None] * len(jobs)
+        pending = list(range(len(jobs)))
+        while pending:
+            still_pending = []
+            for idx in pending:
+                job = jobs[idx]
+                job_id = job_ids[idx]
                 logger.info("Running %s-th qobj, job id: %s", idx, job_id)
-                # try to get result if possible
-                while True:
-                    job_status = _safe_get_job_status(job, job_id)
-                    queue_position = 0
-                    if job_status in JOB_FINAL_STATES:
-                        # do callback again after the job is in the final states
-                        if job_callback is not None:
-                            job_callback(job_id, job_status, queue_position, job)
-                        break
+                job_status = _safe_get_job_status(job, job_id)
+                queue_position = 0
+                if job_status not in JOB_FINAL_STATES:
                     if job_status == JobStatus.QUEUED:
                         queue_position = job.queue_position()
                         logger.info("Job id: %s is queued at position %s", job_id, queue_position)
@@ -276,22 +316,19 @@ def run_qobj(qobj, backend, qjob_config=None, backend_options=None,
                         logger.info("Job id: %s, status: %s", job_id, job_status)
                     if job_callback is not None:
                         job_callback(job_id, job_status, queue_position, job)
-                    time.sleep(qjob_config['wait'])
+                    still_pending.append(idx)
+                    continue
+
+                # do callback again after the job is in the final states
+                if job_callback is not None:
+                    job_callback(job_id, job_status, queue_position, job)
 
                 # get result after the status is DONE
                 if job_status == JobStatus.DONE:
-                    while True:
-                        result = job.result(**qjob_config)
-                        if result.success:
-                            results.append(result)
-                            logger.info("COMPLETED the %s-th qobj, job id: %s", idx, job_id)
-                            break
-
-                        logger.warning("FAILURE: Job id: %s", job_id)
-                        logger.warning("Job (%s) is completed anyway, retrieve result "
-                                       "from backend again.", job_id)
-                        job = backend.retrieve_job(job_id)
-                    break
+                    results[idx] = _safe_get_job_result(job, job_id, backend, qjob_config)
+                    logger.info("COMPLETED the %s-th qobj, job id: %s", idx, job_id)
+                    continue
+
                 # for other cases, resubmit the qobj until the result is available.
                 # since if there is no result returned, there is no way algorithm can do any process
                 # get back the qobj first to avoid for job is consumed
@@ -312,6 +349,11 @@ def run_qobj(qobj, backend, qjob_config=None, backend_options=None,
                                                 noise_config, skip_qobj_validation)
                 jobs[idx] = job
                 job_ids[idx] = job_id
+                still_pending.append(idx)
+
+            pending = still_pending
+            if pending:
+                time.sleep(qjob_config['wait'])
     else:
         results = []
         for job in jobs:
@@ -336,6 +378,91 @@ def run_qobj(qobj, backend, qjob_config=None, backend_options=None,
     return result
 
 
+def run_qobj(qobj, backend, qjob_config=None, backend_options=None,
+             noise_config=None, skip_qobj_validation=False, job_callback=None):
+    """
+    An execution wrapper with Qiskit-Terra, with job auto recover capability.
+
+    The auto-recovery feature is only applied for non-simulator backend.
+    This wrapper will try to get the result no matter how long it takes.
+
+    Args:
+        qobj (QasmQobj): qobj to execute
+        backend (BaseBackend): backend instance
+        qjob_config (dict, optional): configuration for quantum job object
+        backend_options (dict, optional): configuration for simulator
+        noise_config (dict, optional): configuration for noise model
+        skip_qobj_validation (bool, optional): Bypass Qobj validation to decrease submission time,
+                                               only works for Aer and BasicAer providers
+        job_callback (Callable, optional): callback used in querying info of the submitted job, and
+                                           providing the following arguments:
+                                            job_id, job_status, queue_position, job
+
+    Returns:
+        Result: Result object
+
+    Raises:
+        ValueError: invalid backend
+        AquaError: Any error except for JobError raised by Qiskit Terra
+    """
+    jobs, job_ids = submit_qobj(qobj, backend, backend_options, noise_config,
+                                skip_qobj_validation)
+    return collect_qobj_results(jobs, job_ids, backend, qjob_config, backend_options,
+                                noise_config, skip_qobj_validation, job_callback)
+
+
+def run_qobj_async(qobj, backend, qjob_config=None, backend_options=None,
+                   noise_config=None, skip_qobj_validation=False, job_callback=None):
+    """
+    Submit the qobj and collect its result in a background thread.
+
+    The jobs are submitted before this function returns, so the backend starts executing
+    them while the caller goes on, e.g. to transpile and assemble the next batch of circuits.
+
+    Args:
+        qobj (QasmQobj): qobj to execute
+        backend (BaseBackend): backend instance
+        qjob_config (dict, optional): configuration for quantum job object
+        backend_options (dict, optional): configuration for simulator
+        noise_config (dict, optional): configuration for noise model
+        skip_qobj_validation (bool, optional): Bypass Qobj validation to decrease submission time,
+                                               only works for Aer and BasicAer providers
+        job_callback (Callable, optional): callback used in querying info of the submitted job, and
+                                           providing the following arguments:
+                                            job_id, job_status, queue_position, job
+
+    Returns:
+        concurrent.futures.Future: future resolving to the Result object. It can be awaited
+            in a coroutine through ``asyncio.wrap_future``.
+
+    Raises:
+        ValueError: invalid backend
+    """
+    jobs, job_ids = submit_qobj(qobj, backend, backend_options, noise_config,
+                                skip_qobj_validation)
+    return submit_to_executor(collect_qobj_results, jobs, job_ids, backend, qjob_config,
+                              backend_options, noise_config, skip_qobj_validation, job_callback)
+
+
+_EXECUTOR = None
+_EXECUTOR_LOCK = threading.Lock()
+
+
+def submit_to_executor(func, *args, **kwargs):
+    """
+    Schedule ``func(*args, **kwargs)`` on the thread pool shared by the asynchronous
+    execution functions.
+
+    Returns:
+        concurrent.futures.Future: future holding the return value of ``func``
+    """
+    global _EXECUTOR  # pylint: disable=global-statement
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None:
+            _EXECUTOR = ThreadPoolExecutor(thread_name_prefix='aqua_run_circuits')
+        return _EXECUTOR.submit(func, *args, **kwargs)
+
+
 # skip_qobj_validation = True does what backend.run
 # and aerjob.submit do, but without qobj validation.
 def run_on_backend(backend, qobj, backend_options=None,
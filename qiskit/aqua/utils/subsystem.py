@@ -16,13 +16,35 @@ from collections import defaultdict
 import numpy as np
 from scipy.linalg import sqrtm
 
-from qiskit.quantum_info.states import partial_trace
+
+def _split_subsystems(statevector, trace_systems):
+    """
+    Reshape the state vector into a matrix with one row per basis state of the kept qubits
+    and one column per basis state of the traced qubits.
+
+    Args:
+        statevector (list|array): The state vector of the complete system
+        trace_systems (list|range): The indices of the qubits to be traced out.
+
+    Returns:
+        numpy.ndarray: The reshaped state vector
+    """
+    statevector = np.asarray(statevector)
+    num_qubits = int(np.log2(len(statevector)))
+    # axis k of the tensor corresponds to qubit num_qubits - 1 - k
+    traced_axes = sorted(num_qubits - 1 - qubit for qubit in trace_systems)
+    kept_axes = [axis for axis in range(num_qubits) if axis not in traced_axes]
+    tensor = statevector.reshape([2] * num_qubits).transpose(kept_axes + traced_axes)
+    return tensor.reshape(2 ** len(kept_axes), 2 ** len(traced_axes))
 
 
 def get_subsystem_density_matrix(statevector, trace_systems):
     """
     Compute the reduced density matrix of a quantum subsystem.
 
+    The density matrix of the complete system is never formed, so only memory for the
+    state vector and the reduced density matrix is needed.
+
     Args:
         statevector (list|array): The state vector of the complete system
         trace_systems (list|range): The indices of the qubits to be traced out.
@@ -30,9 +52,25 @@ def get_subsystem_density_matrix(statevector, trace_systems):
     Returns:
         numpy.ndarray: The reduced density matrix for the desired subsystem
     """
-    rho = np.outer(statevector, np.conj(statevector))
-    rho_sub = partial_trace(rho, trace_systems).data
-    return rho_sub
+    psi = _split_subsystems(statevector, trace_systems)
+    return psi @ psi.conj().T
+
+
+def get_subsystem_probabilities(statevector, trace_systems):
+    """
+    Compute the marginal measurement probabilities of a quantum subsystem, i.e. the diagonal
+    of its reduced density matrix, by summing the probabilities of the complete system over
+    the traced qubits.
+
+    Args:
+        statevector (list|array): The state vector of the complete system
+        trace_systems (list|range): The indices of the qubits to be traced out.
+
+    Returns:
+        numpy.ndarray: The probabilities of the basis states of the desired subsystem
+    """
+    psi = _split_subsystems(statevector, trace_systems)
+    return np.sum(np.abs(psi) ** 2, axis=1)
 
 
 def get_subsystem_fidelity(statevector, trace_systems, subsystem_state):
@@ -48,8 +86,7 @@ def get_subsystem_fidelity(statevector, trace_systems, subsystem_state):
     Returns:
         numpy.ndarray: The subsystem fidelity
     """
-    rho = np.outer(np.conj(statevector), statevector)
-    rho_sub = partial_trace(rho, trace_systems).data
+    rho_sub = np.conj(get_subsystem_density_matrix(statevector, trace_systems))
     rho_sub_in = np.outer(np.conj(subsystem_state), subsystem_state)
     fidelity = np.trace(
         sqrtm(
@@ -0,0 +1,244 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+""" Content-addressed cache of transpiled circuits """
+
+from typing import Optional, List, Dict, Any, Tuple, Callable
+import os
+import hashlib
+import logging
+import pickle
+from collections import OrderedDict
+
+import numpy as np
+from qiskit.circuit import (QuantumCircuit, Instruction, Gate, ControlledGate, Parameter,
+                            ParameterExpression)
+
+logger = logging.getLogger(__name__)
+
+
+class TranspileCache:
+    """
+    Content-addressed cache of transpiled circuits.
+
+    Circuits are keyed by a hash of their structure (registers, instructions, qubit and clbit
+    arguments, gate parameters and the definitions of opaque gates) together with the backend
+    and compile configuration they were transpiled for. Parameters are hashed by name, so a
+    cached circuit is reused for a structurally identical circuit built from different
+    :class:`~qiskit.circuit.Parameter` instances, e.g. when an ansatz is rebuilt in another
+    process; the parameters of the cached circuit are then substituted with the new ones.
+
+    The cache has an in-memory tier holding the most recently used circuits and, if
+    ``cache_dir`` is given, an on-disk tier that persists across processes.
+
+    Circuits transpiled with a custom ``pass_manager`` are never cached since the passes
+    cannot be hashed.
+    """
+
+    def __init__(self, max_size: int = 1024, cache_dir: Optional[str] = None) -> None:
+        """
+        Args:
+            max_size: Maximum number of transpiled circuits kept in memory. The least recently
+                used ones are evicted first.
+            cache_dir: Directory for the on-disk tier. It is created if it does not exist.
+                ``None`` keeps the cache in memory only.
+
+        Raises:
+            ValueError: max_size is not positive.
+        """
+        if max_size < 1:
+            raise ValueError('max_size must be positive, not {}.'.format(max_size))
+        self._max_size = max_size
+        self._cache_dir = cache_dir
+        if cache_dir is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+        self._memory = OrderedDict()  # type: OrderedDict
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def max_size(self) -> int:
+        """ Returns the maximum number of circuits kept in memory. """
+        return self._max_size
+
+    @property
+    def cache_dir(self) -> Optional[str]:
+        """ Returns the directory of the on-disk tier. """
+        return self._cache_dir
+
+    @property
+    def hits(self) -> int:
+        """ Returns the number of circuits served from the cache. """
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """ Returns the number of circuits not found in the cache. """
+        return self._misses
+
+    def __len__(self) -> int:
+        return len(self._memory)
+
+    def clear(self) -> None:
+        """ Clears the in-memory tier and resets the statistics. The on-disk tier is kept. """
+        self._memory.clear()
+        self._hits = 0
+        self._misses = 0
+
+    def transpile(self, circuits: List[QuantumCircuit],
+                  transpile_fn: Callable[[List[QuantumCircuit]], List[QuantumCircuit]],
+                  config: Dict[str, Any]) -> List[QuantumCircuit]:
+        """
+        Transpiles the circuits, reusing cached results when possible.
+
+        Args:
+            circuits: The circuits to transpile.
+            transpile_fn: Called with the list of circuits missing from the cache and has to
+                return the list of their transpiled counterparts.
+            config: The backend and compile configuration ``transpile_fn`` uses. It is part of
+                the cache key.
+
+        Returns:
+            The transpiled circuits, in the same order as ``circuits``.
+        """
+        config_digest = _config_digest(config)
+        transpiled = [None] * len(circuits)  # type: List[Optional[QuantumCircuit]]
+        missing = []  # type: List[Tuple[int, str, List[Parameter]]]
+        for i, circuit in enumerate(circuits):
+            key, params = circuit_key(circuit, config_digest)
+            cached = self._get(key)
+            if cached is None:
+                self._misses += 1
+                missing.append((i, key, params))
+            else:
+                self._hits += 1
+                transpiled[i] = _rebind(cached, circuit, params)
+
+        if missing:
+            new_circuits = transpile_fn([circuits[i] for i, _, _ in missing])
+            for (i, key, params), new_circuit in zip(missing, new_circuits):
+                self._put(key, (new_circuit.copy(), params))
+                transpiled[i] = new_circuit
+
+        logger.debug('Transpile cache: %s hits, %s misses.',
+                     len(circuits) - len(missing), len(missing))
+        return transpiled
+
+    def _get(self, key: str) -> Optional[Tuple[QuantumCircuit, List[Parameter]]]:
+        entry = self._memory.get(key)
+        if entry is not None:
+            self._memory.move_to_end(key)
+            return entry
+
+        if self._cache_dir is not None:
+            file_name = os.path.join(self._cache_dir, key + '.pickle')
+            if os.path.isfile(file_name):
+                try:
+                    with open(file_name, 'rb') as file:
+                        entry = pickle.load(file)
+                except Exception as ex:  # pylint: disable=broad-except
+                    logger.warning('Failed to load cached circuit %s: %s', file_name, ex)
+                    return None
+                self._put_memory(key, entry)
+        return entry
+
+    def _put(self, key: str, entry: Tuple[QuantumCircuit, List[Parameter]]) -> None:
+        self._put_memory(key, entry)
+        if self._cache_dir is not None:
+            file_name = os.path.join(self._cache_dir, key + '.pickle')
+            tmp_file_name = '{}.{}.tmp'.format(file_name, os.getpid())
+            try:
+                with open(tmp_file_name, 'wb') as file:
+                    pickle.dump(entry, file, protocol=pickle.HIGHEST_PROTOCOL)
+                # atomic so that concurrent processes never read a partial file
+                os.replace(tmp_file_name, file_name)
+            except Exception as ex:  # pylint: disable=broad-except
+                logger.warning('Failed to store cached circuit %s: %s', file_name, ex)
+
+    def _put_memory(self, key: str, entry: Tuple[QuantumCircuit, List[Parameter]]) -> None:
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self._max_size:
+            self._memory.popitem(last=False)
+
+
+def circuit_key(circuit: QuantumCircuit, config_digest: str = '') -> Tuple[str, List[Parameter]]:
+    """
+    Computes the cache key of a circuit.
+
+    Args:
+        circuit: The circuit.
+        config_digest: Digest of the backend and compile configuration.
+
+    Returns:
+        The hex digest identifying the circuit together with its parameters, in the order in
+        which they first appear in the circuit.
+    """
+    hasher = hashlib.sha256(config_digest.encode())
+    params = []  # type: List[Parameter]
+    _hash_circuit(circuit, hasher, params, set())
+    return hasher.hexdigest(), params
+
+
+def _hash_circuit(circuit: QuantumCircuit, hasher, params: List[Parameter], seen: set) -> None:
+    hasher.update(repr([(reg.name, reg.size) for reg in circuit.qregs]).encode())
+    hasher.update(repr([(reg.name, reg.size) for reg in circuit.cregs]).encode())
+    hasher.update(repr(getattr(circuit, 'global_phase', 0)).encode())
+    qubit_indices = {bit: i for i, bit in enumerate(circuit.qubits)}
+    clbit_indices = {bit: i for i, bit in enumerate(circuit.clbits)}
+    for inst, qargs, cargs in circuit.data:
+        hasher.update(inst.name.encode())
+        hasher.update(repr((inst.num_qubits, inst.num_clbits,
+                            [qubit_indices[q] for q in qargs],
+                            [clbit_indices[c] for c in cargs])).encode())
+        if inst.condition is not None:
+            hasher.update(repr((inst.condition[0].name, inst.condition[1])).encode())
+        for param in inst.params:
+            if isinstance(param, ParameterExpression):
+                for parameter in sorted(param.parameters, key=lambda p: p.name):
+                    if parameter not in seen:
+                        seen.add(parameter)
+                        params.append(parameter)
+                hasher.update(str(param).encode())
+            elif isinstance(param, np.ndarray):
+                hasher.update(param.tobytes())
+            else:
+                hasher.update(repr(param).encode())
+        # generic gates, e.g. from ``QuantumCircuit.to_gate``, are only identified by their
+        # definition, while for subclasses the name and parameters determine the definition,
+        # so the exact types are checked and not isinstance
+        # pylint: disable=unidiomatic-typecheck
+        if type(inst) in (Instruction, Gate) and inst.definition is not None:
+            _hash_circuit(inst.definition, hasher, params, seen)
+        elif type(inst) is ControlledGate:
+            # e.g. from ``Gate.control``, identified by the controls and the controlled gate
+            hasher.update(repr((inst.num_ctrl_qubits, inst.ctrl_state)).encode())
+            base = QuantumCircuit(inst.base_gate.num_qubits)
+            base.append(inst.base_gate, base.qubits)
+            _hash_circuit(base, hasher, params, seen)
+
+
+def _config_digest(config: Dict[str, Any]) -> str:
+    return hashlib.sha256(repr(sorted(config.items())).encode()).hexdigest()
+
+
+def _rebind(cached: Tuple[QuantumCircuit, List[Parameter]], circuit: QuantumCircuit,
+            params: List[Parameter]) -> QuantumCircuit:
+    transpiled, cached_params = cached
+    mapping = {old: new for old, new in zip(cached_params, params) if old != new}
+    if mapping:
+        # assign_parameters returns a copy
+        transpiled = transpiled.assign_parameters(mapping)
+    else:
+        transpiled = transpiled.copy()
+    transpiled.name = circuit.name
+    return transpiled
@@ -29,7 +29,7 @@ from qiskit.aqua.operators import (LegacyBaseOperator,
                                    Z2Symmetries,
                                    TPBGroupedWeightedPauliOperator,
                                    commutator)
-from qiskit.aqua.operators.legacy import op_converter
+from qiskit.aqua.operators.legacy import op_converter, pauli_signs
 
 from qiskit.chemistry.components.variational_forms import UCCSD
 from qiskit.chemistry import FermionicOperator
@@ -352,51 +352,27 @@ class QEquationOfMotion:
 
         if quantum_instance is not None:
 
-            circuit_names = []
-            circuits = []
+            entries = []
             for idx, _ in enumerate(mus):
                 m_u = mus[idx]
                 n_u = nus[idx]
-
-                for op in [q_commutators[m_u][n_u], w_commutators[m_u][n_u],
-                           m_commutators[m_u][n_u], v_commutators[m_u][n_u]]:
-                    if op is not None and not op.is_empty():
-                        curr_circuits = op.construct_evaluation_circuit(
-                            wave_function=wave_fn, statevector_mode=quantum_instance.is_statevector)
-                        for c in curr_circuits:
-                            if c.name not in circuit_names:
-                                circuits.append(c)
-                                circuit_names.append(c.name)
-
-            result = quantum_instance.execute(circuits)
-
-            # evaluate results
-            for idx, _ in enumerate(mus):
-                m_u = mus[idx]
-                n_u = nus[idx]
-
-                def _get_result(op):
-                    mean, std = 0.0, 0.0
+                for mat_idx, commutators in enumerate([q_commutators, w_commutators,
+                                                       m_commutators, v_commutators]):
+                    op = commutators[m_u][n_u]
                     if op is not None and not op.is_empty():
-                        mean, std = \
-                            op.evaluate_with_result(
-                                result=result,
-                                statevector_mode=quantum_instance.is_statevector)
-                    return mean, std
-
-                q_mean, q_std = _get_result(q_commutators[m_u][n_u])
-                w_mean, w_std = _get_result(w_commutators[m_u][n_u])
-                m_mean, m_std = _get_result(m_commutators[m_u][n_u])
-                v_mean, v_std = _get_result(v_commutators[m_u][n_u])
-
-                q_mat[m_u][n_u] = q_mean if q_mean != 0.0 else q_mat[m_u][n_u]
-                w_mat[m_u][n_u] = w_mean if w_mean != 0.0 else w_mat[m_u][n_u]
-                m_mat[m_u][n_u] = m_mean if m_mean != 0.0 else m_mat[m_u][n_u]
-                v_mat[m_u][n_u] = v_mean if v_mean != 0.0 else v_mat[m_u][n_u]
-                q_mat_std += q_std
-                w_mat_std += w_std
-                m_mat_std += m_std
-                v_mat_std += v_std
+                        entries.append((mat_idx, m_u, n_u, op))
+
+            results = QEquationOfMotion._evaluate_commutators(
+                [op for _, _, _, op in entries], wave_fn, quantum_instance)
+
+            # scatter the expectations back into the matrices
+            mats = [q_mat, w_mat, m_mat, v_mat]
+            stds = [0.0, 0.0, 0.0, 0.0]
+            for (mat_idx, m_u, n_u, _), (mean, std) in zip(entries, results):
+                if mean != 0.0:
+                    mats[mat_idx][m_u][n_u] = mean
+                stds[mat_idx] += std
+            q_mat_std, w_mat_std, m_mat_std, v_mat_std = stds
         else:
             for idx, _ in enumerate(mus):
                 m_u = mus[idx]
@@ -413,6 +389,10 @@ class QEquationOfMotion:
                 w_mat[m_u][n_u] = w_mean if w_mean != 0.0 else w_mat[m_u][n_u]
                 m_mat[m_u][n_u] = m_mean if m_mean != 0.0 else m_mat[m_u][n_u]
                 v_mat[m_u][n_u] = v_mean if v_mean != 0.0 else v_mat[m_u][n_u]
+                q_mat_std += q_std
+                w_mat_std += w_std
+                m_mat_std += m_std
+                v_mat_std += v_std
 
         # pylint: disable=unsubscriptable-object
         if self._is_eom_matrix_symmetric:
@@ -438,6 +418,89 @@ class QEquationOfMotion:
 
         return m_mat, v_mat, q_mat, w_mat, m_mat_std, v_mat_std, q_mat_std, w_mat_std
 
+    @staticmethod
+    def _evaluate_commutators(operators, wave_fn, quantum_instance):
+        """Evaluate many operators from a single set of measurements.
+
+        The Paulis of all the operators are merged into one set, which is grouped into
+        qubit-wise commuting bases, so that each basis is measured once for all the operators.
+        The mean and standard deviation of each operator are then recombined from the signs
+        of its Paulis, in the same way as ``WeightedPauliOperator.evaluate_with_result``.
+
+        Args:
+            operators (list[WeightedPauliOperator]): the operators to evaluate
+            wave_fn (QuantumCircuit): the circuit generated wave function
+            quantum_instance (QuantumInstance): a quantum instance with configured settings
+
+        Returns:
+            list[tuple(complex, float)]: the mean and standard deviation of each operator
+        """
+        pauli_index = {}
+        paulis = []
+        terms = []
+        for op in operators:
+            indices, weights = [], []
+            for weight, pauli in op.paulis:
+                label = pauli.to_label()
+                if label not in pauli_index:
+                    pauli_index[label] = len(paulis)
+                    paulis.append(pauli)
+                indices.append(pauli_index[label])
+                weights.append(weight)
+            terms.append((np.asarray(indices, dtype=int), np.asarray(weights)))
+        if not paulis:
+            return []
+        logger.info('Evaluating %s operators with %s distinct Paulis.', len(operators), len(paulis))
+
+        if quantum_instance.is_statevector:
+            circuit = wave_fn.copy(name='psi')
+            result = quantum_instance.execute(circuit)
+            psi = np.asarray(result.get_statevector(circuit))
+            expectations = np.asarray([np.vdot(psi, pauli.to_spmatrix().dot(psi))
+                                       for pauli in paulis])
+            return [(weights @ expectations[indices], 0.0) for indices, weights in terms]
+
+        pool = op_converter.to_tpb_grouped_weighted_pauli_operator(
+            WeightedPauliOperator(paulis=[[1.0, pauli] for pauli in paulis]),
+            TPBGroupedWeightedPauliOperator.sorted_grouping)
+        circuits = pool.construct_evaluation_circuit(wave_function=wave_fn,
+                                                     statevector_mode=False)
+        logger.info('Measuring %s bases.', len(circuits))
+        result = quantum_instance.execute(circuits)
+        num_shots = sum(result.get_counts(0).values())
+
+        # the signs of the Paulis of each basis and where each Pauli is located
+        groups = []
+        location = np.empty((len(paulis), 2), dtype=int)
+        expectations = np.empty(len(paulis), dtype=float)
+        for group_idx, (basis, indices) in enumerate(pool.basis):
+            members = [pauli_index[pool.paulis[idx][1].to_label()] for idx in indices]
+            signs, counts = pauli_signs(result.get_counts(basis.to_label()),
+                                        [paulis[member] for member in members])
+            group_shots = np.sum(counts)
+            avg_paulis = counts @ signs / group_shots
+            groups.append((signs - avg_paulis, counts, group_shots))
+            location[members] = np.column_stack(
+                (np.full(len(members), group_idx), np.arange(len(members))))
+            expectations[members] = avg_paulis
+
+        results = []
+        for indices, weights in terms:
+            mean = weights @ expectations[indices]
+            # sum_ij w_i w_j cov_ij within each basis the operator is measured in
+            variance = 0.0
+            for group_idx in np.unique(location[indices, 0]):
+                centered, counts, group_shots = groups[group_idx]
+                if group_shots == 1:
+                    continue
+                in_group = location[indices, 0] == group_idx
+                group_weights = np.zeros(centered.shape[1], dtype=weights.dtype)
+                group_weights[location[indices[in_group], 1]] = weights[in_group]
+                centered_op = centered @ group_weights
+                variance += np.sum(counts * centered_op * centered_op) / (group_shots - 1)
+            results.append((mean, np.sqrt(variance / num_shots)))
+        return results
+
     @staticmethod
     def compute_excitation_energies(m_mat, v_mat, q_mat, w_mat):
         """Diagonalizing M, V, Q, W matrices for excitation energies.
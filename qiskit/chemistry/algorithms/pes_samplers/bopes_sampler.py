@@ -0,0 +1,161 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""The calculation of points on the Born-Oppenheimer Potential Energy Surface (BOPES)."""
+
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import List, Union
+
+import numpy as np
+
+from ..ground_state_solvers import GroundStateSolver
+from ...drivers.base_driver import BaseDriver
+from ...drivers.pyscfd.pyscfdriver import PySCFDriver
+from ...qiskit_chemistry_error import QiskitChemistryError
+from ...results.bopes_sampler_result import BOPESSamplerResult
+from ...results.electronic_structure_result import ElectronicStructureResult
+from ...results.vibronic_structure_result import VibronicStructureResult
+
+logger = logging.getLogger(__name__)
+
+
+class BOPESSampler:
+    """
+    Class to evaluate the Born-Oppenheimer Potential Energy Surface (BOPES) along a path of
+    points of a single degree of freedom of the molecule of a driver.
+
+    The points are split into as many contiguous segments of the path as there are processes and
+    the segments are sampled in parallel. Within a segment the points are sampled in order and,
+    with ``bootstrap``, each calculation starts from the solution at the previous point: the
+    minimum eigensolver, e.g. :class:`~qiskit.aqua.algorithms.VQE` or a
+    :class:`~qiskit.chemistry.algorithms.ground_state_solvers.VQEUCCSDFactory`, from its optimal
+    parameters and the Hartree-Fock calculation of a
+    :class:`~qiskit.chemistry.drivers.PySCFDriver` from its converged density.
+
+    The processes are started with the ``spawn`` method, since forking a process in which PySCF
+    or the BLAS library has already started its OpenMP threads can deadlock the children. Each
+    process thus starts a new interpreter and imports Qiskit again, which only pays off for
+    segments taking much longer than that, and the solver and the driver must be picklable.
+    """
+
+    def __init__(self,
+                 gss: GroundStateSolver,
+                 bootstrap: bool = True,
+                 num_processes: int = 1) -> None:
+        """
+        Args:
+            gss: The ground state solver computing the energy at each point.
+            bootstrap: Whether to warm start the calculation at each point from the solution at
+                the previous point of its segment.
+            num_processes: The number of processes, i.e. of segments of the path. Fewer
+                processes give longer segments, so more warm started points. With the default
+                of 1 all the points are sampled in order in the calling process.
+        """
+        self._gss = gss
+        self._bootstrap = bootstrap
+        self._num_processes = num_processes
+
+    def sample(self, driver: BaseDriver, points: List[float]) -> BOPESSamplerResult:
+        """Run the sampler at the given points of the degree of freedom of the molecule.
+
+        Args:
+            driver: The driver, whose molecule has a single degree of freedom the points are
+                perturbations of.
+            points: The points along the degree of freedom, preferably in the order of the path.
+
+        Returns:
+            The results of the ground state solver at all the points.
+
+        Raises:
+            QiskitChemistryError: If the driver has no molecule.
+        """
+        if driver.molecule is None:
+            raise QiskitChemistryError('Driver MUST be configured with a Molecule.')
+
+        points = list(points)
+        num_segments = max(1, min(self._num_processes, len(points)))
+        segments = [[points[i] for i in indices]
+                    for indices in np.array_split(np.arange(len(points)), num_segments)
+                    if len(indices) > 0]
+
+        if len(segments) == 1:
+            segment_results = [BOPESSampler._sample_segment(segments[0], self._gss, driver,
+                                                            self._bootstrap)]
+        else:
+            segment_results = self._sample_in_processes(segments, driver)
+
+        results = [result for segment_result in segment_results for result in segment_result]
+        energies = [result.energy if isinstance(result, ElectronicStructureResult)
+                    else result.groundenergy for result in results]
+        return BOPESSamplerResult(points, energies, dict(zip(points, results)))
+
+    def _sample_in_processes(self,
+                             segments: List[List[float]],
+                             driver: BaseDriver) -> List[List[Union[ElectronicStructureResult,
+                                                                    VibronicStructureResult]]]:
+        """ Samples each segment in its own spawned process. """
+        in_parallel = os.getenv('QISKIT_IN_PARALLEL')
+        # as in parallel_map, the processes do not start processes of their own
+        os.environ['QISKIT_IN_PARALLEL'] = 'TRUE'
+        try:
+            with ProcessPoolExecutor(max_workers=len(segments),
+                                     mp_context=multiprocessing.get_context('spawn')) as executor:
+                return list(executor.map(BOPESSampler._sample_segment, segments,
+                                         repeat(self._gss), repeat(driver),
+                                         repeat(self._bootstrap)))
+        finally:
+            if in_parallel is None:
+                del os.environ['QISKIT_IN_PARALLEL']
+            else:
+                os.environ['QISKIT_IN_PARALLEL'] = in_parallel
+
+    @staticmethod
+    def _sample_segment(points: List[float],
+                        gss: GroundStateSolver,
+                        driver: BaseDriver,
+                        bootstrap: bool) -> List[Union[ElectronicStructureResult,
+                                                       VibronicStructureResult]]:
+        """ Samples the points in order, warm starting each one from the previous one. The
+        state of the solver and the driver is restored when done. """
+        molecule = driver.molecule
+        solver = getattr(gss, 'solver', None)
+        warm_solver = bootstrap and hasattr(solver, 'initial_point')
+        warm_scf = bootstrap and isinstance(driver, PySCFDriver)
+
+        perturbations = molecule.perturbations
+        initial_point = solver.initial_point if warm_solver else None
+        initial_density = driver.initial_density if warm_scf else None
+        results = []
+        try:
+            for point in points:
+                molecule.perturbations = [point]
+                result = gss.solve(driver)
+                results.append(result)
+                if warm_solver:
+                    optimal_point = getattr(result.raw_result, 'optimal_point', None)
+                    if optimal_point is not None:
+                        solver.initial_point = optimal_point
+                if warm_scf:
+                    driver.initial_density = driver.density_matrix
+                logger.debug('BOPES point %s done', point)
+        finally:
+            molecule.perturbations = perturbations
+            if warm_solver:
+                solver.initial_point = initial_point
+            if warm_scf:
+                driver.initial_density = initial_density
+
+        return results
@@ -12,13 +12,11 @@
 
 """ BKSF methods """
 
-import copy
-import itertools
-
 import retworkx
 import numpy as np
 from qiskit.quantum_info import Pauli
 from qiskit.aqua.operators import WeightedPauliOperator
+from qiskit.aqua.operators.legacy.common import _merge_pauli_bits, _pauli_bits_product
 
 
 def _one_body(edge_list, p, q, h1_pq):  # pylint: disable=invalid-name
@@ -152,54 +150,158 @@ def bravyi_kitaev_fast_edge_list(fer_op):
         numpy.ndarray: edge_list, a 2xE matrix, where E is total number of edge
                         and each pair denotes (from, to)
     """
-    h_1 = fer_op.h1
-    h_2 = fer_op.h2
-    modes = fer_op.modes
-    edge_matrix = np.zeros((modes, modes), dtype=np.bool)
-
-    for p, q in itertools.product(range(modes), repeat=2):  # pylint: disable=invalid-name
-
-        if h_1[p, q] != 0.0 and p >= q:
-            edge_matrix[p, q] = True
-
-        for r, s in itertools.product(range(modes), repeat=2):  # pylint: disable=invalid-name
-            if h_2[p, q, r, s] == 0.0:  # skip zero terms
-                continue
-
-            # Identify and skip one of the complex conjugates.
-            if [p, q, r, s] != [s, r, q, p]:
-                if len(set([p, q, r, s])) == 4:
-                    if min(r, s) < min(p, q):
-                        continue
-                elif p != r and q < p:
-                    continue
-
-            # Handle case of four unique indices.
-            if len(set([p, q, r, s])) == 4:
-                if p >= q:
-                    edge_matrix[p, q] = True
-                    a_i, b = sorted([r, s])
-                    edge_matrix[b, a_i] = True
-
-            # Handle case of three unique indices.
-            elif len(set([p, q, r, s])) == 3:
-                # Identify equal tensor factors.
-                if p == r:
-                    a_i, b = sorted([q, s])
-                elif p == s:
-                    a_i, b = sorted([q, r])
-                elif q == r:
-                    a_i, b = sorted([p, s])
-                elif q == s:
-                    a_i, b = sorted([p, r])
-                else:
-                    continue
-                edge_matrix[b, a_i] = True
+    return _edge_list(fer_op.h1, fer_op.h2)
+
+
+def _edge_list(h_1, h_2):
+    """
+    Construct the edge list from the nonzero integrals, all at once.
+
+    Args:
+        h_1 (numpy.ndarray): one body integrals
+        h_2 (numpy.ndarray): two body integrals
+
+    Returns:
+        numpy.ndarray: edge_list, a 2xE matrix, where E is total number of edge
+                        and each pair denotes (from, to)
+    """
+    modes = h_1.shape[0]
+    edge_matrix = np.zeros((modes, modes), dtype=bool)
+
+    p, q = np.nonzero(h_1)  # pylint: disable=invalid-name
+    lower = p >= q
+    edge_matrix[p[lower], q[lower]] = True
+
+    p, q, r, s = np.nonzero(h_2)  # pylint: disable=invalid-name
+    num_unique = _num_unique(p, q, r, s)
+    # Identify and skip one of the complex conjugates.
+    skip = ~((p == s) & (q == r)) & np.where(num_unique == 4,
+                                             np.minimum(r, s) < np.minimum(p, q),
+                                             (p != r) & (q < p))
+    p, q, r, s = p[~skip], q[~skip], r[~skip], s[~skip]  # pylint: disable=invalid-name
+    num_unique = num_unique[~skip]
+
+    # Handle case of four unique indices.
+    four = (num_unique == 4) & (p >= q)
+    edge_matrix[p[four], q[four]] = True
+    edge_matrix[np.maximum(r, s)[four], np.minimum(r, s)[four]] = True
+
+    # Handle case of three unique indices, identify equal tensor factors.
+    _, i, j, _ = _three_index_factors(p, q, r, s)
+    three = (num_unique == 3) & (i >= 0)
+    edge_matrix[np.maximum(i, j)[three], np.minimum(i, j)[three]] = True
 
     edge_list = np.asarray(np.nonzero(np.triu(edge_matrix.T) ^ np.diag(np.diag(edge_matrix.T))))
     return edge_list
 
 
+def _num_unique(p, q, r, s):  # pylint: disable=invalid-name
+    """ Number of distinct indices of each term """
+    indices = np.sort(np.stack([p, q, r, s], axis=1), axis=1)
+    return 1 + np.count_nonzero(indices[:, 1:] != indices[:, :-1], axis=1)
+
+
+def _three_index_factors(p, q, r, s):  # pylint: disable=invalid-name
+    """
+    For the terms with three unique indices, the repeated index, the two other ones, one
+    of the creation and one of the annihilation operators, and the coefficient of the mapped
+    term. The indices are -1 for the terms without a repeated creation and annihilation index.
+    """
+    conditions = [p == r, p == s, q == r, q == s]
+    repeated = np.select(conditions, [p, p, q, q], -1)
+    i = np.select(conditions, [q, q, p, p], -1)
+    j = np.select(conditions, [s, r, s, r], -1)
+    coeff = np.select(conditions, [0.25j, -0.25j, -0.25j, 0.25j], 0)
+    return repeated, i, j, coeff
+
+
+def _edge_operators(edge_list, modes):
+    """
+    Calculate the z and x bits of all the edge operators B_i and A_ij at once, as
+    edge_operator_bi and edge_operator_aij do.
+
+    Args:
+        edge_list (numpy.ndarray): a 2xE matrix, where E is total number of edge
+                                    and each pair denotes (from, to)
+        modes (int): number of modes
+
+    Returns:
+        tuple(numpy.ndarray, numpy.ndarray): the z and x bits of the operators, one row per
+        operator: B_i at row i, A_ij at row (i + 1) * modes + j and the identity at the last row
+    """
+    num_qubits = edge_list.shape[1]
+    edge_from, edge_to = edge_list
+    mode = np.arange(modes)
+
+    b_z = (edge_from == mode[:, None]) | (edge_to == mode[:, None])
+
+    i = mode[:, None, None]
+    j = mode[None, :, None]
+    a_z = ((edge_from == i) & (edge_to < j)) | ((edge_to == i) & (edge_from < j)) \
+        | ((edge_from == j) & (edge_to < i)) | ((edge_to == j) & (edge_from < i))
+    a_x = np.zeros((modes, modes, num_qubits), dtype=bool)
+    if num_qubits > 0:
+        position = np.full((modes, modes), -1)
+        position[edge_from, edge_to] = np.arange(num_qubits)
+        position[edge_to, edge_from] = np.arange(num_qubits)
+        a_x[mode[:, None], mode[None, :], position] = True
+
+    no_bits = np.zeros((1, num_qubits), dtype=bool)
+    ops_z = np.concatenate([b_z, a_z.reshape(-1, num_qubits), no_bits])
+    ops_x = np.concatenate([np.zeros_like(b_z), a_x.reshape(-1, num_qubits), no_bits])
+    return ops_z, ops_x
+
+
+def _map_edge_terms(values, monomials, ops_z, ops_x):
+    """
+    Maps a family of terms, each a linear combination of products of edge operators with the
+    same structure, to Paulis, for all terms at once.
+
+    Args:
+        values (numpy.ndarray): the coefficient of each term
+        monomials (list[tuple(float, list[numpy.ndarray])]): the coefficient and the factors of
+            each product, a factor being the row of the edge operator of each term in
+            ``ops_z`` and ``ops_x``
+        ops_z (numpy.ndarray): the z bits of the edge operators
+        ops_x (numpy.ndarray): the x bits of the edge operators
+
+    Returns:
+        tuple(numpy.ndarray, numpy.ndarray, numpy.ndarray): the z bits, x bits and
+        coefficients of the Paulis, merged within each term and then across terms.
+    """
+    num_qubits = ops_z.shape[1]
+    block_size = max(1, (1 << 22) // (len(monomials) * max(num_qubits, 1)))
+    z_blocks, x_blocks, coeff_blocks = [], [], []
+    for start in range(0, len(values), block_size):
+        block = slice(start, start + block_size)
+        z_terms, x_terms, coeff_terms = [], [], []
+        for coeff, factors in monomials:
+            z = ops_z[factors[0][block]]
+            x = ops_x[factors[0][block]]
+            phase = 0
+            for factor in factors[1:]:
+                z, x, factor_phase = _pauli_bits_product(z, x, ops_z[factor[block]],
+                                                         ops_x[factor[block]])
+                phase = phase + factor_phase
+            z_terms.append(z)
+            x_terms.append(x)
+            coeff_terms.append(coeff * values[block] * (1j ** (phase % 4)))
+        terms = np.tile(np.arange(len(values[block])), len(monomials))
+        z, x, coeffs = _merge_pauli_bits(np.concatenate(z_terms), np.concatenate(x_terms),
+                                         np.concatenate(coeff_terms), terms)
+        # the Paulis cancelling out within a term are dropped before merging across terms
+        keep = coeffs != 0
+        z, x, coeffs = _merge_pauli_bits(z[keep], x[keep], coeffs[keep])
+        z_blocks.append(z)
+        x_blocks.append(x)
+        coeff_blocks.append(coeffs)
+
+    if not coeff_blocks:
+        return (np.zeros((0, num_qubits), dtype=bool), np.zeros((0, num_qubits), dtype=bool),
+                np.zeros(0, dtype=complex))
+    return np.concatenate(z_blocks), np.concatenate(x_blocks), np.concatenate(coeff_blocks)
+
+
 def edge_operator_aij(edge_list, i, j):
     """Calculate the edge operator A_ij.
 
@@ -311,52 +413,91 @@ def bksf_mapping(fer_op):
     (B_i and A_ij). A detailed description of these operators and the terms
     of the electronic Hamiltonian are provided in (arXiv 1712.00446).
 
+    All the edge operators are computed once as z and x bits, and each type of term is mapped
+    for all its nonzero integrals at once, as products of these bits, before the resulting
+    Paulis are merged into a single operator.
+
     Args:
         fer_op (FermionicOperator): the fermionic operator in the second quantized form
 
     Returns:
         WeightedPauliOperator: mapped qubit operator
     """
-    fer_op = copy.deepcopy(fer_op)
+    h_1 = fer_op.h1
     # bksf mapping works with the 'physicist' notation.
-    fer_op.h2 = np.einsum('ijkm->ikmj', fer_op.h2)
+    h_2 = np.einsum('ijkm->ikmj', fer_op.h2)
     modes = fer_op.modes
-    # Initialize qubit operator as constant.
-    qubit_op = WeightedPauliOperator(paulis=[])
-    edge_list = bravyi_kitaev_fast_edge_list(fer_op)
-    # Loop through all indices.
-    for p in range(modes):  # pylint: disable=invalid-name
-        for q in range(modes):
-            # Handle one-body terms.
-            h1_pq = fer_op.h1[p, q]
-
-            if h1_pq != 0.0 and p >= q:
-                qubit_op += _one_body(edge_list, p, q, h1_pq)
-
-            # Keep looping for the two-body terms.
-            for r in range(modes):
-                for s in range(modes):  # pylint: disable=invalid-name
-                    h2_pqrs = fer_op.h2[p, q, r, s]
-
-                    # Skip zero terms.
-                    if (h2_pqrs == 0.0) or (p == q) or (r == s):
-                        continue
-
-                    # Identify and skip one of the complex conjugates.
-                    if [p, q, r, s] != [s, r, q, p]:
-                        if len(set([p, q, r, s])) == 4:
-                            if min(r, s) < min(p, q):
-                                continue
-                        # Handle case of 3 unique indices
-                        elif len(set([p, q, r, s])) == 3:
-                            qubit_op += _two_body(edge_list, p, q, r, s, 0.5 * h2_pqrs)
-                            continue
-                        elif p != r and q < p:
-                            continue
-
-                    qubit_op += _two_body(edge_list, p, q, r, s, h2_pqrs)
+    edge_list = _edge_list(h_1, h_2)
+    if edge_list.shape[1] == 0:
+        # without edges all the edge operators are the identity and every term cancels out
+        return WeightedPauliOperator(paulis=[])
+    ops_z, ops_x = _edge_operators(edge_list, modes)
+    identity = modes * (modes + 1)
+    families = []
+
+    # Handle one-body terms.
+    p, q = np.nonzero(h_1)  # pylint: disable=invalid-name
+    lower = p >= q
+    p, q = p[lower], q[lower]  # pylint: disable=invalid-name
+    values = h_1[p, q]
+    # Handle off-diagonal terms, q < p.
+    off = p != q
+    a_qp = (q[off] + 1) * modes + p[off]
+    families.append((-0.5j * values[off], [(1.0, [a_qp, p[off]]), (1.0, [q[off], a_qp])]))
+    # Handle diagonal terms.
+    diag = ~off
+    families.append((0.5 * values[diag], [(1.0, [np.full(np.count_nonzero(diag), identity)]),
+                                          (-1.0, [p[diag]])]))
+
+    # Handle two-body terms.
+    p, q, r, s = np.nonzero(h_2)  # pylint: disable=invalid-name
+    values = h_2[p, q, r, s]
+    keep = (p != q) & (r != s)
+    p, q, r, s = p[keep], q[keep], r[keep], s[keep]  # pylint: disable=invalid-name
+    values = values[keep]
+    num_unique = _num_unique(p, q, r, s)
+    conjugate = ~((p == s) & (q == r))
+
+    # Handle case of four unique indices, skip one of the complex conjugates.
+    four = (num_unique == 4) & ~(conjugate & (np.minimum(r, s) < np.minimum(p, q)))
+    p_4, q_4, r_4, s_4 = p[four], q[four], r[four], s[four]
+    sign = np.where(q_4 < p_4, -1, 1) * np.where(s_4 < r_4, -1, 1)
+    a_pq = (p_4 + 1) * modes + q_4
+    a_rs = (r_4 + 1) * modes + s_4
+    families.append((0.125 * sign * values[four],
+                     [(-1.0, [a_pq, a_rs]),
+                      (-1.0, [a_pq, a_rs, p_4, q_4]),
+                      (1.0, [a_pq, a_rs, p_4, r_4]),
+                      (1.0, [a_pq, a_rs, p_4, s_4]),
+                      (1.0, [a_pq, a_rs, q_4, r_4]),
+                      (1.0, [a_pq, a_rs, q_4, s_4]),
+                      (-1.0, [a_pq, a_rs, r_4, s_4]),
+                      (-1.0, [a_pq, a_rs, p_4, q_4, r_4, s_4])]))
+
+    # Handle case of three unique indices, with half of the coefficient for each conjugate.
+    three = num_unique == 3
+    repeated, i, j, coeff = _three_index_factors(p[three], q[three], r[three], s[three])
+    sign = np.where(j < i, -1, 1)
+    a_ij = (i + 1) * modes + j
+    families.append((coeff * np.where(conjugate[three], 0.5, 1.0) * sign * values[three],
+                     [(1.0, [a_ij, j]), (-1.0, [a_ij, j, repeated]),
+                      (1.0, [i, a_ij]), (-1.0, [i, a_ij, repeated])]))
 
-    qubit_op.simplify()
+    # Handle case of two unique indices.
+    two = (num_unique == 2) & ~(conjugate & (p != r) & (q < p))
+    p_2, q_2 = p[two], q[two]
+    families.append((np.where(p_2 == s[two], 0.25, -0.25) * values[two],
+                     [(1.0, [np.full(len(p_2), identity)]), (-1.0, [q_2]), (-1.0, [p_2]),
+                      (1.0, [p_2, q_2])]))
+
+    z, x, coeffs = zip(*[_map_edge_terms(values, monomials, ops_z, ops_x)
+                         for values, monomials in families])
+    z, x, coeffs = _merge_pauli_bits(np.concatenate(z), np.concatenate(x),
+                                     np.concatenate(coeffs))
+    keep = coeffs != 0
+    qubit_op = WeightedPauliOperator(
+        paulis=[[coeff, Pauli(z_i, x_i)]
+                for coeff, z_i, x_i in zip(coeffs[keep].tolist(), z[keep], x[keep])])
     return qubit_op
 
 
@@ -66,6 +66,19 @@ Driver Common
    BasisType
    InitialGuess
 
+Driver Cache
+============
+The QMolecules computed by the :class:`GaussianDriver`, :class:`PSI4Driver`,
+:class:`PyQuanteDriver` and :class:`PySCFDriver` can be saved to a :class:`QMoleculeCache`,
+set as the driver :attr:`~BaseDriver.cache`, and are then loaded again when the driver is run
+with the same configuration instead of being computed.
+
+.. autosummary::
+   :toctree: ../stubs/
+   :nosignatures:
+
+   QMoleculeCache
+
 Drivers
 =======
 The drivers in the chemistry module obtain their information from classical ab-initio programs
@@ -115,6 +128,7 @@ of interest that is parsed from the log.
 """
 
 from .base_driver import BaseDriver
+from .qmolecule_cache import QMoleculeCache
 from .molecule import Molecule
 from .fermionic_driver import FermionicDriver, HFMethodType
 from .units_type import UnitsType
@@ -128,6 +142,7 @@ from .pyscfd import PySCFDriver, InitialGuess
 __all__ = ['HFMethodType',
            'Molecule',
            'BaseDriver',
+           'QMoleculeCache',
            'FermionicDriver',
            'UnitsType',
            'FCIDumpDriver',
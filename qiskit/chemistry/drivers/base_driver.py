@@ -14,10 +14,12 @@
 This module implements the abstract base class for driver modules.
 """
 
-from typing import Optional
+from typing import Callable, Optional
 from abc import ABC, abstractmethod
 
 from .molecule import Molecule
+from .qmolecule_cache import QMoleculeCache
+from ..qmolecule import QMolecule
 from ..qiskit_chemistry_error import QiskitChemistryError
 
 
@@ -49,6 +51,7 @@ class BaseDriver(ABC):
         self._basis = basis
         self._hf_method = hf_method
         self._supports_molecule = supports_molecule
+        self._cache = None  # type: Optional[QMoleculeCache]
 
     @property
     def supports_molecule(self) -> bool:
@@ -91,3 +94,35 @@ class BaseDriver(ABC):
     def hf_method(self, value: str) -> None:
         """ set Hartree-Fock method """
         self._hf_method = value
+
+    @property
+    def cache(self) -> Optional[QMoleculeCache]:
+        """ return the cache of the computed QMolecules, None if disabled """
+        return self._cache
+
+    @cache.setter
+    def cache(self, value: Optional[QMoleculeCache]) -> None:
+        """ set the cache of the computed QMolecules, None to disable it """
+        self._cache = value
+
+    def _cached_run(self, config: str, compute: Callable[[], QMolecule]) -> QMolecule:
+        """
+        Loads the QMolecule of the configuration from the cache, if enabled, or computes it and
+        saves it to the cache.
+
+        Args:
+            config: The driver configuration, which must determine the computed QMolecule.
+            compute: Computes the QMolecule.
+
+        Returns:
+            The QMolecule of the configuration.
+        """
+        if self._cache is None:
+            return compute()
+
+        key = QMoleculeCache.key(self.__class__.__name__, config)
+        q_mol = self._cache.load(key)
+        if q_mol is None:
+            q_mol = compute()
+            self._cache.save(key, q_mol)
+        return q_mol
@@ -12,20 +12,43 @@
 
 """FCIDump parser."""
 
-from typing import Any, Dict, Set, Tuple
+from typing import Any, Dict, Iterable, Optional, TextIO, Tuple
 import itertools
 import re
 import numpy as np
 
 from qiskit.chemistry import QiskitChemistryError
 
+# number of integral lines which are read and converted at once
+CHUNK_SIZE = 100000
 
-def parse(fcidump: str) -> Dict[str, Any]:
+# Index orders of the 8-fold permutational symmetry of real 2-electron integrals,
+# ( ia | jb ) = ( ai | jb ) = ( ia | bj ) = ( ai | bj ) = ( jb | ia ) = ... , given as the positions
+# in (i, a, j, b) of the indices of the equivalent element. The transposed element comes first as
+# it is the one looked up first for equal spins. Only the first four orders, which permute the
+# indices within the bra and the ket, apply when the spins of the bra and the ket differ.
+_2E_SYMMETRIES = ((3, 2, 1, 0),
+                  (1, 0, 2, 3), (0, 1, 3, 2), (1, 0, 3, 2),
+                  (2, 3, 0, 1), (3, 2, 0, 1), (2, 3, 1, 0))
+_2E_MIXED_SPIN_SYMMETRIES = ((1, 0, 2, 3), (0, 1, 3, 2), (1, 0, 3, 2))
+
+
+def parse(fcidump: str, packed: bool = False) -> Dict[str, Any]:
     # pylint: disable=wrong-spelling-in-comment
     """Parses a FCIDump output.
 
+    The integrals are read line by line, in chunks of ``CHUNK_SIZE`` lines which are converted by
+    numpy and written directly into the integral arrays, so the file is never held in memory.
+
     Args:
         fcidump: Path to the FCIDump file.
+        packed: If ``True`` the 2-electron integrals are returned in a packed layout storing one
+            value per set of symmetry-equivalent elements, instead of as norb^4 arrays. With the
+            compound index ``pair(p, q) = max(p, q) * (max(p, q) + 1) / 2 + min(p, q)``, element
+            ``(ia|jb)`` of ``hijkl`` and ``hijkl_bb`` is stored at index
+            ``pair(pair(i, a), pair(j, b))`` of a 1-D array (8-fold symmetry), and element
+            ``(ia|jb)`` of ``hijkl_ba`` at index ``[pair(i, a), pair(j, b)]`` of a 2-D array
+            (4-fold symmetry).
     Raises:
         QiskitChemistryError: If the input file cannot be found, if a required field in the FCIDump
             file is missing, if wrong integral indices are encountered, or if the alpha/beta or
@@ -34,17 +57,39 @@ def parse(fcidump: str) -> Dict[str, Any]:
         A dictionary storing the parsed data.
     """
     try:
-        with open(fcidump, 'r') as file:
-            fcidump_str = file.read()
+        file = open(fcidump, 'r')
     except OSError as ex:
         raise QiskitChemistryError("Input file '{}' cannot be read!".format(fcidump)) from ex
 
+    with file:
+        output, remainder = _parse_namelist(file)
+        _parse_integrals(itertools.chain([remainder], file), output, packed)
+
+    return output
+
+
+def _parse_namelist(file: TextIO) -> Tuple[Dict[str, Any], str]:
+    """Parses the Fortran namelist of meta data at the start of the FCIDump.
+
+    Returns:
+        The parsed meta data, and the rest of the line which ends the namelist.
+    Raises:
+        QiskitChemistryError: If the end of the namelist, or its NORB or NELEC entry, is missing.
+    """
+    lines = []
+    for line in file:
+        namelist_end = re.search('(/|&END)', line)
+        if namelist_end is not None:
+            lines.append(line[:namelist_end.start(0)])
+            remainder = line[namelist_end.end(0):]
+            break
+        lines.append(line)
+    else:
+        raise QiskitChemistryError("The end of the FCIDump namelist is missing!")
+
     output = {}  # type: Dict[str, Any]
 
-    # FCIDump starts with a Fortran namelist of meta data
-    namelist_end = re.search('(/|&END)', fcidump_str)
-    metadata = fcidump_str[:namelist_end.start(0)]
-    metadata = ' '.join(metadata.split())  # replace duplicate whitespace and newlines
+    metadata = ' '.join(' '.join(lines).split())  # replace duplicate whitespace and newlines
     # we know what elements to look for so we don't get too fancy with the parsing
     # pattern explanation:
     #  .*?      any text
@@ -87,12 +132,17 @@ def parse(fcidump: str) -> Dict[str, Any]:
     _nroot = re.search('NROOT'+pattern, metadata)
     output['NROOT'] = int(_nroot.groups()[0]) if _nroot else 1
 
-    # If the FCIDump file resulted from an unrestricted spin calculation the indices will label spin
-    # rather than molecular orbitals. This means, that a line must exist which encodes the
-    # coefficient for the spin orbital with index (norb*2, norb*2). By checking for such a line we
-    # can distinguish between unrestricted and restricted FCIDump files.
-    _uhf = bool(re.search(r'.*(\s+{}\s+{}\s+0\s+0)'.format(norb*2, norb*2),
-                          fcidump_str[namelist_end.start(0):]))
+    return output, remainder
+
+
+def _parse_integrals(lines: Iterable[str], output: Dict[str, Any], packed: bool) -> None:
+    """Parses the integral lines of the FCIDump into the output dictionary.
+
+    Raises:
+        QiskitChemistryError: If the integral lines are malformed, if wrong integral indices are
+            encountered, or if the alpha/beta or beta/alpha 2-electron integrals are mixed.
+    """
+    norb = output['NORB']
 
     # the rest of the FCIDump will hold lines of the form x i a j b
     # a few cases have to be treated differently:
@@ -100,144 +150,211 @@ def parse(fcidump: str) -> Dict[str, Any]:
     # TODO: a, j and b are all zero: x is the energy of the i-th MO  (often not supported)
     # j and b are both zero: x is the 1e-integral between i and a (x = <i|h|a>)
     # otherwise: x is the Coulomb integral ( x = (ia|jb) )
-    hij = np.zeros((norb, norb))
-    hij_elements = set(itertools.product(range(norb), repeat=2))
-    hijkl = np.zeros((norb, norb, norb, norb))
-    hijkl_elements = set(itertools.product(range(norb), repeat=4))
-    hij_b = hijkl_ab = hijkl_ba = hijkl_bb = None
-    hij_b_elements = hijkl_ab_elements = hijkl_ba_elements = hijkl_bb_elements = set()
-    if _uhf:
-        beta_range = [n+norb for n in range(norb)]
-        hij_b = np.zeros((norb, norb))
-        hij_b_elements = set(itertools.product(beta_range, repeat=2))
-        hijkl_ab = np.zeros((norb, norb, norb, norb))
-        hijkl_ba = np.zeros((norb, norb, norb, norb))
-        hijkl_bb = np.zeros((norb, norb, norb, norb))
-        hijkl_ab_elements = set(itertools.product(
-            range(norb), range(norb), beta_range, beta_range
-        ))
-        hijkl_ba_elements = set(itertools.product(
-            beta_range, beta_range, range(norb), range(norb)
-        ))
-        hijkl_bb_elements = set(itertools.product(beta_range, repeat=4))
-    orbital_data = fcidump_str[namelist_end.end(0):].split('\n')
-    for orbital in orbital_data:
-        if not orbital:
-            continue
-        x = float(orbital.split()[0])
+    hij = _Integrals(norb, 2, packed=False)
+    hijkl = _Integrals(norb, 4, packed=packed)
+    # the integrals with beta spin indices are allocated at the first line which has one, but are
+    # only known to be valid once the whole file is read
+    beta_integrals = None  # type: Optional[_BetaIntegrals]
+    first_beta = ''
+
+    # If the FCIDump file resulted from an unrestricted spin calculation the indices will label spin
+    # rather than molecular orbitals. This means, that a line must exist which encodes the
+    # coefficient for the spin orbital with index (norb*2, norb*2). By checking for such a line we
+    # can distinguish between unrestricted and restricted FCIDump files.
+    _uhf = False
+
+    lines = iter(lines)
+    while True:
+        chunk = list(itertools.islice(lines, CHUNK_SIZE))
+        if not chunk:
+            break
+        try:
+            data = np.array(' '.join(chunk).split(), dtype=float).reshape(-1, 5)
+        except ValueError as ex:
+            raise QiskitChemistryError("Malformed integral lines encountered in the FCIDump!") \
+                from ex
         # Note: differing naming than ijkl due to E741 and this iajb is inline with this:
         # https://hande.readthedocs.io/en/latest/manual/integrals.html#fcidump-format
-        i, a, j, b = [int(i) for i in orbital.split()[1:]]  # pylint: disable=invalid-name
-        if i == a == j == b == 0:
-            output['ecore'] = x
-        elif a == j == b == 0:
-            # TODO: x is the energy of the i-th MO
-            continue
-        elif j == b == 0:
-            try:
-                hij_elements.remove((i-1, a-1))
-                hij[i-1][a-1] = x
-            except KeyError as ex:
-                if _uhf:
-                    hij_b_elements.remove((i-1, a-1))
-                    hij_b[i-1-norb][a-1-norb] = x
-                else:
-                    raise QiskitChemistryError("Unkown 1-electron integral indices encountered in \
-                            '{}'".format((i, a))) from ex
-        else:
-            try:
-                hijkl_elements.remove((i-1, a-1, j-1, b-1))
-                hijkl[i-1][a-1][j-1][b-1] = x
-            except KeyError as ex:
-                if _uhf:
-                    try:
-                        hijkl_ab_elements.remove((i-1, a-1, j-1, b-1))
-                        hijkl_ab[i-1][a-1][j-1-norb][b-1-norb] = x
-                    except KeyError:
-                        try:
-                            hijkl_ba_elements.remove((i-1, a-1, j-1, b-1))
-                            hijkl_ba[i-1-norb][a-1-norb][j-1][b-1] = x
-                        except KeyError:
-                            hijkl_bb_elements.remove((i-1, a-1, j-1, b-1))
-                            hijkl_bb[i-1-norb][a-1-norb][j-1-norb][b-1-norb] = x
-                else:
-                    raise QiskitChemistryError("Unkown 2-electron integral indices encountered in \
-                            '{}'".format((i, a, j, b))) from ex
+        indices = data[:, 1:].astype(int)
+        i, a, j, b = indices.T  # pylint: disable=invalid-name
+
+        core = (i == 0) & (a == 0) & (j == 0) & (b == 0)
+        if np.any(core):
+            output['ecore'] = data[core, 0][-1]
 
-    # iterate over still empty elements in 1-electron matrix and populate with symmetric ones
-    # if any elements are not populated these will be zero
-    _permute_1e_ints(hij, hij_elements, norb)
+        one_e = (j == 0) & (b == 0) & (a != 0)
+        two_e = ~((j == 0) & (b == 0))
+        alpha = np.all(indices <= norb, axis=1)
 
-    if _uhf:
-        # do the same for beta spin
-        _permute_1e_ints(hij_b, hij_b_elements, norb, beta=True)
+        hij.store(indices[one_e & alpha, :2] - 1, data[one_e & alpha, 0])
+        hijkl.store(indices[two_e & alpha] - 1, data[two_e & alpha, 0])
 
-    # do the same of the 2-electron 4D matrix
-    _permute_2e_ints(hijkl, hijkl_elements, norb)
+        beta = (one_e | two_e) & ~alpha
+        if np.any(beta):
+            if beta_integrals is None:
+                beta_integrals = _BetaIntegrals(norb, packed)
+                # the line reported if the file turns out not to be unrestricted
+                first = np.flatnonzero(beta)[0]
+                if one_e[first]:
+                    first_beta = "1-electron integral indices encountered in '{}'".format(
+                        tuple(indices[first, :2]))
+                else:
+                    first_beta = "2-electron integral indices encountered in '{}'".format(
+                        tuple(indices[first]))
+            beta_integrals.store(data[one_e & ~alpha], data[two_e & ~alpha])
+            _uhf |= bool(np.any(one_e & (i == 2 * norb) & (a == 2 * norb)))
+
+    hij.symmetrize()
+    hijkl.symmetrize()
+    output['hij'] = hij.array
+    output['hijkl'] = hijkl.array
+    output['hij_b'] = output['hijkl_ba'] = output['hijkl_bb'] = None
 
-    if _uhf:
-        # do the same for beta spin
-        _permute_2e_ints(hijkl_bb, hijkl_bb_elements, norb, beta=2)
-        _permute_2e_ints(hijkl_ab, hijkl_ab_elements, norb, beta=1)  # type: ignore
-        _permute_2e_ints(hijkl_ba, hijkl_ba_elements, norb, beta=1)  # type: ignore
+    if beta_integrals is None:
+        return
+    if not _uhf:
+        # beta spin indices are only valid in an unrestricted FCIDump
+        raise QiskitChemistryError("Unkown " + first_beta)
 
-        # assert that EITHER hijkl_ab OR hijkl_ba were given
-        if np.allclose(hijkl_ab, 0.0) == np.allclose(hijkl_ba, 0.0):
-            raise QiskitChemistryError("Encountered mixed sets of indices for the 2-electron \
-                    integrals. Either alpha/beta or beta/alpha matrix should be specified.")
+    hij_b, hijkl_ab, hijkl_ba, hijkl_bb = beta_integrals.symmetrize()
 
-        if np.allclose(hijkl_ba, 0.0):
-            hijkl_ba = hijkl_ab.transpose()
+    # assert that EITHER hijkl_ab OR hijkl_ba were given
+    if np.allclose(hijkl_ab, 0.0) == np.allclose(hijkl_ba, 0.0):
+        raise QiskitChemistryError("Encountered mixed sets of indices for the 2-electron \
+                integrals. Either alpha/beta or beta/alpha matrix should be specified.")
 
-    output['hij'] = hij
     output['hij_b'] = hij_b
-    output['hijkl'] = hijkl
-    output['hijkl_ba'] = hijkl_ba
     output['hijkl_bb'] = hijkl_bb
+    output['hijkl_ba'] = hijkl_ba
+    if np.allclose(hijkl_ba, 0.0):
+        output['hijkl_ba'] = hijkl_ab.transpose()
 
-    return output
 
+def _check_beta_indices(one_e: np.ndarray, two_e: np.ndarray, norb: int) -> None:
+    """Raises an error for 1-based integral indices out of the range of the spin orbitals, or
+    with a bra or a ket mixing the spins.
 
-def _permute_1e_ints(hij: np.ndarray,
-                     elements: Set[Tuple[int, ...]],
-                     norb: int,
-                     beta: bool = False) -> None:
-    for elem in elements.copy():
-        shifted = tuple(e-(beta * norb) for e in elem)
-        hij[shifted] = hij[shifted[::-1]]
-        elements.remove(elem)
+    Raises:
+        QiskitChemistryError: If such integral indices are encountered.
+    """
+    for indices, name in ((one_e, '1-electron'), (two_e, '2-electron')):
+        invalid = np.any((indices < 1) | (indices > 2 * norb), axis=1)
+        beta = indices > norb
+        # the bra and the ket must each belong to a single spin
+        invalid |= beta[:, 0] != beta[:, 1]
+        if indices.shape[1] == 4:
+            invalid |= beta[:, 2] != beta[:, 3]
+        if np.any(invalid):
+            raise QiskitChemistryError("Unkown {} integral indices encountered in '{}'".format(
+                name, tuple(indices[invalid][0])))
 
 
-def _permute_2e_ints(hijkl: np.ndarray,
-                     elements: Set[Tuple[int, ...]],
-                     norb: int,
-                     beta: int = 0) -> None:
-    # pylint: disable=wrong-spelling-in-comment
-    for elem in elements.copy():
-        shifted = tuple(e-((e >= norb) * norb) for e in elem)
-        # initially look for "transposed" element if spins are equal
-        if beta != 1 and elem[::-1] not in elements:
-            hijkl[shifted] = hijkl[shifted[::-1]]
-            elements.remove(elem)
-            continue
-        # then look at permutations of indices within the bra and ket respectively
-        bra_perms = set(itertools.permutations(elem[:2]))
-        ket_perms = set(itertools.permutations(elem[2:]))
-        if beta == 1:
-            # generally (ij|ab) != (ab|ij)
-            # thus, the possible permutations are much less when the spins differ
-            permutations = itertools.product(bra_perms, ket_perms)
+class _Integrals:
+    """An array of integrals filled from the FCIDump lines, together with the mask of the
+    elements which were given, from which the missing elements are filled by symmetry."""
+
+    def __init__(self, norb: int, rank: int, packed: bool, mixed_spin: bool = False) -> None:
+        self._norb = norb
+        self._rank = rank
+        self._packed = packed and rank == 4
+        self._mixed_spin = mixed_spin
+        if self._packed:
+            npair = norb * (norb + 1) // 2
+            shape = (npair, npair) if mixed_spin else (npair * (npair + 1) // 2,)
         else:
-            # ( ij | kl ) gives { ( ij | kl ), ( ij | lk ), ( ji | kl ), ( ji | lk ) }
-            # AND { ( kl | ij ), ( kl | ji ), ( lk | ij ), ( lk | ji ) }
-            # BUT NOT ( ik | jl ) etc.
-            permutations = itertools.chain(
-                itertools.product(bra_perms, ket_perms),
-                itertools.product(ket_perms, bra_perms)
-            )
-        for perm in {e1 + e2 for e1, e2 in permutations}:
-            if perm in elements:
-                continue
-            hijkl[shifted] = hijkl[tuple([e-((e >= norb) * norb) for e in perm])]
-            elements.remove(elem)
-            break
+            shape = (norb,) * rank
+        self.array = np.zeros(shape)
+        self._seen = np.zeros(shape, dtype=bool)
+
+    def store(self, indices: np.ndarray, values: np.ndarray) -> None:
+        """Stores the values at the given zero-based indices.
+
+        Raises:
+            QiskitChemistryError: If indices out of the range of the orbitals are encountered.
+        """
+        if len(values) == 0:
+            return
+        if np.any((indices < 0) | (indices >= self._norb)):
+            raise QiskitChemistryError("Unkown integral indices encountered in '{}'".format(
+                tuple(indices[np.any((indices < 0) | (indices >= self._norb), axis=1)][0] + 1)))
+        if self._packed:
+            # all symmetry-equivalent elements are stored in the same place
+            bra = _pair(indices[:, 0], indices[:, 1])
+            ket = _pair(indices[:, 2], indices[:, 3])
+            if self._mixed_spin:
+                index = (bra, ket)
+            else:
+                index = _pair(bra, ket)
+        else:
+            index = tuple(indices.T)
+        self.array[index] = values
+        self._seen[index] = True
+
+    def symmetrize(self) -> None:
+        """Populates the elements which were not given from symmetry-equivalent ones which were.
+        Elements for which none were given remain zero."""
+        if self._packed:
+            return
+        if self._rank == 2:
+            symmetries = [(1, 0)]
+        elif self._mixed_spin:
+            symmetries = _2E_MIXED_SPIN_SYMMETRIES
+        else:
+            symmetries = _2E_SYMMETRIES
+        for order in symmetries:
+            axes = np.argsort(order)
+            missing = ~self._seen & self._seen.transpose(axes)
+            self.array[missing] = self.array.transpose(axes)[missing]
+            self._seen |= missing
+
+
+class _BetaIntegrals:
+    """The integrals with beta spin indices of an unrestricted FCIDump, i.e. the 1-electron beta
+    integrals and the alpha/beta, beta/alpha and beta/beta 2-electron integrals."""
+
+    def __init__(self, norb: int, packed: bool) -> None:
+        self._norb = norb
+        self._hij_b = _Integrals(norb, 2, packed=False)
+        self._hijkl_ab = _Integrals(norb, 4, packed=packed, mixed_spin=True)
+        self._hijkl_ba = _Integrals(norb, 4, packed=packed, mixed_spin=True)
+        self._hijkl_bb = _Integrals(norb, 4, packed=packed)
+
+    def store(self, one_e: np.ndarray, two_e: np.ndarray) -> None:
+        """Stores the values of the given 1-electron and 2-electron integral lines.
+
+        Raises:
+            QiskitChemistryError: If integral indices out of the range of the spin orbitals, or
+                with a bra or a ket mixing the spins, are encountered.
+        """
+        norb = self._norb
+        one_e_indices = one_e[:, 1:3].astype(int)
+        two_e_indices = two_e[:, 1:].astype(int)
+        _check_beta_indices(one_e_indices, two_e_indices, norb)
+
+        self._hij_b.store(one_e_indices - 1 - norb, one_e[:, 0])
+        indices = two_e_indices - 1
+        beta = indices >= norb
+        indices -= beta * norb
+        for integrals, spins in ((self._hijkl_ab, [False, False, True, True]),
+                                 (self._hijkl_ba, [True, True, False, False]),
+                                 (self._hijkl_bb, [True, True, True, True])):
+            selected = np.all(beta == spins, axis=1)
+            integrals.store(indices[selected], two_e[selected, 0])
+
+    def symmetrize(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Populates the elements which were not given from symmetry-equivalent ones which were.
+
+        Returns:
+            The 1-electron beta integrals and the alpha/beta, beta/alpha and beta/beta 2-electron
+            integrals.
+        """
+        for integrals in (self._hij_b, self._hijkl_ab, self._hijkl_ba, self._hijkl_bb):
+            integrals.symmetrize()
+        return (self._hij_b.array, self._hijkl_ab.array, self._hijkl_ba.array,
+                self._hijkl_bb.array)
+
+
+def _pair(first: np.ndarray, second: np.ndarray) -> np.ndarray:
+    """Returns the compound index of the unordered pair (first, second)."""
+    high = np.maximum(first, second)
+    return high * (high + 1) // 2 + np.minimum(first, second)
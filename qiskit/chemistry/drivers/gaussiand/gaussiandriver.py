@@ -110,6 +110,10 @@ class GaussianDriver(FermionicDriver):
                      cfg.replace('\r', '\\r').replace('\n', '\\n'))
         logger.debug('User supplied configuration\n%s', cfg)
 
+        return self._cached_run(cfg, lambda: GaussianDriver._compute(cfg))
+
+    @staticmethod
+    def _compute(cfg: str) -> QMolecule:
         # To the Gaussian section of the input file passed here as section string
         # add line '# Symm=NoInt output=(matrix,i4labels,mo2el) tran=full'
         # NB: Line above needs to be added in right context, i.e after any lines
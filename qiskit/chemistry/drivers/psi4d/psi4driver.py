@@ -102,6 +102,10 @@ class PSI4Driver(FermionicDriver):
         else:
             cfg = self._config
 
+        return self._cached_run(cfg, lambda: PSI4Driver._compute(cfg))
+
+    @staticmethod
+    def _compute(cfg: str) -> QMolecule:
         psi4d_directory = os.path.dirname(os.path.realpath(__file__))
         template_file = psi4d_directory + '/_template.txt'
         qiskit_chemistry_directory = os.path.abspath(os.path.join(psi4d_directory, '../..'))
@@ -125,16 +125,6 @@ class PyQuanteDriver(FermionicDriver):
         basis = self.basis
         hf_method = self.hf_method
 
-        q_mol = compute_integrals(atoms=atoms,
-                                  units=units,
-                                  charge=charge,
-                                  multiplicity=multiplicity,
-                                  basis=basis,
-                                  hf_method=hf_method,
-                                  tol=self._tol,
-                                  maxiters=self._maxiters)
-
-        q_mol.origin_driver_name = 'PYQUANTE'
         cfg = ['atoms={}'.format(atoms),
                'units={}'.format(units),
                'charge={}'.format(charge),
@@ -144,6 +134,19 @@ class PyQuanteDriver(FermionicDriver):
                'tol={}'.format(self._tol),
                'maxiters={}'.format(self._maxiters),
                '']
-        q_mol.origin_driver_config = '\n'.join(cfg)
-
-        return q_mol
+        config = '\n'.join(cfg)
+
+        def compute():
+            q_mol = compute_integrals(atoms=atoms,
+                                      units=units,
+                                      charge=charge,
+                                      multiplicity=multiplicity,
+                                      basis=basis,
+                                      hf_method=hf_method,
+                                      tol=self._tol,
+                                      maxiters=self._maxiters)
+            q_mol.origin_driver_name = 'PYQUANTE'
+            q_mol.origin_driver_config = config
+            return q_mol
+
+        return self._cached_run(config, compute)
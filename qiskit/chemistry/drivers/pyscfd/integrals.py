@@ -40,7 +40,8 @@ def compute_integrals(atom,
                       conv_tol=1e-9,
                       max_cycle=50,
                       init_guess='minao',
-                      max_memory=None):
+                      max_memory=None,
+                      init_dm=None):
     """ compute integrals """
     # Get config from input parameters
     # molecule is in PySCF atom string format e.g. "H .0 .0 .0; H .0 .0 0.2"
@@ -66,7 +67,7 @@ def compute_integrals(atom,
         mol.charge = charge
         mol.spin = spin
         mol.build(parse_arg=False)
-        q_mol = _calculate_integrals(mol, hf_method, conv_tol, max_cycle, init_guess)
+        q_mol = _calculate_integrals(mol, hf_method, conv_tol, max_cycle, init_guess, init_dm)
         if output is not None:
             _process_pyscf_log(output)
             try:
@@ -102,7 +103,8 @@ def _check_molecule_format(val):
     return val
 
 
-def _calculate_integrals(mol, hf_method='rhf', conv_tol=1e-9, max_cycle=50, init_guess='minao'):
+def _calculate_integrals(mol, hf_method='rhf', conv_tol=1e-9, max_cycle=50, init_guess='minao',
+                         init_dm=None):
     """Function to calculate the one and two electron terms. Perform a Hartree-Fock calculation in
         the given basis.
     Args:
@@ -111,6 +113,8 @@ def _calculate_integrals(mol, hf_method='rhf', conv_tol=1e-9, max_cycle=50, init
         conv_tol (float): Convergence tolerance
         max_cycle (int): Max convergence cycles
         init_guess (str): Initial guess for SCF
+        init_dm (numpy.ndarray): Initial AO density matrix for SCF, e.g. the converged density of
+            a nearby geometry. When given, and of the size of the basis, it replaces init_guess.
     Returns:
         QMolecule: QMolecule populated with driver integrals etc
     Raises:
@@ -130,7 +134,11 @@ def _calculate_integrals(mol, hf_method='rhf', conv_tol=1e-9, max_cycle=50, init
     m_f.conv_tol = conv_tol
     m_f.max_cycle = max_cycle
     m_f.init_guess = init_guess
-    ehf = m_f.kernel()
+    if init_dm is not None and np.shape(init_dm)[-1] != mol.nao_nr():
+        logger.info('Initial density matrix of shape %s ignored for %s basis functions',
+                    np.shape(init_dm), mol.nao_nr())
+        init_dm = None
+    ehf = m_f.kernel(dm0=init_dm)
     logger.info('PySCF kernel() converged: %s, e(hf): %s', m_f.converged, m_f.e_tot)
     if isinstance(m_f.mo_coeff, tuple):
         mo_coeff = m_f.mo_coeff[0]
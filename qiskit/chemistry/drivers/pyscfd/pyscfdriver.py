@@ -14,8 +14,10 @@
 
 from typing import Optional, Union, List
 import importlib
+import hashlib
 from enum import Enum
 import logging
+import numpy as np
 from qiskit.aqua.utils.validation import validate_min
 from ..units_type import UnitsType
 from ..fermionic_driver import FermionicDriver, HFMethodType
@@ -102,6 +104,25 @@ class PySCFDriver(FermionicDriver):
         self._max_cycle = max_cycle
         self._init_guess = init_guess.value
         self._max_memory = max_memory
+        self._initial_density = None  # type: Optional[np.ndarray]
+        self._density_matrix = None  # type: Optional[np.ndarray]
+
+    @property
+    def initial_density(self) -> Optional[np.ndarray]:
+        """ Returns the AO density matrix the SCF is started from, if any """
+        return self._initial_density
+
+    @initial_density.setter
+    def initial_density(self, value: Optional[np.ndarray]) -> None:
+        """ Sets the AO density matrix the SCF is started from, e.g. the
+        :attr:`density_matrix` of a nearby geometry. It replaces `init_guess` while set. """
+        self._initial_density = value
+
+    @property
+    def density_matrix(self) -> Optional[np.ndarray]:
+        """ Returns the converged AO density matrix of the last run, the total density for RHF
+        and the alpha and beta densities otherwise, or None if the driver was not run yet """
+        return self._density_matrix
 
     @staticmethod
     def _check_valid():
@@ -132,18 +153,6 @@ class PySCFDriver(FermionicDriver):
         basis = self.basis
         hf_method = self.hf_method
 
-        q_mol = compute_integrals(atom=atom,
-                                  unit=units,
-                                  charge=charge,
-                                  spin=spin,
-                                  basis=basis,
-                                  hf_method=hf_method,
-                                  conv_tol=self._conv_tol,
-                                  max_cycle=self._max_cycle,
-                                  init_guess=self._init_guess,
-                                  max_memory=self._max_memory)
-
-        q_mol.origin_driver_name = 'PYSCF'
         cfg = ['atom={}'.format(atom),
                'unit={}'.format(units),
                'charge={}'.format(charge),
@@ -155,6 +164,42 @@ class PySCFDriver(FermionicDriver):
                'init_guess={}'.format(self._init_guess),
                'max_memory={}'.format(self._max_memory),
                '']
-        q_mol.origin_driver_config = '\n'.join(cfg)
+        config = '\n'.join(cfg)
+
+        def compute():
+            q_mol = compute_integrals(atom=atom,
+                                      unit=units,
+                                      charge=charge,
+                                      spin=spin,
+                                      basis=basis,
+                                      hf_method=hf_method,
+                                      conv_tol=self._conv_tol,
+                                      max_cycle=self._max_cycle,
+                                      init_guess=self._init_guess,
+                                      max_memory=self._max_memory,
+                                      init_dm=self._initial_density)
+            q_mol.origin_driver_name = 'PYSCF'
+            q_mol.origin_driver_config = config
+            return q_mol
+
+        cache_config = config
+        if self._initial_density is not None:
+            # the initial density can change the solution the SCF converges to
+            density = np.ascontiguousarray(self._initial_density, dtype=float)
+            cache_config += 'init_dm={}:{}\n'.format(density.shape,
+                                                     hashlib.sha256(density.tobytes()).hexdigest())
+        q_mol = self._cached_run(cache_config, compute)
+        self._density_matrix = self._compute_density(q_mol, hf_method)
 
         return q_mol
+
+    @staticmethod
+    def _compute_density(q_mol: QMolecule, hf_method: str) -> np.ndarray:
+        # the occupied orbitals come first in the energy ordered molecular orbitals
+        mo_coeff_b = q_mol.mo_coeff if q_mol.mo_coeff_b is None else q_mol.mo_coeff_b
+        occ_a = q_mol.mo_coeff[:, :q_mol.num_alpha]
+        occ_b = mo_coeff_b[:, :q_mol.num_beta]
+        density = np.array([occ_a @ occ_a.T, occ_b @ occ_b.T])
+        if hf_method.lower() == 'rhf':
+            return density[0] + density[1]
+        return density
@@ -0,0 +1,181 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+A content addressed cache of the QMolecules computed by the drivers.
+"""
+
+from typing import Optional
+import os
+import hashlib
+import logging
+import tempfile
+
+from ..qmolecule import QMolecule
+
+logger = logging.getLogger(__name__)
+
+
+class QMoleculeCache:
+    """
+    A cache of the :class:`~qiskit.chemistry.QMolecule` computed by the drivers, saved as HDF5
+    files in a directory.
+
+    The files are named after a hash of the name of the driver and of its configuration, e.g.
+    the geometry, basis, charge, spin, Hartree-Fock method and convergence settings, so a driver
+    run with the same configuration loads the QMolecule instead of computing it again. When the
+    total size of the files exceeds ``max_size`` the least recently used ones are removed.
+
+    The cache is enabled on a driver by setting its :attr:`~BaseDriver.cache`. Several drivers,
+    also in different processes, can share a cache directory.
+    """
+
+    _SUFFIX = '.hdf5'
+
+    def __init__(self,
+                 cache_dir: Optional[str] = None,
+                 max_size: int = 2**30) -> None:
+        """
+        Args:
+            cache_dir: The directory of the HDF5 files, created if needed. Defaults to
+                a ``qiskit_chemistry_cache`` directory in the temporary directory.
+            max_size: The maximum total size of the HDF5 files in bytes.
+        """
+        if cache_dir is None:
+            cache_dir = os.path.join(tempfile.gettempdir(), 'qiskit_chemistry_cache')
+        os.makedirs(cache_dir, exist_ok=True)
+        self._cache_dir = cache_dir
+        self._max_size = max_size
+
+    @property
+    def cache_dir(self) -> str:
+        """ returns the directory of the HDF5 files """
+        return self._cache_dir
+
+    @property
+    def max_size(self) -> int:
+        """ returns the maximum total size of the HDF5 files in bytes """
+        return self._max_size
+
+    @max_size.setter
+    def max_size(self, value: int) -> None:
+        """ sets the maximum total size of the HDF5 files in bytes """
+        self._max_size = value
+        self._evict()
+
+    @staticmethod
+    def key(driver_name: str, config: str) -> str:
+        """
+        Returns the key of a driver configuration.
+
+        Args:
+            driver_name: The name of the driver.
+            config: The driver configuration, which must determine the computed QMolecule.
+
+        Returns:
+            The hexadecimal SHA-256 hash of the configuration and of the QMolecule version.
+        """
+        content = '\n'.join([driver_name, str(QMolecule.QMOLECULE_VERSION), config])
+        return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+    def load(self, key: str) -> Optional[QMolecule]:
+        """
+        Loads a QMolecule from the cache.
+
+        Args:
+            key: The key of the driver configuration.
+
+        Returns:
+            The QMolecule, or None if it is not in the cache.
+        """
+        file_name = self._file_name(key)
+        if not os.path.isfile(file_name):
+            return None
+
+        q_mol = QMolecule(file_name)
+        q_mol.load()
+        if q_mol.mo_onee_ints is None:
+            # the file was removed, e.g. evicted by another process, while loading
+            return None
+        # detach it from the cached file, which saving or removing the file of the QMolecule
+        # would otherwise overwrite or delete
+        q_mol._filename = None  # pylint: disable=protected-access
+        try:
+            # mark as recently used
+            os.utime(file_name)
+        except OSError:
+            pass
+
+        logger.debug('Loaded QMolecule %s from the cache', key)
+        return q_mol
+
+    def save(self, key: str, q_mol: QMolecule) -> None:
+        """
+        Saves a QMolecule to the cache, removing the least recently used ones if the cache is
+        full.
+
+        Args:
+            key: The key of the driver configuration.
+            q_mol: The QMolecule computed by the driver.
+        """
+        # save to a new file first so the cached ones are always complete
+        file, temp_name = tempfile.mkstemp(suffix='.tmp', dir=self._cache_dir)
+        os.close(file)
+        try:
+            q_mol.save(temp_name)
+            os.replace(temp_name, self._file_name(key))
+        except Exception:  # pylint: disable=broad-except
+            logger.warning('Failed to save QMolecule %s to the cache', key)
+            q_mol.remove_file(temp_name)
+            return
+
+        logger.debug('Saved QMolecule %s to the cache', key)
+        self._evict()
+
+    def clear(self) -> None:
+        """ Removes all the QMolecules from the cache. """
+        for file_name, _, _ in self._entries():
+            self._remove(file_name)
+
+    def _file_name(self, key: str) -> str:
+        return os.path.join(self._cache_dir, key + self._SUFFIX)
+
+    def _entries(self):
+        """ Returns the file name, last use time and size of the cached files. """
+        entries = []
+        for name in os.listdir(self._cache_dir):
+            if not name.endswith(self._SUFFIX):
+                continue
+            file_name = os.path.join(self._cache_dir, name)
+            try:
+                stat = os.stat(file_name)
+            except OSError:
+                continue
+            entries.append((file_name, stat.st_mtime, stat.st_size))
+        return entries
+
+    def _evict(self) -> None:
+        entries = sorted(self._entries(), key=lambda entry: entry[1])
+        size = sum(entry[2] for entry in entries)
+        for file_name, _, file_size in entries:
+            if size <= self._max_size:
+                break
+            self._remove(file_name)
+            size -= file_size
+            logger.debug('Evicted %s from the cache', file_name)
+
+    @staticmethod
+    def _remove(file_name: str) -> None:
+        try:
+            os.remove(file_name)
+        except OSError:
+            pass
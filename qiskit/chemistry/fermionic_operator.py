@@ -14,15 +14,12 @@
 
 import itertools
 import logging
-import sys
 
 import numpy as np
 from qiskit.quantum_info import Pauli
-from qiskit.tools import parallel_map
-from qiskit.tools.events import TextProgressBar
 
-from qiskit.aqua import aqua_globals
 from qiskit.aqua.operators import WeightedPauliOperator
+from qiskit.aqua.operators.legacy.common import _merge_pauli_bits, _pauli_bits_product
 from .qiskit_chemistry_error import QiskitChemistryError
 from .bksf import bksf_mapping
 from .particle_hole import particle_hole_transformation
@@ -172,7 +169,7 @@ class FermionicOperator:
 
         This is implemented by creating an array of tuples, each including two operators.
         The phase between two elements in a tuple is implicitly assumed, and added calculated at the
-        appropriate time (see for example _one_body_mapping).
+        appropriate time (see _map_terms).
 
         Args:
             n (int): number of modes
@@ -343,8 +340,8 @@ class FermionicOperator:
         """
         Map fermionic operator to qubit operator.
 
-        Using multiprocess to speedup the mapping, the improvement can be
-        observed when h2 is a non-sparse matrix.
+        All the nonzero integrals are mapped at once on the z and x bits of the
+        mode operators and the resulting Paulis are merged before the operator is built.
 
         Args:
             map_type (str): case-insensitive mapping type.
@@ -381,30 +378,29 @@ class FermionicOperator:
         # ###########    BUILDING THE MAPPED HAMILTONIAN     ################
         # ###################################################################
 
-        pauli_list = WeightedPauliOperator(paulis=[])
-        if logger.isEnabledFor(logging.DEBUG):
-            logger.debug("Mapping one-body terms to Qubit Hamiltonian:")
-            TextProgressBar(output_handler=sys.stderr)
-        results = parallel_map(FermionicOperator._one_body_mapping,
-                               [(self._h1[i, j], a_list[i], a_list[j])
-                                for i, j in itertools.product(range(n), repeat=2)
-                                if self._h1[i, j] != 0],
-                               task_args=(threshold,), num_processes=aqua_globals.num_processes)
-        for result in results:
-            pauli_list += result
-        pauli_list.chop(threshold=threshold)
-
-        if logger.isEnabledFor(logging.DEBUG):
-            logger.debug("Mapping two-body terms to Qubit Hamiltonian:")
-            TextProgressBar(output_handler=sys.stderr)
-        results = parallel_map(FermionicOperator._two_body_mapping,
-                               [(self._h2[i, j, k, m], a_list[i], a_list[j], a_list[k], a_list[m])
-                                for i, j, k, m in itertools.product(range(n), repeat=4)
-                                if self._h2[i, j, k, m] != 0],
-                               task_args=(threshold,), num_processes=aqua_globals.num_processes)
-        for result in results:
-            pauli_list += result
-        pauli_list.chop(threshold=threshold)
+        mode_z = np.asarray([[a_i[0].z, a_i[1].z] for a_i in a_list], dtype=bool)
+        mode_x = np.asarray([[a_i[0].x, a_i[1].x] for a_i in a_list], dtype=bool)
+
+        # adag_i a_j
+        indices = np.nonzero(self._h1)
+        logger.debug("Mapping %s one-body terms to Qubit Hamiltonian.", len(indices[0]))
+        z, x, coeffs = FermionicOperator._map_terms(
+            self._h1[indices], [indices[0], indices[1]], [-1j, 1j], mode_z, mode_x, threshold)
+        z, x, coeffs = _merge_pauli_bits(z, x, coeffs)
+        z, x, coeffs = _chop_paulis(z, x, coeffs, threshold)
+
+        # adag_i adag_k a_m a_j
+        indices = np.nonzero(self._h2)
+        logger.debug("Mapping %s two-body terms to Qubit Hamiltonian.", len(indices[0]))
+        z_2, x_2, coeffs_2 = FermionicOperator._map_terms(
+            self._h2[indices], [indices[0], indices[2], indices[3], indices[1]],
+            [-1j, -1j, 1j, 1j], mode_z, mode_x, threshold)
+        z, x, coeffs = _merge_pauli_bits(np.concatenate([z, z_2]), np.concatenate([x, x_2]),
+                                         np.concatenate([coeffs, coeffs_2]))
+        z, x, coeffs = _chop_paulis(z, x, coeffs, threshold)
+
+        pauli_list = WeightedPauliOperator(
+            paulis=[[coeff, Pauli(z_i, x_i)] for coeff, z_i, x_i in zip(coeffs.tolist(), z, x)])
 
         if self._ph_trans_shift is not None:
             pauli_term = [self._ph_trans_shift, Pauli.from_label('I' * self._modes)]
@@ -413,59 +409,72 @@ class FermionicOperator:
         return pauli_list
 
     @staticmethod
-    def _one_body_mapping(h1_ij_aij, threshold):
+    def _map_terms(values, indices, factors, mode_z, mode_x, threshold):
         """
-        Subroutine for one body mapping.
+        Maps products of fermionic ladder operators to Paulis, for all terms at once.
 
-        Args:
-            h1_ij_aij (tuple): value of h1 at index (i,j), pauli at index i, pauli at index j
-            threshold (float): threshold to remove a pauli
-
-        Returns:
-            WeightedPauliOperator: Operator for those paulis
-        """
-        h1_ij, a_i, a_j = h1_ij_aij
-        pauli_list = []
-        for alpha in range(2):
-            for beta in range(2):
-                pauli_prod = Pauli.sgn_prod(a_i[alpha], a_j[beta])
-                coeff = h1_ij / 4 * pauli_prod[1] * np.power(-1j, alpha) * np.power(1j, beta)
-                pauli_term = [coeff, pauli_prod[0]]
-                if np.absolute(pauli_term[0]) > threshold:
-                    pauli_list.append(pauli_term)
-        return WeightedPauliOperator(paulis=pauli_list)
-
-    @staticmethod
-    def _two_body_mapping(h2_ijkm_a_ijkm, threshold):
-        """
-        Subroutine for two body mapping. We use the chemists notation
-        for the two-body term, h2(i,j,k,m) adag_i adag_k a_m a_j.
+        Each ladder operator is the sum of the two Paulis of its mode, weighted by 1/2 and by
+        1 or the given factor respectively, so a product of r ladder operators expands into
+        2^r Paulis. The products and their phases are computed on the z and x bits of all
+        terms in a block together, rather than with ``Pauli.sgn_prod`` per term.
 
         Args:
-            h2_ijkm_a_ijkm (tuple): value of h2 at index (i,j,k,m),
-                                    pauli at index i, pauli at index j,
-                                    pauli at index k, pauli at index m
+            values (numpy.ndarray): the coefficient of each term
+            indices (list[numpy.ndarray]): the mode of each ladder operator of each term, in
+                                           the order in which the operators are multiplied
+            factors (list[complex]): the factor of the second Pauli of each ladder operator,
+                                     -1j for creation and 1j for annihilation operators
+            mode_z (numpy.ndarray): the z bits of the two Paulis of each mode, shape (n, 2, n)
+            mode_x (numpy.ndarray): the x bits of the two Paulis of each mode, shape (n, 2, n)
             threshold (float): threshold to remove a pauli
 
         Returns:
-            WeightedPauliOperator: Operator for those paulis
-        """
-        h2_ijkm, a_i, a_j, a_k, a_m = h2_ijkm_a_ijkm
-        pauli_list = []
-        for alpha in range(2):
-            for beta in range(2):
-                for gamma in range(2):
-                    for delta in range(2):
-                        pauli_prod_1 = Pauli.sgn_prod(a_i[alpha], a_k[beta])
-                        pauli_prod_2 = Pauli.sgn_prod(pauli_prod_1[0], a_m[gamma])
-                        pauli_prod_3 = Pauli.sgn_prod(pauli_prod_2[0], a_j[delta])
-
-                        phase1 = pauli_prod_1[1] * pauli_prod_2[1] * pauli_prod_3[1]
-                        phase2 = np.power(-1j, alpha + beta) * np.power(1j, gamma + delta)
-                        pauli_term = [h2_ijkm / 16 * phase1 * phase2, pauli_prod_3[0]]
-                        if np.absolute(pauli_term[0]) > threshold:
-                            pauli_list.append(pauli_term)
-        return WeightedPauliOperator(paulis=pauli_list)
+            tuple(numpy.ndarray, numpy.ndarray, numpy.ndarray): the z bits, x bits and
+            coefficients of the Paulis, term by term, with the Paulis of a term in the same
+            order as the nested loops over the two Paulis of each ladder operator.
+        """
+        num_qubits = mode_z.shape[-1]
+        num_ops = len(indices)
+        num_paulis = 2 ** num_ops
+        # the weight of each of the 2^r Paulis, the first operator is the most significant
+        combo_factors = np.ones(1, dtype=complex)
+        for factor in factors:
+            combo_factors = np.kron(combo_factors, [1, factor])
+        combo_factors /= num_paulis
+
+        block_size = max(1, (1 << 22) // (num_paulis * max(num_qubits, 1)))
+        z_blocks, x_blocks, coeff_blocks = [], [], []
+        for start in range(0, len(values), block_size):
+            block = slice(start, start + block_size)
+            z = mode_z[indices[0][block]]
+            x = mode_x[indices[0][block]]
+            phase = np.zeros(z.shape[:-1], dtype=int)
+            for index in indices[1:]:
+                z, x, factor_phase = _pauli_bits_product(z[:, :, None], x[:, :, None],
+                                                         mode_z[index[block]][:, None],
+                                                         mode_x[index[block]][:, None])
+                # pylint: disable=unsubscriptable-object
+                phase = (phase[:, :, None] + factor_phase).reshape(phase.shape[0], -1)
+                z = z.reshape(z.shape[0], -1, num_qubits)
+                x = x.reshape(x.shape[0], -1, num_qubits)
+            coeffs = values[block, None] * combo_factors * (1j ** (phase % 4))
+            z = z.reshape(-1, num_qubits)
+            x = x.reshape(-1, num_qubits)
+            coeffs = coeffs.reshape(-1)
+            keep = np.absolute(coeffs) > threshold
+            terms = np.repeat(np.arange(coeffs.size // num_paulis), num_paulis)[keep]
+            # Paulis cancelling out within a term are dropped before merging across terms
+            z, x, coeffs = _merge_pauli_bits(z[keep], x[keep], coeffs[keep], terms)
+            keep = coeffs != 0
+            z_block, x_block, coeff_block = _merge_pauli_bits(z[keep], x[keep], coeffs[keep])
+            z_blocks.append(z_block)
+            x_blocks.append(x_block)
+            coeff_blocks.append(coeff_block)
+
+        if not coeff_blocks:
+            return (np.zeros((0, num_qubits), dtype=bool), np.zeros((0, num_qubits), dtype=bool),
+                    np.zeros(0, dtype=complex))
+        return np.concatenate(z_blocks), np.concatenate(x_blocks), np.concatenate(coeff_blocks)
 
     def _convert_to_interleaved_spins(self):
         """
@@ -743,3 +752,25 @@ class FermionicOperator:
         h_2 = x_h2 + y_h2 + z_h2
 
         return FermionicOperator(h1=h_1, h2=h_2)
+
+
+def _chop_paulis(z, x, coeffs, threshold):
+    """
+    Zeroes the real and imaginary parts of the coefficients below threshold and removes the
+    Paulis whose coefficients become zero, like ``WeightedPauliOperator.chop``.
+
+    Args:
+        z (numpy.ndarray): the z bits of the Paulis, one row per Pauli
+        x (numpy.ndarray): the x bits of the Paulis, one row per Pauli
+        coeffs (numpy.ndarray): the coefficients of the Paulis
+        threshold (float): the threshold
+
+    Returns:
+        tuple(numpy.ndarray, numpy.ndarray, numpy.ndarray): the remaining z bits, x bits and
+        coefficients
+    """
+    real = np.where(np.absolute(coeffs.real) >= threshold, coeffs.real, 0.0)
+    imag = np.where(np.absolute(coeffs.imag) >= threshold, coeffs.imag, 0.0)
+    coeffs = real + 1j * imag
+    keep = coeffs != 0
+    return z[keep], x[keep], coeffs[keep]
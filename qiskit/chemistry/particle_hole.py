@@ -1959,6 +1959,58 @@ def particle_hole_transformation(n_qubits, num_particles, h1_old_matrix, h2_old_
     """
     This function produces the necessary h1, h2, identity for work with Fermionic Operators script.
 
+    The particle-hole transformation normal orders the Hamiltonian with respect to the
+    Hartree-Fock reference, whose fully contracted part is the Hartree-Fock electronic energy.
+    It is computed here with tensor contractions over the occupied block of the integrals.
+    The two body terms are antisymmetrized and only kept with their creation and annihilation
+    operators in normal order with respect to the reference, which is the layout obtained by
+    normal ordering every term separately, in O(n^4) time and memory.
+
+    Args:
+        n_qubits (int): number of qubits
+        num_particles (list): number of alphas, number of betas
+        h1_old_matrix (array): one body integrals matrix
+        h2_old_matrix (array): two body integral matrix
+
+    Returns:
+        tuple: new one body integrals matrix, two body integrals matrix, identity coefficient terms
+    """
+    num_alpha = num_particles[0]
+    num_beta = num_particles[1]
+
+    # labels of occupied orbitals in interleaved spin convention
+    n_occupied = np.concatenate([2 * np.arange(num_alpha),
+                                 2 * np.arange(num_beta) + 1]).astype(int)
+
+    # Hartree-Fock energy: h1(i,i) + h2(i,i,j,j) - h2(i,j,j,i) over the occupied orbitals
+    h1_occupied = h1_old_matrix[np.ix_(n_occupied, n_occupied)]
+    h2_occupied = h2_old_matrix[np.ix_(n_occupied, n_occupied, n_occupied, n_occupied)]
+    hf_energy = np.trace(h1_occupied) + np.einsum('iijj->', h2_occupied) \
+        - np.einsum('ijji->', h2_occupied)
+
+    # h2(i,j,k,l) is the coefficient of adag_i adag_k a_l a_j, reorder it to
+    # adag_p adag_q a_r a_s and antisymmetrize in (p, q) and (r, s)
+    two_body = np.einsum('ijkl->iklj', h2_old_matrix)
+    two_body = two_body - np.einsum('pqrs->qprs', two_body)
+    two_body = two_body - np.einsum('pqrs->pqsr', two_body)
+    # normal order with respect to the reference: creating an electron in an occupied orbital
+    # annihilates a hole, so these creation operators are ranked last and the annihilation
+    # operators of the occupied orbitals first
+    occupied = np.isin(np.arange(n_qubits), n_occupied)
+    rank = np.where(occupied, 1, -1) * np.arange(1, n_qubits + 1)
+    creation = rank[:, None] < rank[None, :]
+    annihilation = rank[:, None] > rank[None, :]
+    two_body = two_body * np.einsum('pq,rs->pqrs', creation, annihilation)
+    h2_new_matrix = np.einsum('iklj->ijkl', two_body)
+
+    return h1_old_matrix.copy(), h2_new_matrix, -hf_energy
+
+
+def _particle_hole_reference(n_qubits, num_particles, h1_old_matrix, h2_old_matrix):
+    """
+    Reference implementation of :func:`particle_hole_transformation`, which normal orders every
+    term of the Hamiltonian separately. It is only kept to verify the former.
+
     Args:
         n_qubits (int): number of qubits
         num_particles (list): number of alphas, number of betas
@@ -410,22 +410,14 @@ class QMolecule:
         Returns:
             numpy.ndarray: integrals in MO basis
         """
-        dim = ints.shape[0]
-        eri_mo = numpy.zeros((dim, dim, dim, dim))
-
-        for a_i in range(dim):
-            temp1 = numpy.einsum('i,i...->...', moc[:, a_i], ints)
-            for b_i in range(dim):
-                temp2 = numpy.einsum('j,j...->...', moc[:, b_i], temp1)
-                temp3 = numpy.einsum('kc,k...->...c', moc, temp2)
-                eri_mo[a_i, b_i, :, :] = numpy.einsum('ld,l...c->...cd', moc, temp3)
-
-        return eri_mo
+        return QMolecule.twoeints2mo_general(ints, moc, moc, moc, moc)
 
     @staticmethod
     def twoeints2mo_general(ints, moc1, moc2, moc3, moc4):
         """ twoeints2mo_general """
-        return numpy.einsum('pqrs,pi,qj,rk,sl->ijkl', ints, moc1, moc2, moc3, moc4)
+        # the optimized contraction transforms one index at a time, in O(N^5) operations
+        return numpy.einsum('pqrs,pi,qj,rk,sl->ijkl', ints, moc1, moc2, moc3, moc4,
+                            optimize=True)
 
     @staticmethod
     def onee_to_spin(mohij, mohij_b=None, threshold=1E-12):
@@ -449,19 +441,10 @@ class QMolecule:
         norbs = mohij.shape[0]
         nspin_orbs = 2*norbs
 
-        # One electron terms
+        # One electron terms, only between spin orbitals of the same spin
         moh1_qubit = numpy.zeros([nspin_orbs, nspin_orbs])
-        for p in range(nspin_orbs):  # pylint: disable=invalid-name
-            for q in range(nspin_orbs):
-                spinp = int(p/norbs)
-                spinq = int(q/norbs)
-                if spinp % 2 != spinq % 2:
-                    continue
-                ints = mohij if spinp == 0 else mohij_b
-                orbp = int(p % norbs)
-                orbq = int(q % norbs)
-                if abs(ints[orbp, orbq]) > threshold:
-                    moh1_qubit[p, q] = ints[orbp, orbq]
+        moh1_qubit[:norbs, :norbs] = numpy.where(abs(mohij) > threshold, mohij, 0.0)
+        moh1_qubit[norbs:, norbs:] = numpy.where(abs(mohij_b) > threshold, mohij_b, 0.0)
 
         return moh1_qubit
 
@@ -506,30 +489,16 @@ class QMolecule:
         #            .
         #            .
 
-        # Two electron terms
+        # Two electron terms, only where the spins of p and s, and of q and r, are equal.
+        # Each block is indexed as [p, q, r, s] by the spins of p and q.
         moh2_qubit = numpy.zeros([nspin_orbs, nspin_orbs, nspin_orbs, nspin_orbs])
-        for p in range(nspin_orbs):  # pylint: disable=invalid-name
-            for q in range(nspin_orbs):
-                for r in range(nspin_orbs):
-                    for s in range(nspin_orbs):  # pylint: disable=invalid-name
-                        spinp = int(p/norbs)
-                        spinq = int(q/norbs)
-                        spinr = int(r/norbs)
-                        spins = int(s/norbs)
-                        if spinp != spins:
-                            continue
-                        if spinq != spinr:
-                            continue
-                        if spinp == 0:
-                            ints = ints_aa if spinq == 0 else ints_ba
-                        else:
-                            ints = ints_ab if spinq == 0 else ints_bb
-                        orbp = int(p % norbs)
-                        orbq = int(q % norbs)
-                        orbr = int(r % norbs)
-                        orbs = int(s % norbs)
-                        if abs(ints[orbp, orbq, orbr, orbs]) > threshold:
-                            moh2_qubit[p, q, r, s] = -0.5*ints[orbp, orbq, orbr, orbs]
+        spin_slices = [slice(0, norbs), slice(norbs, nspin_orbs)]
+        blocks = [[ints_aa, ints_ba], [ints_ab, ints_bb]]
+        for spinp, spin_p in enumerate(spin_slices):
+            for spinq, spin_q in enumerate(spin_slices):
+                ints = blocks[spinp][spinq]
+                moh2_qubit[spin_p, spin_q, spin_q, spin_p] = \
+                    numpy.where(abs(ints) > threshold, -0.5 * ints, 0.0)
 
         return moh2_qubit
 
@@ -15,9 +15,11 @@
 from .electronic_structure_result import DipoleTuple, ElectronicStructureResult
 from .vibronic_structure_result import VibronicStructureResult
 from .eigenstate_result import EigenstateResult
+from .bopes_sampler_result import BOPESSamplerResult
 
 
-__all__ = ['DipoleTuple',
+__all__ = ['BOPESSamplerResult',
+           'DipoleTuple',
            'EigenstateResult',
            'ElectronicStructureResult',
            'VibronicStructureResult'
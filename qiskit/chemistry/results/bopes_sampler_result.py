@@ -0,0 +1,58 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""BOPES Sampler result"""
+
+from typing import List, Dict, Union
+
+from .electronic_structure_result import ElectronicStructureResult
+from .vibronic_structure_result import VibronicStructureResult
+
+
+class BOPESSamplerResult:
+    """The BOPES Sampler result"""
+
+    def __init__(self,
+                 points: List[float],
+                 energies: List[float],
+                 raw_results: Dict[float, Union[ElectronicStructureResult,
+                                                VibronicStructureResult]]) -> None:
+        """
+        Args:
+            points: The points along the path, in the order they were given.
+            energies: The ground state energy at each point.
+            raw_results: The result of the ground state solver at each point.
+        """
+        self._points = points
+        self._energies = energies
+        self._raw_results = raw_results
+
+    @property
+    def points(self) -> List[float]:
+        """ returns the points """
+        return self._points
+
+    @property
+    def energies(self) -> List[float]:
+        """ returns the energies at the points """
+        return self._energies
+
+    @property
+    def raw_results(self) -> Dict[float, Union[ElectronicStructureResult,
+                                               VibronicStructureResult]]:
+        """ returns the raw results of the ground state solver, keyed by point """
+        return self._raw_results
+
+    def point_results(self, point: float) -> Union[ElectronicStructureResult,
+                                                   VibronicStructureResult]:
+        """ returns the result of the ground state solver at the given point """
+        return self._raw_results[point]
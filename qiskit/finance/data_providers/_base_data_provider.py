@@ -20,6 +20,7 @@ from enum import Enum
 import numpy as np
 import fastdtw
 
+from qiskit.tools import parallel_map
 from qiskit.aqua import aqua_globals
 from ..exceptions import QiskitFinanceError
 
@@ -53,6 +54,8 @@ class BaseDataProvider(ABC):
         self.period_return_cov = None
         self.rho = None  # type: Optional[np.ndarray]
         self.mean = None
+        # the loaded data, radius and similarity matrix of the last get_similarity_matrix call
+        self._similarity = None  # type: Optional[Tuple[List, int, np.ndarray]]
 
     @abstractmethod
     def run(self) -> None:
@@ -160,10 +163,18 @@ class BaseDataProvider(ABC):
         return self.period_return_cov
 
     # it does not have to be overridden in non-abstract derived classes.
-    def get_similarity_matrix(self) -> np.ndarray:
+    def get_similarity_matrix(self, radius: int = 1) -> np.ndarray:
         """
         Returns time-series similarity matrix computed using dynamic time warping.
 
+        The distances of the pairs of assets are computed in parallel, and the matrix is kept
+        until new data is loaded, so that calling the method again does not recompute it.
+
+        Args:
+            radius: The radius of the band around the coarser warp path in which ``fastdtw``
+                searches for the warp path, which bounds the cost of each pair. Larger values
+                are more accurate but slower.
+
         Returns:
             an asset-to-asset similarity matrix.
         Raises:
@@ -178,16 +189,36 @@ class BaseDataProvider(ABC):
             raise QiskitFinanceError(
                 'No data loaded, yet. Please run the method run() first to load the data.'
             ) from ex
-        self.rho = np.zeros((self._n, self._n))
-        for i_i in range(0, self._n):
-            self.rho[i_i, i_i] = 1.
-            for j_j in range(i_i + 1, self._n):
-                this_rho, _ = fastdtw.fastdtw(self._data[i_i], self._data[j_j])
-                this_rho = 1.0 / this_rho
+
+        similarity = getattr(self, '_similarity', None)
+        if similarity is not None and similarity[0] is self._data and similarity[1] == radius:
+            # hand out a copy so that callers cannot alter the cached matrix
+            self.rho = similarity[2].copy()
+            return self.rho
+
+        data = [np.asarray(series, dtype=float) for series in self._data]
+        rows, cols = np.triu_indices(self._n, k=1)
+        pairs = list(zip(rows.tolist(), cols.tolist()))
+        # a few chunks per process, each of them sends the data only once
+        num_chunks = min(len(pairs), 4 * aqua_globals.num_processes)
+        chunks = [pairs[start::num_chunks] for start in range(num_chunks)]
+        results = parallel_map(BaseDataProvider._dtw_distances, chunks,
+                               task_args=(data, radius),
+                               num_processes=aqua_globals.num_processes) if chunks else []
+
+        self.rho = np.eye(self._n)
+        for chunk, distances in zip(chunks, results):
+            for (i_i, j_j), distance in zip(chunk, distances):
+                this_rho = 1.0 / distance
                 self.rho[i_i, j_j] = this_rho
                 self.rho[j_j, i_i] = this_rho
+        self._similarity = (self._data, radius, self.rho.copy())
         return self.rho
 
+    @staticmethod
+    def _dtw_distances(pairs, data, radius):
+        return [fastdtw.fastdtw(data[i_i], data[j_j], radius=radius)[0] for i_i, j_j in pairs]
+
     # gets coordinates suitable for plotting
     # it does not have to be overridden in non-abstract derived classes.
     def get_coordinates(self) -> Tuple[float, float]:
@@ -146,6 +146,13 @@ class ADMMState:
         # constraints
         self.a0 = None  # type: Optional[np.ndarray]
         self.b0 = None  # type: Optional[np.ndarray]
+        # the parts of the step 1 objective which do not change over the iterations
+        self.q0_penalized = None  # type: Optional[np.ndarray]
+        self.c0_penalized = None  # type: Optional[np.ndarray]
+
+        # The step 1 and step 2 sub-problems, created once and updated at each iteration.
+        self.op1 = None  # type: Optional[QuadraticProgram]
+        self.op2 = None  # type: Optional[QuadraticProgram]
 
         # These are the parameters that are updated in the ADMM iterations.
         self.u = np.zeros(op.get_num_continuous_vars())
@@ -281,7 +288,8 @@ class ADMMOptimizer(OptimizationAlgorithm):
         self._verify_compatibility(problem)
 
         # debug
-        self._log.debug("Initial problem: %s", problem.export_as_lp_string())
+        if self._log.isEnabledFor(logging.DEBUG):
+            self._log.debug("Initial problem: %s", problem.export_as_lp_string())
 
         # map integer variables to binary variables
         from ..converters.integer_to_binary import IntegerToBinary
@@ -307,6 +315,12 @@ class ADMMOptimizer(OptimizationAlgorithm):
         # at each iteration.
         self._convert_problem_representation()
 
+        # the sub-problems only differ by some coefficients from an iteration to the next one,
+        # so they are created once and updated in place.
+        if self._state.step1_absolute_indices:
+            self._state.op1 = self._create_step1_problem()
+        self._state.op2 = self._create_step2_problem()
+
         start_time = time.time()
         # we have not stated our computations yet, so elapsed time initialized as zero.
         elapsed_time = 0.0
@@ -315,28 +329,29 @@ class ADMMOptimizer(OptimizationAlgorithm):
 
         while (iteration < self._params.maxiter and residual > self._params.tol) \
                 and (elapsed_time < self._params.max_time):
+            debug = self._log.isEnabledFor(logging.DEBUG)
             if self._state.step1_absolute_indices:
-                op1 = self._create_step1_problem()
-                self._state.x0 = self._update_x0(op1)
+                self._update_step1_problem(self._state.op1)
+                self._state.x0 = self._update_x0(self._state.op1)
                 # debug
-                self._log.debug("Step 1 sub-problem: %s", op1.export_as_lp_string())
+                if debug:
+                    self._log.debug("Step 1 sub-problem: %s",
+                                    self._state.op1.export_as_lp_string())
             # else, no binary variables exist, and no update to be done in this case.
             # debug
             self._log.debug("x0=%s", self._state.x0)
 
-            op2 = self._create_step2_problem()
-            self._state.u, self._state.z = self._update_x1(op2)
+            self._update_step2_problem(self._state.op2)
+            self._state.u, self._state.z = self._update_x1(self._state.op2)
             # debug
-            self._log.debug("Step 2 sub-problem: %s", op2.export_as_lp_string())
+            if debug:
+                self._log.debug("Step 2 sub-problem: %s", self._state.op2.export_as_lp_string())
             self._log.debug("u=%s", self._state.u)
             self._log.debug("z=%s", self._state.z)
 
             if self._params.three_block:
                 if self._state.binary_indices:
-                    op3 = self._create_step3_problem()
-                    self._state.y = self._update_y(op3)
-                    # debug
-                    self._log.debug("Step 3 sub-problem: %s", op3.export_as_lp_string())
+                    self._state.y = self._update_y()
                 # debug
                 self._log.debug("y=%s", self._state.y)
 
@@ -496,6 +511,11 @@ class ADMMOptimizer(OptimizationAlgorithm):
         self._state.c1 = self._state.op.objective.linear.to_array()[self._state.continuous_indices]
         # equality constraints with binary vars only
         self._state.a0, self._state.b0 = self._get_a0_b0()
+        # penalized equality constraints in the step 1 objective
+        self._state.q0_penalized = self._state.q0 + \
+            self._params.factor_c / 2 * np.dot(self._state.a0.transpose(), self._state.a0)
+        self._state.c0_penalized = self._state.c0 - \
+            self._params.factor_c * np.dot(self._state.b0, self._state.a0)
 
     def _get_step1_indices(self) -> Tuple[List[int], List[int]]:
         """
@@ -610,7 +630,7 @@ class ADMMOptimizer(OptimizationAlgorithm):
         return np_matrix, np_vector
 
     def _create_step1_problem(self) -> QuadraticProgram:
-        """Creates a step 1 sub-problem.
+        """Creates a step 1 sub-problem. Its objective is set by ``_update_step1_problem``.
 
         Returns:
             A newly created optimization problem.
@@ -623,24 +643,32 @@ class ADMMOptimizer(OptimizationAlgorithm):
             name = self._state.op.variables[self._state.step1_absolute_indices[i]].name
             op1.binary_var(name=name)
 
-        # prepare and set quadratic objective.
-        quadratic_objective = self._state.q0 + \
-            self._params.factor_c / 2 * np.dot(self._state.a0.transpose(), self._state.a0) +\
-            self._state.rho / 2 * np.eye(binary_size)
-        op1.objective.quadratic = quadratic_objective
+        # set the part of the quadratic objective which does not depend on rho.
+        op1.objective.quadratic = self._state.q0_penalized
+        return op1
+
+    def _update_step1_problem(self, op1: QuadraticProgram) -> None:
+        """Updates the objective of the step 1 sub-problem in place with the current iterates.
+
+        Args:
+            op1: the Step1 QuadraticProgram.
+        """
+        # update the diagonal of the quadratic objective.
+        diagonal = np.arange(len(self._state.step1_absolute_indices))
+        op1.objective.quadratic.coefficients[diagonal, diagonal] = \
+            np.diag(self._state.q0_penalized) + self._state.rho / 2
 
         # prepare and set linear objective.
-        linear_objective = self._state.c0 - \
-            self._params.factor_c * np.dot(self._state.b0, self._state.a0) + \
+        linear_objective = self._state.c0_penalized + \
             self._state.rho * (- self._state.y[self._state.step1_relative_indices] -
                                self._state.z[self._state.step1_relative_indices]) + \
             self._state.lambda_mult[self._state.step1_relative_indices]
 
         op1.objective.linear = linear_objective
-        return op1
 
     def _create_step2_problem(self) -> QuadraticProgram:
-        """Creates a step 2 sub-problem.
+        """Creates a step 2 sub-problem. The coefficients of the relaxed binary variables in its
+        objective are set by ``_update_step2_problem``.
 
         Returns:
             A newly created optimization problem.
@@ -649,16 +677,11 @@ class ADMMOptimizer(OptimizationAlgorithm):
         # replace binary variables with the continuous ones bound in [0,1]
         # x0(bin) -> z(cts)
         # u (cts) are still there unchanged
-        for i, var_index in enumerate(self._state.binary_indices):
+        for var_index in self._state.binary_indices:
             variable = op2.variables[var_index]
             variable.vartype = Variable.Type.CONTINUOUS
             variable.upperbound = 1.
             variable.lowerbound = 0.
-            # replacing Q0 objective and take of min/max sense, initially we consider minimization
-            op2.objective.quadratic[var_index, var_index] = self._state.rho / 2
-            # replacing linear objective
-            op2.objective.linear[var_index] = -1 * self._state.lambda_mult[i] - self._state.rho * \
-                (self._state.x0[i] - self._state.y[i])
 
         # remove A0 x0 = b0 constraints
         for constraint in self._state.binary_equality_constraints:
@@ -666,29 +689,21 @@ class ADMMOptimizer(OptimizationAlgorithm):
 
         return op2
 
-    def _create_step3_problem(self) -> QuadraticProgram:
-        """Creates a step 3 sub-problem.
+    def _update_step2_problem(self, op2: QuadraticProgram) -> None:
+        """Updates the objective of the step 2 sub-problem in place with the current iterates.
 
-        Returns:
-            A newly created optimization problem.
-        """
-        op3 = QuadraticProgram()
-        # add y variables.
-        binary_size = len(self._state.binary_indices)
-        for i in range(binary_size):
-            name = self._state.op.variables[self._state.binary_indices[i]].name
-            op3.continuous_var(lowerbound=-np.inf, upperbound=np.inf, name=name)
-
-        # set quadratic objective y
-        quadratic_y = self._params.beta / 2 * np.eye(binary_size) + \
-            self._state.rho / 2 * np.eye(binary_size)
-        op3.objective.quadratic = quadratic_y
-
-        # set linear objective for y
-        linear_y = - self._state.lambda_mult - self._state.rho * (self._state.x0 - self._state.z)
-        op3.objective.linear = linear_y
-
-        return op3
+        Args:
+            op2: the Step2 QuadraticProgram.
+        """
+        if not self._state.binary_indices:
+            return
+        binary_indices = np.asarray(self._state.binary_indices)
+        # replacing Q0 objective and take of min/max sense, initially we consider minimization
+        op2.objective.quadratic.coefficients[binary_indices, binary_indices] = \
+            np.full(len(binary_indices), self._state.rho / 2)
+        # replacing linear objective
+        op2.objective.linear.coefficients[0, binary_indices] = \
+            -1 * self._state.lambda_mult - self._state.rho * (self._state.x0 - self._state.y)
 
     def _update_x0(self, op1: QuadraticProgram) -> np.ndarray:
         """Solves the Step1 QuadraticProgram via the qubo optimizer.
@@ -721,17 +736,17 @@ class ADMMOptimizer(OptimizationAlgorithm):
         vars_z = vars_op2.take(self._state.binary_indices)
         return vars_u, vars_z
 
-    def _update_y(self, op3: QuadraticProgram) -> np.ndarray:
-        """Solves the Step3 QuadraticProgram via the continuous optimizer.
-
-        Args:
-            op3: the Step3 QuadraticProgram
+    def _update_y(self) -> np.ndarray:
+        """Solves the Step3 problem, i.e. minimizes
+        (beta + rho) / 2 * y^2 - (lambda + rho * (x0 - z)) * y over the unbounded variables y.
+        The objective is separable and convex, so the solution is computed in closed form.
 
         Returns:
             A solution of the Step3, as a numpy array.
 
         """
-        return np.asarray(self._continuous_optimizer.solve(op3).x)
+        return (self._state.lambda_mult + self._state.rho * (self._state.x0 - self._state.z)) / \
+            (self._params.beta + self._state.rho)
 
     def _get_best_merit_solution(self) -> Tuple[np.ndarray, np.ndarray, float]:
         """The ADMM solution is that for which the merit value is the min
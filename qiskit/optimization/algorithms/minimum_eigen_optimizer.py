@@ -56,20 +56,13 @@ class MinimumEigenOptimizationResult(OptimizationResult):
     def get_correlations(self) -> np.ndarray:
         """Get <Zi x Zj> correlation matrix from samples."""
 
-        states = [v[0] for v in self.samples]
-        probs = [v[2] for v in self.samples]
-
-        n = len(states[0])
-        correlations = np.zeros((n, n))
-        for k, prob in enumerate(probs):
-            b = states[k]
-            for i in range(n):
-                for j in range(i):
-                    if b[i] == b[j]:
-                        correlations[i, j] += prob
-                    else:
-                        correlations[i, j] -= prob
-        return correlations
+        states = np.array([[int(bit) for bit in v[0]] for v in self.samples])
+        probs = np.array([v[2] for v in self.samples])
+
+        # <Zi x Zj> is the expected product of the spins 1 - 2 * bit
+        spins = 1 - 2 * states
+        correlations = (spins * probs[:, np.newaxis]).T @ spins
+        return np.tril(correlations, k=-1)
 
 
 class MinimumEigenOptimizer(OptimizationAlgorithm):
@@ -192,13 +185,14 @@ class MinimumEigenOptimizer(OptimizationAlgorithm):
             x_str = None
             samples = None
             if eigen_result.eigenstate is not None:
-                samples = _eigenvector_to_solutions(eigen_result.eigenstate, problem_)
-                # print(offset, samples)
-                # samples = [(res[0], problem_.objective.sense.value * (res[1] + offset), res[2])
-                #    for res in samples]
-                samples.sort(key=lambda x: problem_.objective.sense.value * x[1])
-                x = [float(e) for e in samples[0][0]]
-                fval = samples[0][1]
+                states, values, probabilities = _eigenvector_to_solutions(
+                    eigen_result.eigenstate, problem_)
+                order = np.argsort(problem_.objective.sense.value * values, kind='stable')
+                states, values, probabilities = states[order], values[order], probabilities[order]
+                samples = list(zip(_states_to_bitstrings(states), values.tolist(),
+                                   probabilities.tolist()))
+                x = states[0].astype(float).tolist()
+                fval = values[0]
 
         # if Hamiltonian is empty, then the objective function is constant to the offset
         else:
@@ -232,8 +226,8 @@ class MinimumEigenOptimizer(OptimizationAlgorithm):
 def _eigenvector_to_solutions(eigenvector: Union[dict, np.ndarray, StateFn],
                               qubo: QuadraticProgram,
                               min_probability: float = 1e-6,
-                              ) -> List[Tuple[str, float, float]]:
-    """Convert the eigenvector to the bitstrings and corresponding eigenvalues.
+                              ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Convert the eigenvector to the basis states and corresponding eigenvalues.
 
     Args:
         eigenvector: The eigenvector from which the solution states are extracted.
@@ -242,21 +236,18 @@ def _eigenvector_to_solutions(eigenvector: Union[dict, np.ndarray, StateFn],
 
     Returns:
         For each computational basis state contained in the eigenvector, return the basis
-        state as bitstring along with the QUBO evaluated at that bitstring and the
-        probability of sampling this bitstring from the eigenvector.
+        state as a row of a 0/1 matrix along with the QUBO evaluated at that state and the
+        probability of sampling this state from the eigenvector. The QUBO is evaluated for all
+        states at once with ``QuadraticObjective.evaluate_batch``.
 
     Examples:
-        >>> op = MatrixOp(numpy.array([[1, 1], [1, -1]]) / numpy.sqrt(2))
+        >>> qubo = QuadraticProgram()
+        >>> qubo.binary_var()
+        >>> qubo.minimize(linear=[-1])
         >>> eigenvectors = {'0': 12, '1': 1}
-        >>> print(eigenvector_to_solutions(eigenvectors, op))
-        [('0', 0.7071067811865475, 0.9230769230769231),
-        ('1', -0.7071067811865475, 0.07692307692307693)]
-
-        >>> op = MatrixOp(numpy.array([[1, 1], [1, -1]]) / numpy.sqrt(2))
-        >>> eigenvectors = numpy.array([1, 1] / numpy.sqrt(2), dtype=complex)
-        >>> print(eigenvector_to_solutions(eigenvectors, op))
-        [('0', 0.7071067811865475, 0.4999999999999999),
-        ('1', -0.7071067811865475, 0.4999999999999999)]
+        >>> print(_eigenvector_to_solutions(eigenvectors, qubo))
+        (array([[0], [1]], dtype=uint8), array([ 0., -1.]),
+        array([0.92307692, 0.07692308]))
 
     Raises:
         TypeError: If the type of eigenvector is not supported.
@@ -266,33 +257,37 @@ def _eigenvector_to_solutions(eigenvector: Union[dict, np.ndarray, StateFn],
     elif isinstance(eigenvector, StateFn):
         eigenvector = eigenvector.to_matrix()
 
-    solutions = []
     if isinstance(eigenvector, dict):
         all_counts = sum(eigenvector.values())
-        # iterate over all samples
-        for bitstr, count in eigenvector.items():
-            sampling_probability = count / all_counts
-            # add the bitstring, if the sampling probability exceeds the threshold
-            if sampling_probability > 0:
-                if sampling_probability >= min_probability:
-                    value = qubo.objective.evaluate([int(bit) for bit in bitstr])
-                    solutions += [(bitstr, value, sampling_probability)]
+        bitstrs = list(eigenvector.keys())
+        probabilities = np.fromiter(eigenvector.values(), dtype=float,
+                                    count=len(bitstrs)) / all_counts
+        # keep the bitstrings, if the sampling probability exceeds the threshold
+        indices = np.flatnonzero((probabilities > 0) & (probabilities >= min_probability))
+        bitstrs = [bitstrs[i] for i in indices]
+        probabilities = probabilities[indices]
+        num_qubits = len(bitstrs[0]) if bitstrs else 0
+        states = np.frombuffer(''.join(bitstrs).encode(), dtype=np.uint8) - ord('0')
+        states = states.reshape(len(bitstrs), num_qubits)
 
     elif isinstance(eigenvector, np.ndarray):
         num_qubits = int(np.log2(eigenvector.size))
         probabilities = np.abs(eigenvector * eigenvector.conj())
 
-        # iterate over all states and their sampling probabilities
-        for i, sampling_probability in enumerate(probabilities):
-
-            # add the i-th state if the sampling probability exceeds the threshold
-            if sampling_probability > 0:
-                if sampling_probability >= min_probability:
-                    bitstr = '{:b}'.format(i).rjust(num_qubits, '0')[::-1]
-                    value = qubo.objective.evaluate([int(bit) for bit in bitstr])
-                    solutions += [(bitstr, value, sampling_probability)]
+        # keep the states, if the sampling probability exceeds the threshold
+        indices = np.flatnonzero((probabilities > 0) & (probabilities >= min_probability))
+        probabilities = probabilities[indices]
+        # the i-th variable is the i-th bit of the index, i.e., the bitstring is reversed
+        states = ((indices[:, np.newaxis] >> np.arange(num_qubits)) & 1).astype(np.uint8)
 
     else:
         raise TypeError('Unsupported format of eigenvector. Provide a dict or numpy.ndarray.')
 
-    return solutions
+    values = qubo.objective.evaluate_batch(states)
+    return states, values, probabilities
+
+
+def _states_to_bitstrings(states: np.ndarray) -> List[str]:
+    """Converts a 0/1 matrix to the bitstrings of its rows."""
+    chars = (states + ord('0')).astype(np.uint8)
+    return [row.tobytes().decode() for row in chars]
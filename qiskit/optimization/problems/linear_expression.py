@@ -14,6 +14,7 @@
 
 from typing import List, Union, Dict, Any
 
+import numpy as np
 from numpy import ndarray
 from scipy.sparse import spmatrix, dok_matrix
 
@@ -153,6 +154,18 @@ class LinearExpression(QuadraticProgramElement):
         # return the result
         return val
 
+    def evaluate_batch(self, x: Union[ndarray, spmatrix]) -> ndarray:
+        """Evaluate the linear expression for a batch of variable values.
+
+        Args:
+            x: The values of the variables to be evaluated, one row per evaluation.
+
+        Returns:
+            The values of the linear expression, one per row of x.
+        """
+        # compute the dot-product of each row and the linear coefficients
+        return np.asarray(x @ self.to_array()).ravel()
+
     # pylint: disable=unused-argument
     def evaluate_gradient(self, x: Union[ndarray, List, Dict[Union[int, str], float]]) -> ndarray:
         """Evaluate the gradient of the linear expression for given variables.
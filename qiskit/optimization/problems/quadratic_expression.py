@@ -16,7 +16,7 @@ from typing import List, Union, Dict, Tuple, Any
 
 import numpy as np
 from numpy import ndarray
-from scipy.sparse import spmatrix, dok_matrix, tril, triu
+from scipy.sparse import spmatrix, dok_matrix, tril, triu, issparse
 
 from .quadratic_program_element import QuadraticProgramElement
 from ..exceptions import QiskitOptimizationError
@@ -187,6 +187,26 @@ class QuadraticExpression(QuadraticProgramElement):
         # return the result
         return val
 
+    def evaluate_batch(self, x: Union[ndarray, spmatrix]) -> ndarray:
+        """Evaluate the quadratic expression for a batch of variable values.
+
+        Args:
+            x: The values of the variables to be evaluated, one row per evaluation.
+
+        Returns:
+            The values of the quadratic expression, one per row of x.
+        """
+        coeffs = self.coefficients.tocsr()
+
+        # compute x * Q * x for each row x at once
+        if issparse(x):
+            val = x.tocsr().dot(coeffs).multiply(x).sum(axis=1)
+        else:
+            val = np.einsum('ij,ij->i', x @ coeffs, x)
+
+        # return the result
+        return np.asarray(val).ravel()
+
     def evaluate_gradient(self, x: Union[ndarray, List, Dict[Union[int, str], float]]) -> ndarray:
         """Evaluate the gradient of the quadratic expression for given variables.
 
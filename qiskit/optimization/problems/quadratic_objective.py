@@ -150,6 +150,18 @@ class QuadraticObjective(QuadraticProgramElement):
         """
         return self.constant + self.linear.evaluate(x) + self.quadratic.evaluate(x)
 
+    def evaluate_batch(self, x: Union[ndarray, spmatrix]) -> ndarray:
+        """Evaluate the quadratic objective for a batch of variable values.
+
+        Args:
+            x: The values of the variables to be evaluated, as a (dense or sparse) matrix with one
+                row per evaluation, e.g., one row per sampled bitstring of a QUBO.
+
+        Returns:
+            The values of the quadratic objective, one per row of x.
+        """
+        return self.constant + self.linear.evaluate_batch(x) + self.quadratic.evaluate_batch(x)
+
     def evaluate_gradient(self, x: Union[ndarray, List, Dict[Union[int, str], float]]) -> ndarray:
         """Evaluate the gradient of the quadratic objective for given variable values.
 
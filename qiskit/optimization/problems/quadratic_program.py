@@ -19,7 +19,7 @@ from enum import Enum
 from math import fsum, isclose
 import warnings
 import numpy as np
-from numpy import (ndarray, zeros, bool as nbool)
+from numpy import (ndarray, zeros, zeros_like, bool as nbool)
 from scipy.sparse import spmatrix
 
 from docplex.mp.constr import (LinearConstraint as DocplexLinearConstraint,
@@ -31,8 +31,7 @@ from docplex.mp.model_reader import ModelReader
 from docplex.mp.quad import QuadExpr
 
 from qiskit.aqua import MissingOptionalLibraryError
-from qiskit.aqua.operators import I, OperatorBase, PauliOp, WeightedPauliOperator, SummedOp, ListOp
-from qiskit.quantum_info import Pauli
+from qiskit.aqua.operators import I, OperatorBase, WeightedPauliOperator, SummedOp, ListOp
 from .constraint import Constraint, ConstraintSense
 from .linear_constraint import LinearConstraint
 from .linear_expression import LinearExpression
@@ -913,9 +912,17 @@ class QuadraticProgram:
 
         # initialize Hamiltonian.
         num_nodes = self.get_num_vars()
-        pauli_list = []
+        weights = []  # type: List[float]
+        # the positions of the Z operators, one (term, qubit) pair each
+        term_indices = []  # type: List[int]
+        qubit_indices = []  # type: List[int]
         offset = 0
-        zero = zeros(num_nodes, dtype=nbool)
+
+        def add_term(weight, *qubits):
+            for qubit in qubits:
+                term_indices.append(len(weights))
+                qubit_indices.append(qubit)
+            weights.append(weight)
 
         # set a sign corresponding to a maximized or minimized problem.
         # sign == 1 is for minimized problem. sign == -1 is for maximized problem.
@@ -926,11 +933,8 @@ class QuadraticProgram:
 
         # convert linear parts of the object function into Hamiltonian.
         for idx, coef in self.objective.linear.to_dict().items():
-            z_p = zeros(num_nodes, dtype=nbool)
             weight = coef * sense / 2
-            z_p[idx] = True
-
-            pauli_list.append([-weight, Pauli(z_p, zero)])
+            add_term(-weight, idx)
             offset += weight
 
         # convert quadratic parts of the object function into Hamiltonian.
@@ -950,28 +954,20 @@ class QuadraticProgram:
             if i == j:
                 offset += weight
             else:
-                z_p = zeros(num_nodes, dtype=nbool)
-                z_p[i] = True
-                z_p[j] = True
-                pauli_list.append([weight, Pauli(z_p, zero)])
+                add_term(weight, i, j)
 
-            z_p = zeros(num_nodes, dtype=nbool)
-            z_p[i] = True
-            pauli_list.append([-weight, Pauli(z_p, zero)])
-
-            z_p = zeros(num_nodes, dtype=nbool)
-            z_p[j] = True
-            pauli_list.append([-weight, Pauli(z_p, zero)])
+            add_term(-weight, i)
+            add_term(-weight, j)
 
             offset += weight
 
-        # Remove paulis whose coefficients are zeros.
-        qubit_op = sum(PauliOp(pauli, coeff=coeff) for coeff, pauli in pauli_list)
-
-        # qubit_op could be the integer 0, in this case return an identity operator of
+        # qubit_op could be empty, in this case return an identity operator of
         # appropriate size
-        if isinstance(qubit_op, OperatorBase):
-            qubit_op = qubit_op.reduce()
+        if weights:
+            z_p = zeros((len(weights), num_nodes), dtype=nbool)
+            z_p[term_indices, qubit_indices] = True
+            # duplicate Paulis are merged in one pass instead of summing up PauliOps
+            qubit_op = SummedOp.from_pauli_arrays(z_p, zeros_like(z_p), weights)
         else:
             qubit_op = I ^ num_nodes
 
@@ -22,7 +22,8 @@ from qiskit import BasicAer, QuantumCircuit, QuantumRegister
 from qiskit.circuit.library import EfficientSU2
 from qiskit.quantum_info import Pauli, state_fidelity
 from qiskit.aqua import aqua_globals, QuantumInstance
-from qiskit.aqua.operators import WeightedPauliOperator
+from qiskit.aqua.operators import (WeightedPauliOperator, Z2Symmetries, measure_pauli_z,
+                                   covariance, measure_paulis_z, covariance_matrix)
 from qiskit.aqua.operators.legacy import op_converter
 from qiskit.aqua.components.initial_states import Custom
 
@@ -479,6 +480,43 @@ class TestWeightedPauliOperator(QiskitAquaTestCase):
         self.assertGreaterEqual(reference[0].real, actual_value[0].real - 3 * actual_value[1].real)
         self.assertLessEqual(reference[0].real, actual_value[0].real + 3 * actual_value[1].real)
 
+    def test_measure_paulis_z(self):
+        """ batched expectation and covariance from counts test """
+        num_qubits = 70
+        counts = {''.join(aqua_globals.random.choice(['0', '1'], num_qubits)):
+                  int(aqua_globals.random.integers(1, 100)) for _ in range(50)}
+        paulis = [Pauli(z=aqua_globals.random.integers(0, 2, num_qubits).astype(bool),
+                        x=aqua_globals.random.integers(0, 2, num_qubits).astype(bool))
+                  for _ in range(10)]
+        avgs = measure_paulis_z(counts, paulis)
+        cov = covariance_matrix(counts, paulis, avgs)
+
+        # reference: the sign of every Pauli for every measured bitstring
+        num_shots = sum(counts.values())
+        signs = np.zeros((len(counts), len(paulis)))
+        for k, bitstr in enumerate(counts):
+            bits = np.asarray(list(bitstr))[::-1] == '1'
+            for i, pauli in enumerate(paulis):
+                parity = np.count_nonzero(bits & np.logical_or(pauli.z, pauli.x)) % 2
+                signs[k, i] = -1.0 if parity else 1.0
+        shots = np.asarray(list(counts.values()))
+        ref_avgs = shots @ signs / num_shots
+        ref_cov = (signs - ref_avgs).T @ ((signs - ref_avgs) * shots[:, None]) / (num_shots - 1)
+
+        np.testing.assert_array_almost_equal(avgs, ref_avgs)
+        np.testing.assert_array_almost_equal(cov, ref_cov)
+        for i, pauli_1 in enumerate(paulis):
+            self.assertAlmostEqual(avgs[i], measure_pauli_z(counts, pauli_1))
+            for j, pauli_2 in enumerate(paulis):
+                self.assertAlmostEqual(cov[i, j],
+                                       covariance(counts, pauli_1, pauli_2, avgs[i], avgs[j]))
+
+        weights = aqua_globals.random.random(len(paulis))
+        avg, variance = WeightedPauliOperator._routine_compute_mean_and_var(
+            ([[weight, pauli] for weight, pauli in zip(weights, paulis)], counts))
+        self.assertAlmostEqual(avg, weights @ avgs)
+        self.assertAlmostEqual(variance, weights @ cov @ weights)
+
     def test_evaluate_statevector_mode(self):
         """ evaluate statevector mode test """
         wave_function = self.var_form.assign_parameters(
@@ -610,6 +648,35 @@ class TestWeightedPauliOperator(QiskitAquaTestCase):
         expectation_value, _ = eval_op(wpo2)
         self.assertAlmostEqual(expectation_value, -3.0, places=2)
 
+    def test_taper(self):
+        """ taper all the sectors at once test """
+        paulis = [Pauli.from_label(x)
+                  for x in ['IIII', 'ZZII', 'IZZI', 'IIZZ', 'ZIIZ', 'XXXX', 'YYXX', 'XYYX', 'ZZZZ']]
+        weights = [-0.8, 0.2, 0.3 + 0.1j, -0.4, 0.5, 0.15, -0.25, 0.35, 0.05]
+        op = WeightedPauliOperator.from_list(paulis, weights)
+        z2_symmetries = Z2Symmetries.find_Z2_symmetries(op)
+        sq_list = z2_symmetries.sq_list
+
+        conjugated_op = op
+        for clifford in z2_symmetries.cliffords:
+            conjugated_op = clifford * conjugated_op * clifford
+
+        sectors = list(itertools.product([1, -1], repeat=len(sq_list)))
+        tapered_ops = z2_symmetries.taper(op)
+        self.assertEqual(len(tapered_ops), len(sectors))
+        for sector, tapered_op in zip(sectors, tapered_ops):
+            ref_op = WeightedPauliOperator(paulis=[])
+            for weight, pauli in conjugated_op.paulis:
+                for value, qubit in zip(sector, sq_list):
+                    if pauli.z[qubit] or pauli.x[qubit]:
+                        weight *= value
+                ref_op += WeightedPauliOperator(
+                    paulis=[[weight, Pauli(np.delete(pauli.z, sq_list),
+                                           np.delete(pauli.x, sq_list))]])
+            self.assertEqual(tapered_op.z2_symmetries.tapering_values, list(sector))
+            self.assertTrue((tapered_op - ref_op).chop(1e-12).is_empty())
+            self.assertEqual(z2_symmetries.taper(op, list(sector)), tapered_op)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -18,9 +18,11 @@ from itertools import combinations
 from test.aqua import QiskitAquaTestCase
 
 from ddt import ddt, data
+import numpy as np
 
 from qiskit.aqua import AquaError
-from qiskit.aqua.operators import (X, Y, Z, I, Zero, Plus, AbelianGrouper)
+from qiskit.aqua.operators import (X, Y, Z, I, Zero, Plus, AbelianGrouper,
+                                   qubitwise_noncommuting_pairs)
 
 
 @ddt
@@ -93,6 +95,23 @@ class TestAbelianGrouper(QiskitAquaTestCase):
                 for op_1, op_2 in combinations(group, 2):
                     self.assertTrue(op_1.commutes(op_2))
 
+    def test_commutation_graph_blocks(self):
+        """Commutation graph built in blocks matches the pairwise check"""
+        random.seed(1234)
+        paulis = []
+        for _ in range(60):
+            pauliop = 1
+            for eachop in random.choices([I] * 5 + [X, Y, Z], k=70):
+                pauliop ^= eachop
+            paulis.append(pauliop)
+        expected = [(i, j) for i, j in combinations(range(len(paulis)), 2)
+                    if not paulis[i].commutes(paulis[j])]
+        self.assertListEqual(sorted(AbelianGrouper._commutation_graph(sum(paulis))), expected)
+        rows, cols = qubitwise_noncommuting_pairs(
+            np.array([op.primitive.x for op in paulis]),
+            np.array([op.primitive.z for op in paulis]), block_size=7)
+        self.assertListEqual(sorted(zip(rows.tolist(), cols.tolist())), expected)
+
 
 if __name__ == '__main__':
     unittest.main()
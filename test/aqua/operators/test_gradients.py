@@ -0,0 +1,122 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+""" Test Gradients """
+
+import unittest
+from test.aqua import QiskitAquaTestCase
+
+import numpy as np
+from ddt import ddt, data
+
+from qiskit import BasicAer, QuantumCircuit
+from qiskit.circuit import Parameter
+from qiskit.circuit.library import RealAmplitudes
+from qiskit.aqua import QuantumInstance, AquaError
+from qiskit.aqua.operators import (X, Y, Z, I, StateFn, CircuitStateFn, ListOp,
+                                   PauliExpectation, ParameterShift)
+
+
+@ddt
+class TestGradients(QiskitAquaTestCase):
+    """ Gradient converter tests """
+
+    def setUp(self):
+        super().setUp()
+        self.backend = QuantumInstance(BasicAer.get_backend('statevector_simulator'),
+                                       seed_simulator=50, seed_transpiler=50)
+
+    @data(False, True)
+    def test_expectation_gradient(self, use_backend):
+        """ parameter shift gradient of an expectation value """
+        a = Parameter('a')
+        b = Parameter('b')
+        qc = QuantumCircuit(2)
+        qc.ry(2 * a, 0)
+        qc.cry(b, 0, 1)
+        qc.rx(a, 1)
+        op = ~StateFn(Z ^ Z) @ CircuitStateFn(qc)
+
+        grad_fn = ParameterShift().gradient_wrapper(
+            op, [a, b], backend=self.backend if use_backend else None)
+        values = np.array([0.3, -1.1])
+
+        def expectation(x):
+            return np.real(op.bind_parameters(dict(zip([a, b], x))).eval())
+
+        eps = 1e-6
+        expected = [(expectation(values + eps * e) - expectation(values - eps * e)) / (2 * eps)
+                    for e in np.eye(2)]
+        np.testing.assert_array_almost_equal(grad_fn(values), expected)
+
+        # several sets of values at once
+        np.testing.assert_array_almost_equal(grad_fn(np.array([values, values])),
+                                             [expected, expected])
+
+    def test_pauli_sum_gradient(self):
+        """ parameter shift gradient of a Pauli sum with a change of basis """
+        ansatz = RealAmplitudes(2, reps=1)
+        params = sorted(ansatz.parameters, key=lambda p: p.name)
+        hamiltonian = 0.5 * (X ^ X) - 0.3 * (Y ^ Z) + 0.2 * (Z ^ I)
+        op = PauliExpectation().convert(~StateFn(hamiltonian) @ CircuitStateFn(ansatz))
+
+        grad_fn = ParameterShift().gradient_wrapper(op, params, backend=self.backend)
+        values = np.array([0.1, 0.2, -0.3, 0.4])
+
+        def expectation(x):
+            state = CircuitStateFn(ansatz.assign_parameters(dict(zip(params, x))))
+            return np.real((~StateFn(hamiltonian) @ state).eval())
+
+        eps = 1e-6
+        expected = [(expectation(values + eps * e) - expectation(values - eps * e)) / (2 * eps)
+                    for e in np.eye(len(params))]
+        np.testing.assert_array_almost_equal(grad_fn(values), expected)
+
+    def test_probability_gradient(self):
+        """ parameter shift gradient of sampling probabilities """
+        a = Parameter('a')
+        qc = QuantumCircuit(1)
+        qc.h(0)
+        qc.rz(a, 0)
+        qc.h(0)
+
+        grad_fn = ParameterShift().gradient_wrapper(CircuitStateFn(qc), [a], backend=self.backend)
+        value = 0.7
+        # the probabilities are (cos^2(a/2), sin^2(a/2))
+        np.testing.assert_array_almost_equal(grad_fn([value]),
+                                             [[-np.sin(value) / 2, np.sin(value) / 2]])
+
+    def test_convert(self):
+        """ convert returns one derivative per parameter """
+        a = Parameter('a')
+        b = Parameter('b')
+        qc = QuantumCircuit(1)
+        qc.rx(a, 0)
+        op = ListOp([~StateFn(Z) @ CircuitStateFn(qc), ~StateFn(X) @ CircuitStateFn(qc)])
+
+        grad = ParameterShift().convert(op, [a, b])
+        self.assertEqual(len(grad.oplist), 2)
+        values = grad.bind_parameters({a: 0.4}).eval()
+        np.testing.assert_array_almost_equal(values, [[-np.sin(0.4), 0], [0, 0]])
+
+    def test_parameterized_coeff(self):
+        """ parameterized coefficients are not supported """
+        a = Parameter('a')
+        qc = QuantumCircuit(1)
+        qc.rx(a, 0)
+        op = ~StateFn(Z) @ CircuitStateFn(qc, coeff=a)
+        with self.assertRaises(AquaError):
+            ParameterShift().convert(op, [a])
+
+
+if __name__ == '__main__':
+    unittest.main()
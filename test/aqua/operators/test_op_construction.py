@@ -643,6 +643,27 @@ class TestOpConstruction(QiskitAquaTestCase):
             circ_state_fn
         self.assertEqual(composed.num_qubits, max(perm) + 1)
 
+    def test_summed_op_from_pauli_arrays(self):
+        """Test SummedOp.from_pauli_arrays matches summing and reducing PauliOps"""
+        # XX, ZY, XX, ZI with qubit 0 first
+        z = [[0, 0], [1, 1], [0, 0], [0, 1]]
+        x = [[1, 1], [1, 0], [1, 1], [0, 0]]
+        coeffs = [2, 1, 0.5, -1]
+        sum_op = SummedOp.from_pauli_arrays(z, x, coeffs)
+        expected = ((X ^ X) * 2 + (Z ^ Y) + (X ^ X) * 0.5 - (Z ^ I)).reduce()
+        self.assertListEqual([str(op.primitive) for op in sum_op], ['XX', 'ZY', 'ZI'])
+        self.assertListEqual([str(op.primitive) for op in sum_op],
+                             [str(op.primitive) for op in expected])
+        self.assertListEqual([op.coeff for op in sum_op], [2.5, 1, -1])
+        self.assertEqual(sum_op, expected)
+
+        with self.subTest('single Pauli'):
+            self.assertEqual(SummedOp.from_pauli_arrays([[1], [1]], [[0], [0]], [1, 2]), 3 * Z)
+
+        with self.subTest('shape mismatch'):
+            with self.assertRaises(ValueError):
+                SummedOp.from_pauli_arrays(z, x, coeffs[1:])
+
     def test_summed_op_equals(self):
         """Test corner cases of SummedOp's equals function."""
         with self.subTest('multiplicative factor'):
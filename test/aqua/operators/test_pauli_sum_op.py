@@ -0,0 +1,126 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+""" Test PauliSumOp """
+
+import unittest
+from test.aqua import QiskitAquaTestCase
+
+import numpy as np
+
+from qiskit.quantum_info import SparsePauliOp
+from qiskit.aqua.operators import (X, Y, Z, I, Zero, One, StateFn, PrimitiveOp, PauliOp,
+                                   PauliSumOp, SummedOp, WeightedPauliOperator)
+
+
+class TestPauliSumOp(QiskitAquaTestCase):
+    """PauliSumOp tests."""
+
+    def setUp(self):
+        super().setUp()
+        self.summed_op_1 = (X ^ Z) + 2 * (Y ^ I) - 0.5 * (Z ^ Z)
+        self.summed_op_2 = (Z ^ X) + 1j * (Y ^ Y)
+        self.op_1 = PauliSumOp.from_pauli_ops(self.summed_op_1)
+        self.op_2 = PauliSumOp.from_pauli_ops(self.summed_op_2)
+
+    def assertSameMatrix(self, first, second):
+        """ Assert that two operators have the same matrix """
+        np.testing.assert_array_almost_equal(first.to_matrix(), second.to_matrix())
+
+    def test_construction(self):
+        """ construction test """
+        op = PrimitiveOp(SparsePauliOp.from_list([('XZ', 1), ('YI', 2), ('ZZ', -0.5)]))
+        self.assertIsInstance(op, PauliSumOp)
+        self.assertEqual(op.num_qubits, 2)
+        self.assertEqual(len(op), 3)
+        self.assertEqual(op, self.op_1)
+        self.assertEqual(op, PauliSumOp.from_list([('XZ', 1), ('YI', 2), ('ZZ', -0.5)]))
+        self.assertEqual(str(op), '1.0 * XZ + 2.0 * YI + -0.5 * ZZ')
+        self.assertSameMatrix(op, self.summed_op_1)
+        # PrimitiveOp.__new__ returns a PauliSumOp for a SparsePauliOp, see the assert above
+        # pylint: disable=no-member
+        np.testing.assert_array_almost_equal(op.to_spmatrix().toarray(),
+                                             self.summed_op_1.to_matrix())
+        with self.assertRaises(TypeError):
+            PauliSumOp(X)
+
+    def test_algebra(self):
+        """ add, compose, tensor, adjoint and mul test """
+        op_1, op_2 = self.op_1, self.op_2
+        sum_1, sum_2 = self.summed_op_1, self.summed_op_2
+
+        self.assertIsInstance(op_1 + op_2, PauliSumOp)
+        self.assertSameMatrix(op_1 + op_2, sum_1 + sum_2)
+        self.assertSameMatrix(2 * op_1 + 1j * op_2, 2 * sum_1 + 1j * sum_2)
+        self.assertSameMatrix(op_1 + (X ^ X), sum_1 + (X ^ X))
+        self.assertIsInstance(op_1 @ op_2, PauliSumOp)
+        self.assertSameMatrix(op_1 @ op_2, sum_1 @ sum_2)
+        self.assertSameMatrix(op_2 @ op_1, sum_2 @ sum_1)
+        self.assertSameMatrix(op_1 @ Y, sum_1 @ Y)
+        self.assertSameMatrix(op_1 ^ op_2, sum_1 ^ sum_2)
+        self.assertSameMatrix(op_1 ^ X, sum_1 ^ X)
+        self.assertSameMatrix(~op_2, ~sum_2)
+        self.assertSameMatrix(op_1.permute([2, 0]), sum_1.permute([2, 0]))
+
+    def test_mixed_width_compose(self):
+        """ compose of operators on different numbers of qubits test """
+        # pylint: disable=protected-access
+        self.assertEqual(PauliSumOp.from_pauli_ops(Z)._expand_dim(1), Z._expand_dim(1))
+        for pauli_op in [Z, X ^ Y]:
+            op = PauliSumOp.from_pauli_ops(pauli_op)
+            for other in [X ^ I, (X ^ I) + (Z ^ Y), X ^ Z ^ Y]:
+                with self.subTest(op=str(pauli_op), other=str(other)):
+                    self.assertSameMatrix(op @ PauliSumOp.from_pauli_ops(other),
+                                          pauli_op @ other)
+                    self.assertSameMatrix(PauliSumOp.from_pauli_ops(other) @ op,
+                                          other @ pauli_op)
+                    self.assertSameMatrix(op @ other.to_matrix_op(),
+                                          pauli_op.to_matrix_op() @ other.to_matrix_op())
+
+    def test_reduce(self):
+        """ reduce and equals test """
+        op = 2 * (self.op_1 + self.op_2 - self.op_1)
+        self.assertEqual(len(op), 8)
+        reduced = op.reduce()
+        self.assertEqual(len(reduced), 2)
+        self.assertEqual(reduced.coeff, 1)
+        self.assertEqual(reduced, 2 * self.op_2)
+        self.assertEqual(reduced, 2 * self.summed_op_2)
+        self.assertNotEqual(reduced, self.op_2)
+        self.assertNotEqual(self.op_1, self.op_1 ^ I)
+
+    def test_eval(self):
+        """ eval test """
+        for state in [Zero ^ One, One ^ One, StateFn({'01': 1, '10': 0.5})]:
+            np.testing.assert_array_almost_equal(
+                self.op_1.eval(state).to_matrix(), self.summed_op_1.eval(state).to_matrix())
+            self.assertAlmostEqual((~StateFn(self.op_1) @ state).eval(),
+                                   (~StateFn(self.summed_op_1) @ state).eval())
+
+    def test_conversions(self):
+        """ conversion to and from SummedOp and WeightedPauliOperator test """
+        pauli_op = self.op_1.to_pauli_op()
+        self.assertIsInstance(pauli_op, SummedOp)
+        self.assertEqual(pauli_op, self.summed_op_1)
+        self.assertIsInstance(PauliSumOp.from_list([('XY', 2)]).to_pauli_op(), PauliOp)
+
+        legacy_op = (3 * self.op_1).to_legacy_op()
+        self.assertIsInstance(legacy_op, WeightedPauliOperator)
+        self.assertEqual(legacy_op, (3 * self.summed_op_1).to_legacy_op())
+        self.assertEqual(PauliSumOp.from_legacy_op(legacy_op), 3 * self.op_1)
+
+        with self.assertRaises(TypeError):
+            PauliSumOp.from_pauli_ops(X + (X @ Y).to_matrix_op())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -17,11 +17,12 @@ import time
 
 from test.aqua import QiskitAquaTestCase
 import numpy as np
-from qiskit.ignis.mitigation.measurement import CompleteMeasFitter
+from qiskit.ignis.mitigation.measurement import CompleteMeasFitter, MeasurementFilter
 from qiskit import QuantumCircuit
 
 from qiskit.aqua.components.oracles import LogicalExpressionOracle
 from qiskit.aqua import QuantumInstance, aqua_globals, AquaError
+from qiskit.aqua.utils.measurement_error_mitigation import mitigate_counts
 from qiskit.aqua.algorithms import Grover, VQE
 from qiskit.aqua.operators import I, X, Z
 from qiskit.aqua.components.optimizers import SPSA
@@ -253,6 +254,26 @@ class TestMeasurementErrorMitigation(QiskitAquaTestCase):
         result = vqe.compute_minimum_eigenvalue()
         self.assertAlmostEqual(result.eigenvalue.real, -1.86, places=2)
 
+    def test_mitigate_counts(self):
+        """ batch mitigation of counts test """
+        state_labels = ['00', '01', '10', '11']
+        cal_matrix = np.array([[0.90, 0.05, 0.06, 0.01],
+                               [0.04, 0.88, 0.01, 0.05],
+                               [0.05, 0.02, 0.90, 0.04],
+                               [0.01, 0.05, 0.03, 0.90]])
+        counts_list = [{'00': 500, '11': 524}, {'00': 1024}, {'01': 300, '10': 700, '11': 24}]
+        meas_filter = MeasurementFilter(cal_matrix, state_labels)
+        for method in ['least_squares', 'pseudo_inverse']:
+            with self.subTest(method=method):
+                mitigated = mitigate_counts(counts_list, cal_matrix, state_labels, method=method)
+                for counts, mitigated_counts in zip(counts_list, mitigated):
+                    expected = meas_filter.apply(counts, method)
+                    for label in state_labels:
+                        self.assertAlmostEqual(mitigated_counts.get(label, 0),
+                                               expected.get(label, 0), delta=0.1)
+        with self.assertRaises(AquaError):
+            mitigate_counts([{'000': 1}], cal_matrix, state_labels)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -17,7 +17,7 @@ from test.aqua import QiskitAquaTestCase
 import numpy as np
 from qiskit.aqua import AquaError
 from qiskit.aqua.algorithms import NumPyEigensolver
-from qiskit.aqua.operators import WeightedPauliOperator
+from qiskit.aqua.operators import WeightedPauliOperator, PauliSumOp
 
 
 class TestNumPyEigensolver(QiskitAquaTestCase):
@@ -52,6 +52,25 @@ class TestNumPyEigensolver(QiskitAquaTestCase):
         np.testing.assert_array_almost_equal(result.eigenvalues.real,
                                              [-1.85727503, -1.24458455, -0.88272215, -0.22491125])
 
+    def test_ce_matrix_free(self):
+        """ Test matrix-free solving against the sparse matrix """
+        rng = np.random.RandomState(11)
+        labels = [''.join(rng.choice(list('IXYZ'), 8)) for _ in range(40)]
+        operator = PauliSumOp.from_list([(label, rng.randn()) for label in labels])
+        aux_operators = [0.5 * operator.to_pauli_op(), None, operator @ operator]
+        algo = NumPyEigensolver(operator.to_pauli_op(), k=3, aux_operators=aux_operators)
+        result = algo.run()
+        algo.matrix_free = True
+        result_matrix_free = algo.run()
+        np.testing.assert_array_almost_equal(result_matrix_free.eigenvalues, result.eigenvalues)
+        for aux_values, aux_values_matrix_free in zip(result.aux_operator_eigenvalues,
+                                                      result_matrix_free.aux_operator_eigenvalues):
+            self.assertIsNone(aux_values_matrix_free[1])
+            np.testing.assert_array_almost_equal(aux_values_matrix_free[[0, 2]].tolist(),
+                                                 aux_values[[0, 2]].tolist())
+            self.assertAlmostEqual((2 * aux_values_matrix_free[0][0]) ** 2,
+                                   aux_values_matrix_free[2][0])
+
     def test_ce_fail(self):
         """ Test no operator """
         algo = NumPyEigensolver()
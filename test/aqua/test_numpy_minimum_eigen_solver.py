@@ -57,6 +57,16 @@ class TestNumPyMinimumEigensolver(QiskitAquaTestCase):
         np.testing.assert_array_almost_equal(result.aux_operator_eigenvalues[0], [2, 0])
         np.testing.assert_array_almost_equal(result.aux_operator_eigenvalues[1], [0, 0])
 
+    def test_cme_matrix_free(self):
+        """ Matrix-free test """
+        algo = NumPyMinimumEigensolver(self.qubit_op, aux_operators=self.aux_ops,
+                                       matrix_free=True)
+        result = algo.run()
+        self.assertAlmostEqual(result.eigenvalue, -1.85727503 + 0j)
+        self.assertEqual(len(result.aux_operator_eigenvalues), 2)
+        np.testing.assert_array_almost_equal(result.aux_operator_eigenvalues[0], [2, 0])
+        np.testing.assert_array_almost_equal(result.aux_operator_eigenvalues[1], [0, 0])
+
     def test_cme_fail(self):
         """ Test no operator """
         algo = NumPyMinimumEigensolver()
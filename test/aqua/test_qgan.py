@@ -25,6 +25,8 @@ from qiskit.aqua.algorithms import QGAN
 from qiskit.aqua import aqua_globals, QuantumInstance, MissingOptionalLibraryError
 from qiskit.aqua.components.initial_states import Custom
 from qiskit.aqua.components.neural_networks import NumPyDiscriminator, PyTorchDiscriminator
+from qiskit.aqua.components.optimizers import L_BFGS_B
+from qiskit.aqua.operators import ParameterShift
 from qiskit import BasicAer
 
 
@@ -120,6 +122,17 @@ class TestQGAN(QiskitAquaTestCase):
         trained_qasm = self.qgan.run(self.qi_qasm)
         self.assertAlmostEqual(trained_qasm['rel_entr'], trained_statevector['rel_entr'], delta=0.1)
 
+    def test_qgan_training_parameter_shift_gradient(self):
+        """Test QGAN training with a parameter shift gradient and L_BFGS_B."""
+        self.qgan.set_generator(generator_circuit=self.generator_circuit,
+                                generator_gradient=ParameterShift())
+        # pylint: disable=protected-access
+        self.qgan.generator._optimizer = L_BFGS_B(maxfun=10)
+
+        trained_statevector = self.qgan.run(self.qi_statevector)
+        trained_qasm = self.qgan.run(self.qi_qasm)
+        self.assertAlmostEqual(trained_qasm['rel_entr'], trained_statevector['rel_entr'], delta=0.1)
+
     def test_qgan_training_run_algo_torch(self):
         """Test QGAN training using a PyTorch discriminator."""
         try:
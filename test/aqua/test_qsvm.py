@@ -150,6 +150,47 @@ class TestQSVM(QiskitAquaTestCase):
                 except Exception:  # pylint: disable=broad-except
                     pass
 
+    def test_statevector_kernel_cache(self):
+        """Test the statevector kernel matrix reuses cached statevectors."""
+        x_train, _ = split_dataset_to_data_and_labels(self.training_data)
+        x_test, _ = split_dataset_to_data_and_labels(self.testing_data)
+        statevector_cache = {}
+        kernel_training = QSVM.get_kernel_matrix(self.statevector_simulator,
+                                                 self.data_preparation, x_train[0],
+                                                 statevector_cache=statevector_cache)
+        self.assertEqual(len(statevector_cache), 4)
+        np.testing.assert_array_almost_equal(kernel_training, self.ref_kernel_training, decimal=1)
+
+        kernel_testing = QSVM.get_kernel_matrix(self.statevector_simulator,
+                                                self.data_preparation, x_test[0], x_train[0],
+                                                statevector_cache=statevector_cache)
+        self.assertEqual(len(statevector_cache), 6)
+        np.testing.assert_array_almost_equal(kernel_testing,
+                                             self.ref_kernel_testing['statevector'], decimal=4)
+        np.testing.assert_array_almost_equal(
+            QSVM.get_kernel_matrix(self.statevector_simulator, self.data_preparation,
+                                   x_test[0], x_train[0]),
+            kernel_testing)
+
+    def test_statevector_cache_bounded(self):
+        """Test predicting new data does not grow the statevector cache of the QSVM."""
+        svm = QSVM(self.data_preparation, self.training_data, self.testing_data, None,
+                   quantum_instance=self.statevector_simulator)
+        x_train, _ = split_dataset_to_data_and_labels(self.training_data)
+        x_test, _ = split_dataset_to_data_and_labels(self.testing_data)
+        try:
+            svm.train(x_train[0], x_train[1])
+            # pylint: disable=protected-access
+            num_cached = len(svm._statevector_cache)
+            self.assertEqual(num_cached, len(x_train[0]))
+            predicted = svm.predict(x_test[0])
+            for shift in [0.1, 0.2]:
+                svm.predict(x_test[0] + shift)
+            self.assertEqual(len(svm._statevector_cache), num_cached)
+            np.testing.assert_array_equal(svm.predict(x_test[0]), predicted)
+        except MissingOptionalLibraryError as ex:
+            self.skipTest(str(ex))
+
     def test_setup_data(self):
         """Test the setup_*_data methods of QSVM."""
         data_preparation = self.data_preparation
@@ -0,0 +1,140 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+""" Test Quantum Instance """
+
+import unittest
+import asyncio
+import tempfile
+from concurrent.futures import Future
+from test.aqua import QiskitAquaTestCase
+from qiskit import QuantumCircuit, BasicAer
+from qiskit.circuit import Parameter
+from qiskit.aqua import QuantumInstance
+from qiskit.aqua.utils import TranspileCache
+
+
+class TestQuantumInstance(QiskitAquaTestCase):
+    """ Test Quantum Instance """
+
+    def setUp(self):
+        super().setUp()
+        self.random_seed = 10598
+        qc = QuantumCircuit(2, 2)
+        qc.h(0)
+        qc.cx(0, 1)
+        qc.measure([0, 1], [0, 1])
+        self.qc = qc
+        self.quantum_instance = QuantumInstance(BasicAer.get_backend('qasm_simulator'),
+                                                seed_transpiler=self.random_seed,
+                                                seed_simulator=self.random_seed,
+                                                shots=1024)
+
+    def test_execute_async(self):
+        """ execute async returns the same result as execute """
+        expected = self.quantum_instance.execute(self.qc).get_counts(self.qc)
+        future = self.quantum_instance.execute_async(self.qc)
+        self.assertIsInstance(future, Future)
+        self.assertDictEqual(future.result().get_counts(self.qc), expected)
+
+    def test_execute_async_pipelined(self):
+        """ several batches submitted before any result is collected """
+        futures = [self.quantum_instance.execute_async([self.qc] * (i + 1)) for i in range(3)]
+        for i, future in enumerate(futures):
+            result = future.result()
+            self.assertEqual(len(result.results), i + 1)
+            for j in range(i + 1):
+                self.assertEqual(sum(result.get_counts(j).values()), 1024)
+
+    def test_execute_async_await(self):
+        """ execute async future can be awaited in a coroutine """
+        async def run():
+            return await asyncio.wrap_future(self.quantum_instance.execute_async(self.qc))
+
+        result = asyncio.run(run())
+        self.assertEqual(sum(result.get_counts(self.qc).values()), 1024)
+
+    def test_transpile_cache(self):
+        """ structurally identical circuits are transpiled once """
+        cache = TranspileCache()
+        self.quantum_instance.transpile_cache = cache
+        expected = self.quantum_instance.execute(self.qc).get_counts(self.qc)
+        qc = self.qc.copy()
+        qc.name = 'copy'
+        self.assertDictEqual(self.quantum_instance.execute(qc).get_counts(qc), expected)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+        # a different configuration is a different key
+        self.quantum_instance.set_config(optimization_level=0)
+        self.quantum_instance.transpile(self.qc)
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+
+    def test_transpile_cache_parameters(self):
+        """ cached circuits are rebound to the parameters of the requesting circuit """
+        def ansatz():
+            theta = Parameter('theta')
+            qc = QuantumCircuit(2)
+            qc.ry(theta, 0)
+            qc.cx(0, 1)
+            qc.rz(2 * theta, 1)
+            return qc, theta
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            self.quantum_instance.transpile_cache = TranspileCache(cache_dir=cache_dir)
+            qc_1, _ = ansatz()
+            self.quantum_instance.transpile(qc_1)
+
+            # a fresh cache on the same directory behaves like a new process
+            cache = TranspileCache(cache_dir=cache_dir)
+            self.quantum_instance.transpile_cache = cache
+            qc_2, theta_2 = ansatz()
+            transpiled = self.quantum_instance.transpile(qc_2)[0]
+            self.assertEqual(cache.hits, 1)
+            self.assertEqual(transpiled.parameters, {theta_2})
+            self.assertEqual(transpiled.name, qc_2.name)
+
+    def test_transpile_cache_controlled_gates(self):
+        """ controlled custom gates with the same name are told apart by their definitions """
+        cache = TranspileCache()
+        self.quantum_instance.transpile_cache = cache
+        circuits = []
+        for gate in ['x', 'z']:
+            custom = QuantumCircuit(1, name='custom')
+            getattr(custom, gate)(0)
+            qc = QuantumCircuit(2)
+            qc.append(custom.to_gate().control(), [0, 1])
+            circuits.append(qc)
+        for circuit in circuits:
+            self.quantum_instance.transpile(circuit)
+        self.assertEqual((cache.hits, cache.misses), (0, 2))
+        self.quantum_instance.transpile(circuits[0])
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+
+    def test_transpile_cache_lru(self):
+        """ least recently used circuits are evicted """
+        cache = TranspileCache(max_size=2)
+        self.quantum_instance.transpile_cache = cache
+        circuits = []
+        for i in range(3):
+            qc = QuantumCircuit(1)
+            qc.rx(i, 0)
+            circuits.append(qc)
+        self.quantum_instance.transpile(circuits)
+        self.assertEqual(len(cache), 2)
+        self.quantum_instance.transpile(circuits[0])
+        self.assertEqual((cache.hits, cache.misses), (0, 4))
+        self.quantum_instance.transpile(circuits[0])
+        self.assertEqual((cache.hits, cache.misses), (1, 4))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -14,7 +14,10 @@
 
 import unittest
 from test.aqua import QiskitAquaTestCase
-from qiskit.aqua.utils.subsystem import get_subsystems_counts
+import numpy as np
+from qiskit.quantum_info import partial_trace
+from qiskit.aqua.utils.subsystem import (get_subsystems_counts, get_subsystem_density_matrix,
+                                         get_subsystem_probabilities)
 
 
 class TestSubsystem(QiskitAquaTestCase):
@@ -37,6 +40,18 @@ class TestSubsystem(QiskitAquaTestCase):
         self.assertDictEqual(result[0], {'11': 2})
         self.assertDictEqual(result[1], {'010': 1, '011': 1})
 
+    def test_get_subsystem_density_matrix(self):
+        """Test reduced density matrix and marginal probabilities"""
+        statevector = np.random.RandomState(5).randn(32) + 1j
+        statevector /= np.linalg.norm(statevector)
+        trace_systems = [0, 3]
+
+        expected = partial_trace(np.outer(statevector, np.conj(statevector)), trace_systems).data
+        rho = get_subsystem_density_matrix(statevector, trace_systems)
+        np.testing.assert_array_almost_equal(rho, expected)
+        np.testing.assert_array_almost_equal(
+            get_subsystem_probabilities(statevector, trace_systems), np.real(np.diag(expected)))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,101 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+""" Test Uncertainty Models """
+
+import itertools
+import unittest
+from test.aqua import QiskitAquaTestCase
+
+import numpy as np
+from scipy.stats import lognorm, multivariate_normal, norm
+from qiskit.aqua.components.uncertainty_models import (LogNormalDistribution,
+                                                       MultivariateLogNormalDistribution,
+                                                       MultivariateNormalDistribution,
+                                                       NormalDistribution)
+from qiskit.aqua.components.uncertainty_models import normal_distribution
+
+
+def _multivariate_reference(pdf, num_qubits, low, high):
+    """ pdf evaluated point by point on the grid, first dimension varying the slowest """
+    axes = [np.linspace(low[i], high[i], 2 ** n) for i, n in enumerate(num_qubits)]
+    points = [np.asarray(point) for point in itertools.product(*axes)]
+    probs = np.asarray([pdf(point) for point in points])
+    return probs / np.sum(probs), points
+
+
+def _log_normal_pdf(point, mu, cov):
+    """ multivariate log-normal pdf, zero outside of the positive orthant """
+    if np.min(point) <= 0.0:
+        return 0.0
+    return multivariate_normal.pdf(np.log(point), mean=mu, cov=cov) / np.prod(point)
+
+
+class TestUncertaintyModels(QiskitAquaTestCase):
+    """ Test Uncertainty Models """
+
+    def test_normal(self):
+        """ univariate normal distribution """
+        values = np.linspace(-2, 3, 2 ** 4)
+        probs = norm.pdf(values, 0.5, 1.5)
+        model = NormalDistribution(4, mu=0.5, sigma=1.5, low=-2, high=3)
+        np.testing.assert_array_almost_equal(model.probabilities, probs / np.sum(probs))
+        np.testing.assert_array_almost_equal(model.values, values)
+
+    def test_log_normal(self):
+        """ univariate log-normal distribution """
+        values = np.linspace(0.1, 3, 2 ** 3)
+        probs = lognorm.pdf(values, s=0.5, scale=np.exp(0.2))
+        model = LogNormalDistribution(3, mu=0.2, sigma=0.5, low=0.1, high=3)
+        np.testing.assert_array_almost_equal(model.probabilities, probs / np.sum(probs))
+
+    def test_multivariate_normal(self):
+        """ multivariate normal distribution """
+        num_qubits, low, high = [2, 3], [-1, -2], [1, 2]
+        mu, sigma = [0.1, -0.2], [[1, 0.3], [0.3, 2]]
+        probs, _ = _multivariate_reference(lambda x: multivariate_normal.pdf(x, mu, sigma),
+                                           num_qubits, low, high)
+        model = MultivariateNormalDistribution(num_qubits, low, high, mu, sigma)
+        np.testing.assert_array_almost_equal(model.probabilities, probs)
+        np.testing.assert_array_almost_equal(model.probabilities_vector, probs)
+
+    def test_multivariate_log_normal(self):
+        """ multivariate log-normal distribution, including points outside of its support """
+        num_qubits, low, high = [2, 2], [0, 0.5], [2, 1.5]
+        mu, cov = [0.1, 0.2], [[0.5, 0.1], [0.1, 0.4]]
+        probs, points = _multivariate_reference(lambda x: _log_normal_pdf(x, mu, cov),
+                                                num_qubits, low, high)
+        model = MultivariateLogNormalDistribution(num_qubits, low, high, mu, cov)
+        np.testing.assert_array_almost_equal(model.probabilities, probs)
+        np.testing.assert_array_almost_equal(model.values, points)
+
+    def test_cached_probabilities(self):
+        """ models with the same parameters share the computation, but not the arrays """
+        # pylint does not see through the lru_cache wrapper of the cached function
+        # pylint: disable=no-value-for-parameter
+        normal_distribution._probabilities.cache_clear()
+        first = NormalDistribution(3, mu=0.3, sigma=0.7)
+        second = NormalDistribution(3, mu=0.3, sigma=0.7)
+        info = normal_distribution._probabilities.cache_info()
+        self.assertEqual((info.hits, info.misses), (1, 1))
+        np.testing.assert_array_equal(first.probabilities, second.probabilities)
+        first.probabilities[0] = 1.
+        self.assertNotEqual(second.probabilities[0], 1.)
+        self.assertNotEqual(NormalDistribution(3, mu=0.3, sigma=0.7).probabilities[0], 1.)
+        with self.subTest('different parameters'):
+            other = NormalDistribution(3, mu=0.3, sigma=0.8)
+            self.assertEqual(normal_distribution._probabilities.cache_info().misses, 2)
+            self.assertFalse(np.allclose(other.probabilities, second.probabilities))
+
+
+if __name__ == '__main__':
+    unittest.main()
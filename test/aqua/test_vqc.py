@@ -24,6 +24,7 @@ from qiskit.aqua.algorithms import VQC
 from qiskit.aqua.components.optimizers import SPSA, COBYLA
 from qiskit.aqua.components.feature_maps import RawFeatureVector
 from qiskit.aqua.components.optimizers import L_BFGS_B
+from qiskit.aqua.operators import ParameterShift
 from qiskit.ml.datasets import wine, ad_hoc_data
 
 
@@ -133,6 +134,23 @@ class TestVQC(QiskitAquaTestCase):
         with self.subTest(msg='check testing accuracy'):
             self.assertEqual(result['testing_accuracy'], 0.5)
 
+    def test_parameter_shift_gradient_bounded(self):
+        """Test the VQC with a parameter shift gradient and a bounded L_BFGS_B."""
+        optimizer = L_BFGS_B(maxfun=100)
+        data_preparation = self.data_preparation
+        wavefunction = TwoLocal(2, ['ry', 'rz'], 'cz', reps=3, insert_barriers=True)
+        wavefunction.parameter_bounds = [(-np.pi, np.pi)] * wavefunction.num_parameters
+
+        vqc = VQC(optimizer, data_preparation, wavefunction, self.training_data, self.testing_data,
+                  gradient=ParameterShift())
+        result = vqc.run(self.statevector_simulator)
+
+        with self.subTest(msg='check training loss'):
+            self.assertLess(result['training_loss'], 0.12)
+
+        with self.subTest(msg='check optimal params within bounds'):
+            self.assertTrue(np.all(np.abs(result['opt_params']) <= np.pi))
+
     def test_minibatching_gradient_free(self):
         """Test the minibatching option with a gradient-free optimizer."""
         n_dim = 2  # dimension of each data point
@@ -22,7 +22,7 @@ from qiskit.circuit.library import TwoLocal, EfficientSU2
 from qiskit.aqua import QuantumInstance, aqua_globals, AquaError
 from qiskit.aqua.operators import (WeightedPauliOperator, PrimitiveOp, X, Z, I,
                                    AerPauliExpectation, PauliExpectation,
-                                   MatrixExpectation, ExpectationBase)
+                                   MatrixExpectation, ExpectationBase, ParameterShift)
 from qiskit.aqua.components.optimizers import L_BFGS_B, COBYLA, SPSA, SLSQP
 from qiskit.aqua.algorithms import VQE
 
@@ -261,6 +261,21 @@ class TestVQE(QiskitAquaTestCase):
             result = vqe.compute_minimum_eigenvalue(operator)
             self.assertAlmostEqual(result.eigenvalue.real, -1.0, places=5)
 
+    def test_parameter_shift_gradient_bounded(self):
+        """Test the VQE with a parameter shift gradient and a bounded L_BFGS_B."""
+        wavefunction = TwoLocal(2, rotation_blocks='ry', entanglement_blocks='cz')
+        wavefunction.parameter_bounds = [(-np.pi, np.pi)] * wavefunction.num_parameters
+        vqe = VQE(self.h2_op, wavefunction, L_BFGS_B(maxfun=200),
+                  quantum_instance=self.statevector_simulator,
+                  gradient=ParameterShift())
+        result = vqe.run()
+
+        with self.subTest(msg='test eigenvalue'):
+            self.assertAlmostEqual(result.eigenvalue.real, self.h2_energy, places=5)
+
+        with self.subTest(msg='test optimal point within bounds'):
+            self.assertTrue(np.all(np.abs(result.optimal_point) <= np.pi))
+
     def test_vqe_optimizer(self):
         """ Test running same VQE twice to re-use optimizer, then switch optimizer """
         vqe = VQE(self.h2_op, optimizer=SLSQP(),
@@ -13,11 +13,14 @@
 """ Test BKSF Mapping """
 
 import unittest
+import itertools
 from test.chemistry import QiskitChemistryTestCase
 import numpy as np
 from qiskit.quantum_info import Pauli
 from qiskit.aqua.operators import WeightedPauliOperator
-from qiskit.chemistry.bksf import edge_operator_aij, edge_operator_bi
+from qiskit.chemistry import FermionicOperator
+from qiskit.chemistry.bksf import (edge_operator_aij, edge_operator_bi, bksf_mapping,
+                                   bravyi_kitaev_fast_edge_list, _one_body, _two_body)
 
 
 class TestBKSFMapping(QiskitChemistryTestCase):
@@ -77,6 +80,61 @@ class TestBKSFMapping(QiskitChemistryTestCase):
         self.assertEqual(qterm_a23, ref_qterm_a23, "\n{} vs \n{}".format(
             qterm_a23.print_details(), ref_qterm_a23.print_details()))
 
+    def test_bksf_mapping_terms(self):
+        """Test bksf mapping against the mapping of each term"""
+        modes = 4
+        rng = np.random.RandomState(11)
+        h_1 = rng.normal(size=(modes, modes))
+        h_2 = rng.normal(size=(modes, modes, modes, modes))
+        sym_h_1 = h_1 + h_1.T
+        sym_h_2 = h_2 + np.einsum('ijkl->jilk', h_2)
+        sym_h_2 = sym_h_2 + np.einsum('ijkl->klij', sym_h_2)
+        sym_h_2 = sym_h_2 + np.einsum('ijkl->lkji', sym_h_2)
+
+        for name, one_body, two_body in [('symmetric', sym_h_1, sym_h_2),
+                                         ('asymmetric', h_1, h_2)]:
+            with self.subTest(integrals=name):
+                qubit_op = bksf_mapping(FermionicOperator(h1=one_body, h2=two_body))
+                ref_op = _reference_mapping(one_body, two_body)
+                diff = (qubit_op - ref_op).chop(1e-10)
+                self.assertTrue(diff.is_empty())
+
+    def test_bksf_mapping_without_edges(self):
+        """Test bksf mapping of a diagonal one-body operator, which has no edges"""
+        fer_op = FermionicOperator(h1=np.diag([1., 2., 3., 4.]))
+        qubit_op = bksf_mapping(fer_op)
+        self.assertTrue(qubit_op.is_empty())
+
+
+def _reference_mapping(h_1, h_2):
+    """ Maps the integrals term by term, as bksf_mapping did before it was vectorized """
+    modes = h_1.shape[0]
+    # bksf mapping works with the 'physicist' notation.
+    fer_op = FermionicOperator(h1=h_1, h2=np.einsum('ijkm->ikmj', h_2))
+    edge_list = bravyi_kitaev_fast_edge_list(fer_op)
+    ref_op = WeightedPauliOperator(paulis=[])
+    # pylint: disable=invalid-name
+    for p, q in itertools.product(range(modes), repeat=2):
+        if p >= q and fer_op.h1[p, q] != 0:
+            ref_op += _one_body(edge_list, p, q, fer_op.h1[p, q])
+        for r, s in itertools.product(range(modes), repeat=2):
+            h2_pqrs = fer_op.h2[p, q, r, s]
+            if h2_pqrs == 0 or p == q or r == s:
+                continue
+            num_unique = len(set([p, q, r, s]))
+            # skip one of the complex conjugates
+            if [p, q, r, s] != [s, r, q, p]:
+                if num_unique == 4:
+                    if min(r, s) < min(p, q):
+                        continue
+                elif num_unique == 3:
+                    ref_op += _two_body(edge_list, p, q, r, s, 0.5 * h2_pqrs)
+                    continue
+                elif p != r and q < p:
+                    continue
+            ref_op += _two_body(edge_list, p, q, r, s, h2_pqrs)
+    return ref_op
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,97 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+""" Test BOPES Sampler """
+
+import unittest
+from test.chemistry import QiskitChemistryTestCase
+
+from functools import partial
+import numpy as np
+
+from qiskit import BasicAer
+from qiskit.aqua import QuantumInstance
+from qiskit.aqua.algorithms import NumPyMinimumEigensolver
+from qiskit.chemistry import QiskitChemistryError
+from qiskit.chemistry.algorithms.ground_state_solvers import GroundStateEigensolver
+from qiskit.chemistry.algorithms.ground_state_solvers.minimum_eigensolver_factories import \
+    VQEUCCSDFactory
+from qiskit.chemistry.algorithms.pes_samplers import BOPESSampler
+from qiskit.chemistry.drivers import Molecule, PySCFDriver
+from qiskit.chemistry.transformations import FermionicTransformation
+
+
+class TestBOPESSampler(QiskitChemistryTestCase):
+    """ Test BOPES Sampler """
+
+    def setUp(self):
+        super().setUp()
+        stretch = partial(Molecule.absolute_stretching, atom_pair=(1, 0))
+        self.molecule = Molecule(geometry=[('H', [0., 0., 0.]), ('H', [0., 0., 0.6])],
+                                 degrees_of_freedom=[stretch])
+        try:
+            self.driver = PySCFDriver(molecule=self.molecule)
+        except QiskitChemistryError:
+            self.skipTest('PYSCF driver does not appear to be installed')
+        self.points = list(np.linspace(0.6, 1.0, 5))
+
+    def _reference_energies(self):
+        solver = GroundStateEigensolver(FermionicTransformation(), NumPyMinimumEigensolver())
+        energies = []
+        for point in self.points:
+            self.molecule.perturbations = [point]
+            energies.append(solver.solve(self.driver).energy)
+        self.molecule.perturbations = None
+        return energies
+
+    def test_numpy_sampler(self):
+        """ exact energies with segments sampled in parallel """
+        reference = self._reference_energies()
+        for num_processes in [1, 2]:
+            with self.subTest(num_processes=num_processes):
+                # the solver is pickled for the processes, which it cannot be once it has run
+                solver = GroundStateEigensolver(FermionicTransformation(),
+                                                NumPyMinimumEigensolver())
+                result = BOPESSampler(solver, num_processes=num_processes).sample(self.driver,
+                                                                                  self.points)
+                self.assertListEqual(result.points, self.points)
+                np.testing.assert_array_almost_equal(result.energies, reference)
+                self.assertAlmostEqual(result.point_results(self.points[2]).energy,
+                                       reference[2])
+                self.assertIsNone(self.molecule.perturbations)
+                self.assertIsNone(self.driver.initial_density)
+
+    def test_vqe_bootstrap(self):
+        """ warm started VQE energies """
+        reference = self._reference_energies()
+        quantum_instance = QuantumInstance(BasicAer.get_backend('statevector_simulator'))
+        factory = VQEUCCSDFactory(quantum_instance)
+        solver = GroundStateEigensolver(FermionicTransformation(), factory)
+        result = BOPESSampler(solver, bootstrap=True, num_processes=1).sample(self.driver,
+                                                                              self.points)
+        np.testing.assert_array_almost_equal(result.energies, reference, decimal=5)
+        self.assertIsNone(factory.initial_point)
+
+    def test_initial_density(self):
+        """ SCF started from the converged density """
+        self.molecule.perturbations = [0.7]
+        energy = self.driver.run().hf_energy
+        density = self.driver.density_matrix
+        self.assertTupleEqual(density.shape, (2, 2))
+        np.testing.assert_array_almost_equal(density, density.T)
+
+        self.driver.initial_density = density
+        self.assertAlmostEqual(self.driver.run().hf_energy, energy)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -12,11 +12,15 @@
 
 """ Test Driver FCIDump """
 
+import os
+import tempfile
 import unittest
 from abc import ABC, abstractmethod
 from test.chemistry import QiskitChemistryTestCase
 import numpy as np
+from qiskit.chemistry import QiskitChemistryError
 from qiskit.chemistry.drivers import FCIDumpDriver
+from qiskit.chemistry.drivers.fcidumpd.parser import parse
 
 
 class BaseTestDriverFCIDump(ABC):
@@ -182,5 +186,45 @@ class TestDriverFCIDumpOH(QiskitChemistryTestCase, BaseTestDriverFCIDump):
         self.qmolecule = driver.run()
 
 
+class TestFCIDumpParserPacked(QiskitChemistryTestCase):
+    """FCIDump parser packed layout tests."""
+
+    def test_packed(self):
+        """ packed 2-electron integrals test """
+        fcidump = self.get_resource_path('test_driver_fcidump_oh.fcidump')
+        full = parse(fcidump)
+        packed = parse(fcidump, packed=True)
+        np.testing.assert_array_almost_equal(packed['hij'], full['hij'])
+        np.testing.assert_array_almost_equal(packed['hij_b'], full['hij_b'])
+
+        norb = full['NORB']
+        idx = np.indices((norb,) * 4).reshape(4, -1)
+
+        def pair(first, second):
+            high = np.maximum(first, second)
+            return high * (high + 1) // 2 + np.minimum(first, second)
+
+        bra, ket = pair(idx[0], idx[1]), pair(idx[2], idx[3])
+        for key in ['hijkl', 'hijkl_bb']:
+            np.testing.assert_array_almost_equal(packed[key][pair(bra, ket)],
+                                                 full[key][tuple(idx)])
+        np.testing.assert_array_almost_equal(packed['hijkl_ba'][bra, ket],
+                                             full['hijkl_ba'][tuple(idx)])
+
+    def test_restricted_beta_indices(self):
+        """ beta spin indices without the unrestricted marker line test """
+        with tempfile.NamedTemporaryFile('w', suffix='.fcidump', delete=False) as file:
+            file.write(' &FCI NORB=2,NELEC=2,MS2=0,\n  ORBSYM=1,1,\n  ISYM=1,\n &END\n'
+                       ' 0.5 1 1 1 1\n 0.25 3 3 1 1\n -1.0 1 1 0 0\n -0.5 3 3 0 0\n'
+                       ' 0.7 0 0 0 0\n')
+        try:
+            with self.assertRaises(QiskitChemistryError) as context:
+                parse(file.name)
+            self.assertIn("2-electron integral indices encountered in '(3, 3, 1, 1)'",
+                          str(context.exception))
+        finally:
+            os.remove(file.name)
+
+
 if __name__ == '__main__':
     unittest.main()
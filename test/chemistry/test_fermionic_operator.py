@@ -13,10 +13,14 @@
 """ Test Fermionic Operator """
 
 import copy
+import itertools
 import unittest
 from test.chemistry import QiskitChemistryTestCase
 import numpy as np
+from ddt import ddt, data
+from qiskit.quantum_info import Pauli
 from qiskit.aqua.utils import random_unitary
+from qiskit.aqua.operators import WeightedPauliOperator
 from qiskit.aqua.operators.legacy import op_converter
 from qiskit.chemistry import FermionicOperator, QiskitChemistryError
 from qiskit.chemistry.drivers import PySCFDriver, UnitsType
@@ -54,6 +58,73 @@ def h2_transform_slow(h2_, unitary_matrix):
     return temp_ret
 
 
+def mapping_slow(fer_op, a_list, threshold=1e-8):
+    """
+    Map fermionic operator to qubit operator term by term with Pauli.sgn_prod.
+    Args:
+        fer_op (FermionicOperator): the operator to map
+        a_list (list[tuple]): the pair of Paulis of each mode
+        threshold (float): threshold to remove a pauli
+    Returns:
+        WeightedPauliOperator: the qubit operator
+    """
+    n = fer_op.modes
+    qubit_op = WeightedPauliOperator(paulis=[])
+    for i, j in itertools.product(range(n), repeat=2):
+        if fer_op.h1[i, j] == 0:
+            continue
+        pauli_list = []
+        for alpha, beta in itertools.product(range(2), repeat=2):
+            pauli, phase = Pauli.sgn_prod(a_list[i][alpha], a_list[j][beta])
+            coeff = fer_op.h1[i, j] / 4 * phase * np.power(-1j, alpha) * np.power(1j, beta)
+            if np.absolute(coeff) > threshold:
+                pauli_list.append([coeff, pauli])
+        qubit_op += WeightedPauliOperator(paulis=pauli_list)
+    qubit_op.chop(threshold=threshold)
+    for i, j, k, m in itertools.product(range(n), repeat=4):
+        if fer_op.h2[i, j, k, m] == 0:
+            continue
+        pauli_list = []
+        for alpha, beta, gamma, delta in itertools.product(range(2), repeat=4):
+            pauli_1, phase_1 = Pauli.sgn_prod(a_list[i][alpha], a_list[k][beta])
+            pauli_2, phase_2 = Pauli.sgn_prod(pauli_1, a_list[m][gamma])
+            pauli_3, phase_3 = Pauli.sgn_prod(pauli_2, a_list[j][delta])
+            coeff = fer_op.h2[i, j, k, m] / 16 * phase_1 * phase_2 * phase_3 * \
+                np.power(-1j, alpha + beta) * np.power(1j, gamma + delta)
+            if np.absolute(coeff) > threshold:
+                pauli_list.append([coeff, pauli_3])
+        qubit_op += WeightedPauliOperator(paulis=pauli_list)
+    qubit_op.chop(threshold=threshold)
+    return qubit_op
+
+
+@ddt
+class TestFermionicOperatorMapping(QiskitChemistryTestCase):
+    """Fermionic Operator mapping tests, not requiring a driver."""
+
+    @data('jordan_wigner', 'parity', 'bravyi_kitaev')
+    def test_mapping(self, map_type):
+        """ mapping of random integrals test """
+        num_modes = 6
+        rng = np.random.RandomState(7)
+        h_1 = rng.randn(num_modes, num_modes)
+        h_1 = h_1 + h_1.T
+        h_1[np.abs(h_1) < 0.5] = 0
+        h_2 = rng.randn(num_modes, num_modes, num_modes, num_modes)
+        h_2[np.abs(h_2) < 1.2] = 0
+        h_2[0, 1, 1, 0] = 1e-9
+        fer_op = FermionicOperator(h1=h_1, h2=h_2)
+
+        qubit_op = fer_op.mapping(map_type)
+        a_list = getattr(fer_op, '_{}_mode'.format(map_type))(num_modes)
+        reference_op = mapping_slow(fer_op, a_list)
+
+        self.assertEqual([pauli.to_label() for _, pauli in qubit_op.paulis],
+                         [pauli.to_label() for _, pauli in reference_op.paulis])
+        np.testing.assert_array_almost_equal([weight for weight, _ in qubit_op.paulis],
+                                             [weight for weight, _ in reference_op.paulis])
+
+
 class TestFermionicOperator(QiskitChemistryTestCase):
     """Fermionic Operator tests."""
 
@@ -15,10 +15,13 @@
 import unittest
 
 from test.chemistry import QiskitChemistryTestCase
-from ddt import ddt, idata, unpack
+import numpy as np
+from ddt import ddt, idata, data, unpack
 from qiskit.aqua.algorithms import NumPyMinimumEigensolver
 from qiskit.chemistry import FermionicOperator, QiskitChemistryError
 from qiskit.chemistry.drivers import PySCFDriver, UnitsType, HFMethodType
+from qiskit.chemistry.particle_hole import (particle_hole_transformation,
+                                            _particle_hole_reference)
 
 
 @ddt
@@ -80,6 +83,61 @@ class TestParticleHole(QiskitChemistryTestCase):
         self.assertAlmostEqual(result.eigenvalue.real,
                                ph_result.eigenvalue.real - ph_shift, msg=config)
 
+    @data([1, 1], [2, 1], [1, 0])
+    def test_particle_hole_reference(self, num_particles):
+        """ particle hole transformation matches the reference implementation """
+        n_qubits = 6
+        rng = np.random.RandomState(7)
+        h_1 = rng.normal(size=(n_qubits, n_qubits))
+        h_1 = h_1 + h_1.T
+        h_2 = rng.normal(size=(n_qubits, n_qubits, n_qubits, n_qubits))
+        h_2 = h_2 + np.einsum('ijkl->jilk', h_2)
+        h_2 = h_2 + np.einsum('ijkl->klij', h_2)
+        h_2 = h_2 + np.einsum('ijkl->lkji', h_2)
+
+        h1_ref, h2_ref, shift_ref = _particle_hole_reference(
+            n_qubits, num_particles, h_1, h_2)
+        h1_new, h2_new, shift_new = particle_hole_transformation(
+            n_qubits, num_particles, h_1, h_2)
+
+        self.assertAlmostEqual(shift_new, shift_ref)
+        for map_type in ['jordan_wigner', 'bksf']:
+            with self.subTest(map_type=map_type):
+                ref_op = FermionicOperator(h1=h1_ref, h2=h2_ref).mapping(map_type)
+                new_op = FermionicOperator(h1=h1_new, h2=h2_new).mapping(map_type)
+                self.assertEqual(new_op.num_qubits, ref_op.num_qubits)
+                diff = (new_op - ref_op).chop(1e-10)
+                self.assertTrue(diff.is_empty())
+
+    @data(H_2, LIH)
+    def test_particle_hole_bksf(self, atom):
+        """ bksf mapping of the particle hole transformed operator """
+        try:
+            driver = PySCFDriver(atom=atom, unit=UnitsType.ANGSTROM, basis='sto3g')
+        except QiskitChemistryError:
+            self.skipTest('PYSCF driver does not appear to be installed')
+
+        molecule = driver.run()
+        fer_op = FermionicOperator(h1=molecule.one_body_integrals, h2=molecule.two_body_integrals)
+        num_particles = [molecule.num_alpha, molecule.num_beta]
+        ph_fer_op, _ = fer_op.particle_hole_transformation(num_particles)
+
+        # the reference works with interleaved spins, as the transformation does
+        # pylint: disable=protected-access
+        ref_fer_op = FermionicOperator(h1=molecule.one_body_integrals,
+                                       h2=molecule.two_body_integrals)
+        ref_fer_op._convert_to_interleaved_spins()
+        h1_ref, h2_ref, shift_ref = _particle_hole_reference(ref_fer_op.modes, num_particles,
+                                                             ref_fer_op.h1, ref_fer_op.h2)
+        ref_fer_op = FermionicOperator(h1=h1_ref, h2=h2_ref, ph_trans_shift=shift_ref)
+        ref_fer_op._convert_to_block_spins()
+
+        ph_op = ph_fer_op.mapping('bksf')
+        ref_op = ref_fer_op.mapping('bksf')
+        self.assertEqual(ph_op.num_qubits, ref_op.num_qubits)
+        diff = (ph_op - ref_op).chop(1e-10)
+        self.assertTrue(diff.is_empty())
+
 
 if __name__ == '__main__':
     unittest.main()
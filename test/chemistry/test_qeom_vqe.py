@@ -23,9 +23,12 @@ from qiskit.circuit.library import RealAmplitudes
 from qiskit.aqua import QuantumInstance, aqua_globals
 from qiskit.aqua.components.optimizers import COBYLA, SPSA
 from qiskit.aqua.algorithms import NumPyEigensolver
-from qiskit.aqua.operators import Z2Symmetries
+from qiskit.aqua.operators import (Z2Symmetries, WeightedPauliOperator,
+                                   TPBGroupedWeightedPauliOperator)
+from qiskit.aqua.operators.legacy import op_converter
 from qiskit.chemistry import QiskitChemistryError
 from qiskit.chemistry.algorithms import QEomVQE
+from qiskit.chemistry.algorithms.eigen_solvers.q_equation_of_motion import QEquationOfMotion
 from qiskit.chemistry.drivers import PySCFDriver, UnitsType
 from qiskit.chemistry.core import Hamiltonian, TransformationType, QubitMappingType
 from qiskit.chemistry.components.variational_forms import UCCSD
@@ -167,6 +170,66 @@ class TestEomVQE(QiskitAquaTestCase):
         result = eom_vqe.run(quantum_instance)
         np.testing.assert_array_almost_equal(self.reference, result['energies'], decimal=2)
 
+    def test_evaluate_commutators_qasm(self):
+        """Test the commutators evaluated from one set of measurements with the qasm backend."""
+        warnings.filterwarnings('ignore', category=DeprecationWarning)
+        core = Hamiltonian(transformation=TransformationType.FULL,
+                           qubit_mapping=QubitMappingType.JORDAN_WIGNER,
+                           two_qubit_reduction=False,
+                           freeze_core=False,
+                           orbital_reduction=[])
+        warnings.filterwarnings('always', category=DeprecationWarning)
+        qubit_op, _ = core.run(self.molecule)
+
+        eom = QEquationOfMotion(qubit_op, core.molecule_info['num_orbitals'],
+                                core.molecule_info['num_particles'], 'jordan_wigner')
+        excitations_list = [[0, 2], [1, 3], [0, 1, 2, 3]]
+        hopping_operators, type_of_commutativities = \
+            eom.build_hopping_operators(excitations_list)
+        commutators = eom.build_all_commutators(excitations_list, hopping_operators,
+                                                type_of_commutativities)[:4]
+        operators = [op for ops in commutators for op in ops.flat
+                     if op is not None and not op.is_empty()]
+
+        var_form = RealAmplitudes(qubit_op.num_qubits, reps=1)
+        wave_fn = var_form.assign_parameters(np.linspace(0.1, 1.5, var_form.num_parameters))
+        quantum_instance = QuantumInstance(BasicAer.get_backend('qasm_simulator'), shots=1024,
+                                           seed_simulator=7, seed_transpiler=7)
+        executed = []
+        execute = quantum_instance.execute
+
+        def _execute(circuits, **kwargs):
+            result = execute(circuits, **kwargs)
+            executed.append((circuits, result))
+            return result
+
+        quantum_instance.execute = _execute
+        results = QEquationOfMotion._evaluate_commutators(operators, wave_fn, quantum_instance)
+
+        # the distinct Paulis of all the commutators grouped into qubit-wise commuting bases
+        paulis = {pauli.to_label(): pauli for op in operators for _, pauli in op.paulis}
+        pool = op_converter.to_tpb_grouped_weighted_pauli_operator(
+            WeightedPauliOperator(paulis=[[1.0, pauli] for pauli in paulis.values()]),
+            TPBGroupedWeightedPauliOperator.sorted_grouping)
+        self.assertEqual(len(executed), 1)
+        circuits, result = executed[0]
+        self.assertEqual(len(circuits), len(pool.basis))
+
+        self.assertEqual(len(results), len(operators))
+        for op, (mean, std) in zip(operators, results):
+            # the same operator measured in the bases of the pool
+            positions = {pauli.to_label(): idx for idx, (_, pauli) in enumerate(op.paulis)}
+            basis = []
+            for basis_pauli, indices in pool.basis:
+                members = [positions[pool.paulis[idx][1].to_label()] for idx in indices
+                           if pool.paulis[idx][1].to_label() in positions]
+                if members:
+                    basis.append((basis_pauli, members))
+            grouped_op = TPBGroupedWeightedPauliOperator(op.paulis, basis)
+            ref_mean, ref_std = grouped_op.evaluate_with_result(result, statevector_mode=False)
+            self.assertAlmostEqual(mean, ref_mean)
+            self.assertAlmostEqual(std, ref_std)
+
 
 if __name__ == '__main__':
     unittest.main()
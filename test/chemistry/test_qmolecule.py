@@ -0,0 +1,142 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+""" Test QMolecule integral conversions """
+
+import unittest
+from test.chemistry import QiskitChemistryTestCase
+
+import numpy as np
+
+from qiskit.chemistry import QMolecule
+from qiskit.chemistry.drivers import HDF5Driver
+
+
+def _onee_to_spin_reference(mohij, mohij_b=None, threshold=1E-12):
+    """ element by element expansion of one-body integrals to spin orbitals """
+    # pylint: disable=invalid-name
+    if mohij_b is None:
+        mohij_b = mohij
+    norbs = mohij.shape[0]
+    nspin_orbs = 2 * norbs
+    moh1_qubit = np.zeros([nspin_orbs, nspin_orbs])
+    for p in range(nspin_orbs):
+        for q in range(nspin_orbs):
+            if p // norbs != q // norbs:
+                continue
+            ints = mohij if p // norbs == 0 else mohij_b
+            if abs(ints[p % norbs, q % norbs]) > threshold:
+                moh1_qubit[p, q] = ints[p % norbs, q % norbs]
+    return moh1_qubit
+
+
+def _twoe_to_spin_reference(mohijkl, mohijkl_bb=None, mohijkl_ba=None, threshold=1E-12):
+    """ element by element expansion of two-body integrals to spin orbitals """
+    # pylint: disable=invalid-name
+    ints_aa = np.einsum('ijkl->ljik', mohijkl)
+    if mohijkl_bb is None or mohijkl_ba is None:
+        ints_bb = ints_ba = ints_ab = ints_aa
+    else:
+        ints_bb = np.einsum('ijkl->ljik', mohijkl_bb)
+        ints_ba = np.einsum('ijkl->ljik', mohijkl_ba)
+        ints_ab = np.einsum('ijkl->ljik', mohijkl_ba.transpose())
+    norbs = mohijkl.shape[0]
+    nspin_orbs = 2 * norbs
+    moh2_qubit = np.zeros([nspin_orbs, nspin_orbs, nspin_orbs, nspin_orbs])
+    for p in range(nspin_orbs):
+        for q in range(nspin_orbs):
+            for r in range(nspin_orbs):
+                for s in range(nspin_orbs):
+                    if p // norbs != s // norbs or q // norbs != r // norbs:
+                        continue
+                    if p // norbs == 0:
+                        ints = ints_aa if q // norbs == 0 else ints_ba
+                    else:
+                        ints = ints_ab if q // norbs == 0 else ints_bb
+                    value = ints[p % norbs, q % norbs, r % norbs, s % norbs]
+                    if abs(value) > threshold:
+                        moh2_qubit[p, q, r, s] = -0.5 * value
+    return moh2_qubit
+
+
+class TestQMolecule(QiskitChemistryTestCase):
+    """ Test QMolecule integral conversions """
+
+    def setUp(self):
+        super().setUp()
+        self.rng = np.random.default_rng(5)
+        # integrals with a few entries below the threshold, to check these are dropped
+        self.norbs = 3
+        self.mohij = self._random_ints(2)
+        self.mohij_b = self._random_ints(2)
+        self.mohijkl = self._random_ints(4)
+        self.mohijkl_bb = self._random_ints(4)
+        self.mohijkl_ba = self._random_ints(4)
+
+    def _random_ints(self, ndim):
+        ints = self.rng.standard_normal([self.norbs] * ndim)
+        ints[self.rng.random(ints.shape) < 0.2] = 1e-14
+        return ints
+
+    def test_onee_to_spin_restricted(self):
+        """ restricted one-body integrals to spin orbitals """
+        np.testing.assert_array_equal(QMolecule.onee_to_spin(self.mohij),
+                                      _onee_to_spin_reference(self.mohij))
+
+    def test_onee_to_spin_unrestricted(self):
+        """ unrestricted one-body integrals to spin orbitals """
+        np.testing.assert_array_equal(QMolecule.onee_to_spin(self.mohij, self.mohij_b),
+                                      _onee_to_spin_reference(self.mohij, self.mohij_b))
+
+    def test_twoe_to_spin_restricted(self):
+        """ restricted two-body integrals to spin orbitals """
+        np.testing.assert_array_equal(QMolecule.twoe_to_spin(self.mohijkl),
+                                      _twoe_to_spin_reference(self.mohijkl))
+
+    def test_twoe_to_spin_unrestricted(self):
+        """ unrestricted two-body integrals to spin orbitals """
+        np.testing.assert_array_equal(
+            QMolecule.twoe_to_spin(self.mohijkl, self.mohijkl_bb, self.mohijkl_ba),
+            _twoe_to_spin_reference(self.mohijkl, self.mohijkl_bb, self.mohijkl_ba))
+
+    def test_twoe_to_spin_threshold(self):
+        """ threshold of the two-body expansion """
+        np.testing.assert_array_equal(
+            QMolecule.twoe_to_spin(self.mohijkl, threshold=0.5),
+            _twoe_to_spin_reference(self.mohijkl, threshold=0.5))
+
+    def test_twoeints2mo(self):
+        """ two-body integrals from AO to MO basis """
+        ints = self.rng.standard_normal([self.norbs] * 4)
+        moc = self.rng.standard_normal([self.norbs, self.norbs])
+        moc_b = self.rng.standard_normal([self.norbs, self.norbs])
+        with self.subTest('restricted'):
+            np.testing.assert_array_almost_equal(
+                QMolecule.twoeints2mo(ints, moc),
+                np.einsum('pqrs,pi,qj,rk,sl->ijkl', ints, moc, moc, moc, moc, optimize=False))
+        with self.subTest('unrestricted'):
+            np.testing.assert_array_almost_equal(
+                QMolecule.twoeints2mo_general(ints, moc_b, moc_b, moc, moc),
+                np.einsum('pqrs,pi,qj,rk,sl->ijkl', ints, moc_b, moc_b, moc, moc,
+                          optimize=False))
+
+    def test_molecule_integrals(self):
+        """ spin orbital integrals of a molecule """
+        q_mol = HDF5Driver(hdf5_input=self.get_resource_path('test_driver_hdf5.hdf5')).run()
+        np.testing.assert_array_equal(q_mol.one_body_integrals,
+                                      _onee_to_spin_reference(q_mol.mo_onee_ints))
+        np.testing.assert_array_equal(q_mol.two_body_integrals,
+                                      _twoe_to_spin_reference(q_mol.mo_eri_ints))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+""" Test QMolecule Cache """
+
+import os
+import shutil
+import tempfile
+import unittest
+from test.chemistry import QiskitChemistryTestCase
+
+import numpy as np
+
+from qiskit.chemistry import QiskitChemistryError
+from qiskit.chemistry.drivers import HDF5Driver, PySCFDriver, QMoleculeCache
+
+
+class TestQMoleculeCache(QiskitChemistryTestCase):
+    """ Test QMolecule cache """
+
+    def setUp(self):
+        super().setUp()
+        self.cache_dir = tempfile.mkdtemp()
+        self.q_mol = HDF5Driver(hdf5_input=self.get_resource_path('test_driver_hdf5.hdf5')).run()
+
+    def tearDown(self):
+        super().tearDown()
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def test_key(self):
+        """ keys of driver configurations """
+        key = QMoleculeCache.key('PySCFDriver', 'atom=H 0 0 0; H 0 0 0.735')
+        self.assertEqual(key, QMoleculeCache.key('PySCFDriver', 'atom=H 0 0 0; H 0 0 0.735'))
+        self.assertNotEqual(key, QMoleculeCache.key('PySCFDriver', 'atom=H 0 0 0; H 0 0 0.7'))
+        self.assertNotEqual(key, QMoleculeCache.key('PSI4Driver', 'atom=H 0 0 0; H 0 0 0.735'))
+
+    def test_save_load(self):
+        """ save and load a QMolecule """
+        cache = QMoleculeCache(self.cache_dir)
+        self.assertIsNone(cache.load('a'))
+        cache.save('a', self.q_mol)
+        q_mol = cache.load('a')
+        self.assertAlmostEqual(q_mol.hf_energy, self.q_mol.hf_energy)
+        np.testing.assert_array_almost_equal(q_mol.mo_eri_ints, self.q_mol.mo_eri_ints)
+
+        # the loaded QMolecule does not use the cached file
+        cached_file = os.path.join(self.cache_dir, 'a.hdf5')
+        self.assertNotEqual(q_mol.filename, cached_file)
+        q_mol.save()
+        q_mol.remove_file()
+        self.assertTrue(os.path.isfile(cached_file))
+        self.assertIsNotNone(cache.load('a'))
+
+        cache.clear()
+        self.assertIsNone(cache.load('a'))
+
+    def test_eviction(self):
+        """ least recently used QMolecules are evicted """
+        cache = QMoleculeCache(self.cache_dir)
+        cache.save('a', self.q_mol)
+        size = os.path.getsize(os.path.join(self.cache_dir, 'a.hdf5'))
+        cache.max_size = 2 * size
+        cache.save('b', self.q_mol)
+        # make 'b' the least recently used, as loading 'a' marks it used
+        os.utime(os.path.join(self.cache_dir, 'b.hdf5'), (0, 0))
+        self.assertIsNotNone(cache.load('a'))
+        cache.save('c', self.q_mol)
+        self.assertIsNone(cache.load('b'))
+        self.assertIsNotNone(cache.load('a'))
+        self.assertIsNotNone(cache.load('c'))
+
+    def test_driver_cache(self):
+        """ driver runs with the same configuration load the QMolecule """
+        try:
+            driver = PySCFDriver(atom='H .0 .0 .0; H .0 .0 0.735')
+        except QiskitChemistryError:
+            self.skipTest('PYSCF driver does not appear to be installed')
+        driver.cache = QMoleculeCache(self.cache_dir)
+        q_mol = driver.run()
+        self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+        cached_q_mol = driver.run()
+        self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+        self.assertAlmostEqual(cached_q_mol.hf_energy, q_mol.hf_energy)
+        np.testing.assert_array_almost_equal(cached_q_mol.mo_onee_ints, q_mol.mo_onee_ints)
+
+        # the initial density is part of the configuration
+        driver.initial_density = driver.density_matrix
+        driver.run()
+        self.assertEqual(len(os.listdir(self.cache_dir)), 2)
+        driver.run()
+        self.assertEqual(len(os.listdir(self.cache_dir)), 2)
+        driver.initial_density = 0.5 * driver.density_matrix
+        driver.run()
+        self.assertEqual(len(os.listdir(self.cache_dir)), 3)
+
+        driver.initial_density = None
+        driver.basis = '631g'
+        driver.run()
+        self.assertEqual(len(os.listdir(self.cache_dir)), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -97,6 +97,15 @@ class TestDataProviders(QiskitFinanceTestCase):
             with self.subTest('test RandomDataProvider get_similarity_matrix'):
                 np.testing.assert_array_almost_equal(rnd.get_similarity_matrix(),
                                                      similarity, decimal=3)
+            with self.subTest('test RandomDataProvider get_similarity_matrix cached'):
+                rho = rnd.get_similarity_matrix()
+                rho[0, 1] = 0.
+                np.testing.assert_array_almost_equal(rnd.get_similarity_matrix(),
+                                                     similarity, decimal=3)
+                self.assertIsNot(rnd.get_similarity_matrix(), rnd.get_similarity_matrix())
+                rnd.run()
+                np.testing.assert_array_almost_equal(rnd.get_similarity_matrix(radius=2),
+                                                     similarity, decimal=3)
         except MissingOptionalLibraryError as ex:
             self.skipTest(str(ex))
 
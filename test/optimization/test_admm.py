@@ -15,10 +15,10 @@ from test.optimization import QiskitOptimizationTestCase
 
 import numpy as np
 from docplex.mp.model import Model
-from qiskit.optimization.algorithms import CobylaOptimizer
+from qiskit.optimization.algorithms import CobylaOptimizer, SlsqpOptimizer
 from qiskit.optimization.algorithms.admm_optimizer import ADMMOptimizer, ADMMParameters, \
     ADMMOptimizationResult, ADMMState
-from qiskit.optimization.problems import QuadraticProgram
+from qiskit.optimization.problems import QuadraticProgram, Variable
 
 
 class TestADMMOptimizer(QiskitOptimizationTestCase):
@@ -334,6 +334,74 @@ class TestADMMOptimizer(QiskitOptimizationTestCase):
         self.assertIsNotNone(solution.state)
         self.assertIsInstance(solution.state, ADMMState)
 
+    def test_sub_problems_updated_in_place(self):
+        """Tests the sub-problems updated in place against the ones built from scratch"""
+        mdl = Model('ex6')
+
+        # pylint:disable=invalid-name
+        v = mdl.binary_var(name='v')
+        w = mdl.binary_var(name='w')
+        t = mdl.binary_var(name='t')
+        u = mdl.continuous_var(name='u')
+
+        mdl.minimize(v + w + t + 5 * (u - 2) ** 2)
+        mdl.add_constraint(v + 2 * w + t + u <= 3, "cons1")
+        mdl.add_constraint(v + w + t >= 1, "cons2")
+        mdl.add_constraint(v + w == 1, "cons3")
+
+        op = QuadraticProgram()
+        op.from_docplex(mdl)
+
+        admm_params = ADMMParameters(
+            rho_initial=1001, beta=1000, factor_c=900,
+            maxiter=3, three_block=True, tol=1.e-6
+        )
+
+        solver = ADMMOptimizer(params=admm_params)
+        state = solver.solve(op).state
+        # pylint:disable=protected-access
+        solver._update_step1_problem(state.op1)
+        solver._update_step2_problem(state.op2)
+
+        # the step 1 problem built from the current iterates
+        binary_size = len(state.step1_absolute_indices)
+        op1 = QuadraticProgram()
+        for index in state.step1_absolute_indices:
+            op1.binary_var(name=state.op.variables[index].name)
+        op1.objective.quadratic = state.q0 + \
+            admm_params.factor_c / 2 * np.dot(state.a0.transpose(), state.a0) + \
+            state.rho / 2 * np.eye(binary_size)
+        op1.objective.linear = state.c0 - admm_params.factor_c * np.dot(state.b0, state.a0) + \
+            state.rho * (- state.y[state.step1_relative_indices] -
+                         state.z[state.step1_relative_indices]) + \
+            state.lambda_mult[state.step1_relative_indices]
+        self.assertEqual(state.op1.export_as_lp_string(), op1.export_as_lp_string())
+
+        # the step 2 problem built from the current iterates
+        op2 = QuadraticProgram()
+        op2.from_docplex(mdl)
+        for i, index in enumerate(state.binary_indices):
+            variable = op2.variables[index]
+            variable.vartype = Variable.Type.CONTINUOUS
+            variable.upperbound = 1.
+            variable.lowerbound = 0.
+            op2.objective.quadratic[index, index] = state.rho / 2
+            op2.objective.linear[index] = \
+                -1 * state.lambda_mult[i] - state.rho * (state.x0[i] - state.y[i])
+        for constraint in state.binary_equality_constraints:
+            op2.remove_linear_constraint(constraint.name)
+        self.assertEqual(state.op2.export_as_lp_string(), op2.export_as_lp_string())
+
+        # the step 3 problem solved by the continuous optimizer
+        op3 = QuadraticProgram()
+        for index in state.binary_indices:
+            op3.continuous_var(lowerbound=-np.inf, upperbound=np.inf,
+                               name=state.op.variables[index].name)
+        op3.objective.quadratic = (admm_params.beta + state.rho) / 2 * \
+            np.eye(len(state.binary_indices))
+        op3.objective.linear = - state.lambda_mult - state.rho * (state.x0 - state.z)
+        np.testing.assert_almost_equal(solver._update_y(), SlsqpOptimizer().solve(op3).x, 5)
+
     def test_admm_setters_getters(self):
         """Tests get/set properties of ADMMOptimizer"""
         optimizer = ADMMOptimizer()
@@ -18,11 +18,14 @@ from test.optimization import QiskitOptimizationTestCase
 import numpy as np
 from ddt import ddt, idata, unpack
 from qiskit import BasicAer
+from qiskit.circuit import ParameterVector
+from qiskit.quantum_info import Statevector
 
 from qiskit.optimization.applications.ising import max_cut
 from qiskit.optimization.applications.ising.common import sample_most_likely
 from qiskit.aqua.components.optimizers import COBYLA
 from qiskit.aqua.algorithms import QAOA
+from qiskit.aqua.algorithms.minimum_eigen_solvers.qaoa.var_form import QAOAVarForm
 from qiskit.aqua import QuantumInstance, aqua_globals
 from qiskit.aqua.operators import X, I
 
@@ -126,6 +129,21 @@ class TestQAOA(QiskitOptimizationTestCase):
         with self.subTest(msg='QAOA 6x6'):
             self.assertIn(''.join([str(int(i)) for i in graph_solution]), {'010101', '101010'})
 
+    def test_diagonal_cost_circuit(self):
+        """ QAOA diagonal cost circuit test """
+        qubit_op, _ = max_cut.get_operator(W2)
+        var_form = QAOAVarForm(qubit_op.to_opflow(), 2)
+        angles = [0.3, -0.2, 0.7, 0.1]
+
+        circuit = var_form.construct_circuit(angles)
+        expected = var_form._construct_evolved_circuit(angles)
+        self.assertTrue(Statevector.from_instruction(circuit).equiv(
+            Statevector.from_instruction(expected)))
+
+        # the template is reused for other parameters
+        params = ParameterVector('θ', 4)
+        self.assertEqual(var_form.construct_circuit(params).parameters, set(params))
+
     @idata([
         [W2, S2, None],
         [W2, S2, [0.0, 0.0]],
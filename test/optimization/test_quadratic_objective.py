@@ -16,6 +16,7 @@ import unittest
 from test.optimization.optimization_test_case import QiskitOptimizationTestCase
 
 import numpy as np
+from scipy.sparse import csr_matrix
 
 from qiskit.optimization.problems import QuadraticProgram, QuadraticObjective
 
@@ -97,6 +98,26 @@ class TestQuadraticObjective(QiskitOptimizationTestCase):
         quadratic_program.objective.sense = quadratic_program.objective.Sense.MINIMIZE
         self.assertEqual(quadratic_program.objective.sense, QuadraticObjective.Sense.MINIMIZE)
 
+    def test_evaluate_batch(self):
+        """ test evaluate batch. """
+
+        quadratic_program = QuadraticProgram()
+        for _ in range(5):
+            quadratic_program.binary_var()
+
+        lst = [[0 for _ in range(5)] for _ in range(5)]
+        for i, v in enumerate(lst):
+            for j, _ in enumerate(v):
+                lst[min(i, j)][max(i, j)] += i * j
+        quadratic_program.minimize(constant=1.0, linear=np.array(range(5)), quadratic=lst)
+
+        values = np.array([[int(bit) for bit in '{:05b}'.format(i)] for i in range(32)])
+        batch = quadratic_program.objective.evaluate_batch(values)
+        np.testing.assert_almost_equal(batch,
+                                       [quadratic_program.objective.evaluate(x) for x in values])
+        np.testing.assert_almost_equal(
+            quadratic_program.objective.evaluate_batch(csr_matrix(values)), batch)
+
 
 if __name__ == '__main__':
     unittest.main()